@@ -0,0 +1,71 @@
+import os
+import time
+import argparse
+
+# Pas de vraie fenêtre nécessaire pour mesurer les temps de chargement
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from functions.get_os_adapted_path import get_os_adapted_path
+from functions.raw_surface_cache import load_raw_surface, save_raw_surface, release_raw_surface
+
+# Compare le décodage PNG + convert_alpha() au chargement depuis le cache brut,
+# puis le chargement quand seule la date de la source a changé.
+# Usage : python benchmark_raw_cache.py [--runs 5]
+
+
+def measure(function, runs):
+    """Retourne le meilleur temps d'exécution en millisecondes"""
+    best = None
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        function()
+        elapsed = (time.perf_counter() - start_time) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark du cache brut face au décodage PNG")
+    parser.add_argument("--runs", type=int, default=5)
+    arguments = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    for file in ["mapFloor.png", "mapArbres.png"]:
+        path = get_os_adapted_path("imagesOfMaps", file)
+        converted = pygame.image.load(path).convert_alpha()
+        save_raw_surface(path, converted)
+        # Un blit complet force la lecture de tous les pixels (mmap est paresseux)
+        target = pygame.Surface(converted.get_size(), pygame.SRCALPHA)
+
+        def load_png():
+            target.blit(pygame.image.load(path).convert_alpha(), (0, 0))
+
+        def load_raw():
+            target.blit(load_raw_surface(path), (0, 0))
+            release_raw_surface(path)
+
+        png_time = measure(load_png, arguments.runs)
+        raw_time = measure(load_raw, arguments.runs)
+        print(f"{file} {converted.get_size()} : PNG {png_time:.1f} ms, "
+              f"cache brut {raw_time:.1f} ms (x{png_time / max(raw_time, 0.001):.1f})")
+
+        # Source touchée sans changer son contenu (copie, checkout git) :
+        # l'empreinte n'est recalculée qu'au premier chargement
+        source_stat = os.stat(path)
+        os.utime(path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns + 10 ** 9))
+        try:
+            touched_time = measure(load_raw, 1)
+            next_time = measure(load_raw, arguments.runs)
+        finally:
+            os.utime(path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        print(f"  source touchée : premier chargement {touched_time:.1f} ms "
+              f"(empreinte), suivants {next_time:.1f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import os
+import sys
+import time
+import argparse
+
+# Pas de vraie fenêtre nécessaire pour mesurer le dessin et update()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+from settings.settings import *
+from functions.get_os_adapted_path import get_os_adapted_path
+from classes.asset_loader import asset_loader, get_preload_paths, get_map_manifest
+from classes.level import Level
+
+# Mesure le coût par frame du vrai niveau : YsortCameraGroup.custom_draw
+# (dont le tri des tuiles visibles par TileStore.sprites_in_rect) et
+# update(), pendant que le joueur traverse la carte. Dessin et update()
+# sont chronométrés séparément, avant et après.
+# Avant : les tuiles étaient des sprites du groupe de la caméra, mises à
+# jour, triées et dessinées chaque frame. Ce stockage est reconstruit à
+# partir du TileStore pour comparer sur la même carte.
+# Usage : python benchmark_sprite_update.py [--frames 300] [--enemies 10]
+
+
+class LegacyTile(pygame.sprite.Sprite):
+    """Ancienne tuile : un sprite du groupe de la caméra"""
+
+    def __init__(self, tile, groups):
+        super().__init__(groups)
+        self.image = tile.image
+        self.rect = tile.rect
+
+
+def load_level():
+    """Charge le niveau comme main.py, sans écran de chargement"""
+    obstacle_path = get_os_adapted_path("imagesOfMaps", "mapArbres.png")
+    asset_loader.start(get_preload_paths(), obstacle_path)
+    while not asset_loader.done():
+        time.sleep(0.05)
+    asset_loader.finish()
+    return Level()
+
+
+def walk(frames):
+    """Positions du joueur : une diagonale à travers la carte"""
+    start_x, start_y = PLAYER_START_POSITION[0]
+    for frame in range(frames):
+        yield start_x + frame * 4, start_y + frame * 3
+
+
+def measure(level, frames, draw, update):
+    """Retourne les temps moyens par frame (ms) : draw(), sprites_in_rect, update()"""
+    camera = level.visible_sprites
+    draw_time = cull_time = update_time = 0.0
+    for position in walk(frames):
+        level.player.hitbox.center = position
+        level.player.rect.center = position
+
+        start_time = time.perf_counter()
+        view_rect = pygame.Rect(
+            (position[0] - camera.internal_surface_size[0] // 2,
+             position[1] - camera.internal_surface_size[1] // 2),
+            camera.internal_surface_size)
+        level.obstacle_sprites.sprites_in_rect(view_rect)
+        cull_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        draw(level.player)
+        draw_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        update(level.player)
+        update_time += time.perf_counter() - start_time
+    return (draw_time * 1000 / frames, cull_time * 1000 / frames,
+            update_time * 1000 / frames)
+
+
+def camera_update(camera):
+    """update() actuel : seuls les sprites dynamiques du groupe de la caméra"""
+    def update(player):
+        camera.update()
+        camera.enemy_update(player)
+    return update
+
+
+def legacy_update(camera, legacy_group):
+    """Ancien update() : les tuiles faisaient partie du groupe mis à jour"""
+    def update(player):
+        legacy_group.update()
+        camera.update()
+        camera.enemy_update(player)
+    return update
+
+
+def legacy_draw(camera, legacy_group):
+    """Ancien custom_draw : toutes les tuiles triées et dessinées chaque frame"""
+    def draw(player):
+        camera.offset.x = player.rect.centerx - camera.internal_surface_size[0] // 2
+        camera.offset.y = player.rect.centery - camera.internal_surface_size[1] // 2
+        camera.internal_surface.fill((0, 0, 0, 0))
+        camera.internal_surface.blit(camera.floor_surface,
+                                     camera.floor_rect.topleft - camera.offset)
+        sprites = legacy_group.sprites() + camera.sprites()
+        for sprite in sorted(sprites, key=lambda sprite: sprite.rect.centery):
+            camera.internal_surface.blit(sprite.image, sprite.rect.topleft - camera.offset)
+        camera.particles.draw(camera.internal_surface, camera.offset)
+        camera.display_surface.blit(pygame.transform.scale(
+            camera.internal_surface, camera.display_surface.get_size()), (0, 0))
+    return draw
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark du dessin et de update() du vrai niveau")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--enemies", type=int, default=10)
+    arguments = parser.parse_args()
+    if PROCEDURAL_WORLD:
+        sys.exit("Benchmark prévu pour la carte dessinée (PROCEDURAL_WORLD = False)")
+    if get_map_manifest() is not None:
+        sys.exit("Benchmark prévu pour le TileStore : supprimer imagesOfMaps/chunks/ "
+                 "(la carte serait chargée par chunks)")
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    level = load_level()
+    for index in range(arguments.enemies):
+        level.spawner.acquire("ennemy1", ENNEMY_START_POSITION[
+            index % len(ENNEMY_START_POSITION)])
+
+    camera = level.visible_sprites
+    draw, cull, update = measure(level, arguments.frames, camera.custom_draw,
+                                 camera_update(camera))
+
+    legacy_group = pygame.sprite.Group()
+    for tile in level.obstacle_sprites:
+        LegacyTile(tile, [legacy_group])
+    legacy, _, legacy_update_time = measure(level, arguments.frames,
+                                            legacy_draw(camera, legacy_group),
+                                            legacy_update(camera, legacy_group))
+
+    print(f"{len(level.obstacle_sprites)} tuiles, {len(camera)} sprites dynamiques, "
+          f"{arguments.frames} frames, écran {WIDTH}x{HEIGHT}")
+    print(f"Avant (tuiles dans le groupe) : dessin {legacy:.3f} ms/frame, "
+          f"update() {legacy_update_time:.3f} ms/frame")
+    print(f"Après (TileStore)             : dessin {draw:.3f} ms/frame, "
+          f"update() {update:.3f} ms/frame "
+          f"(sprites_in_rect seul : {cull:.3f} ms)")
+    if draw > 0 and update > 0:
+        print(f"Gain : dessin x{legacy / draw:.1f}, "
+              f"update() x{legacy_update_time / update:.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import gc
+import os
+import argparse
+
+# Pas de vraie fenêtre nécessaire pour mesurer la mémoire
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from settings.settings import *
+from functions.get_os_adapted_path import get_os_adapted_path
+from functions.map_chunks import find_obstacle_tiles
+from classes.tile import TileStore
+
+# Mesure la mémoire réelle (RSS du processus) du TileStore, comparée à
+# l'image complète de la carte gardée par l'ancien stockage en subsurfaces.
+# Les pixels des surfaces sont alloués par SDL : tracemalloc ne les voit pas,
+# d'où la lecture de /proc/self/statm (Linux uniquement).
+# Usage : python benchmark_tile_memory.py [--file mapArbres.png]
+
+
+def resident_memory():
+    """Mémoire résidente du processus en octets"""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Mémoire réelle du TileStore face à l'image de la carte")
+    parser.add_argument("--file", default="mapArbres.png")
+    arguments = parser.parse_args()
+    if not os.path.exists("/proc/self/statm"):
+        print("Mesure disponible seulement sous Linux (/proc/self/statm)")
+        return
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    path = get_os_adapted_path("imagesOfMaps", arguments.file)
+    # Analyse faite avant les mesures : ses masques temporaires ne comptent pas
+    positions = find_obstacle_tiles(pygame.image.load(path), TILE_SIZE)
+    gc.collect()
+
+    start = resident_memory()
+    image = pygame.image.load(path).convert_alpha()
+    with_image = resident_memory()
+
+    store = TileStore()
+    store.set_world_size(*image.get_size())
+    for x, y in positions:
+        store.add((x, y), image.subsurface((x, y, TILE_SIZE, TILE_SIZE)))
+    size = image.get_size()
+    # Les tuiles ont leurs propres copies : l'image peut être libérée
+    del image
+    gc.collect()
+    with_store = resident_memory()
+
+    print(f"{arguments.file} {size} : {len(store)} tuiles, "
+          f"{len(store.atlas)} images uniques")
+    print(f"  image de la carte (mesuré) : {(with_image - start) / 1024:.0f} Ko")
+    print(f"  TileStore sans l'image (mesuré) : {(with_store - start) / 1024:.0f} Ko")
+    print(f"  {store.memory_estimate(size)}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
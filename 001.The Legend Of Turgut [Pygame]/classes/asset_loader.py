@@ -0,0 +1,140 @@
+import os
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from settings.settings import *
+from functions.get_os_adapted_path import get_os_adapted_path
+from functions.map_chunks import find_obstacle_tiles, load_obstacle_manifest, load_map_manifest
+from functions.raw_surface_cache import load_raw_surface, save_raw_surface, release_raw_surface
+
+
+def decode_image(path):
+    """Décode une image : cache brut si disponible, sinon PNG (hors thread principal)"""
+    surface = load_raw_surface(path)
+    if surface is not None:
+        return surface
+    return pygame.image.load(path)
+
+
+class AssetLoader:
+    def __init__(self):
+        self.executor = None
+        self.decoded = {}  # Chemin -> future du décodage (pygame.image.load)
+        self.images = {}  # Chemin -> surface convertie (thread principal)
+        self.tasks = {}  # Nom -> future d'un calcul lancé en parallèle
+
+    @staticmethod
+    def _key(path):
+        """Clé de cache indépendante de la casse sous Windows"""
+        return os.path.normcase(os.path.normpath(path))
+
+    def start(self, paths, obstacle_path=None):
+        """Lance le décodage des images (et l'analyse de la carte) sur un pool de threads"""
+        self.executor = ThreadPoolExecutor(max_workers=LOADER_THREADS)
+        for path in paths:
+            key = self._key(path)
+            if key not in self.decoded and key not in self.images:
+                self.decoded[key] = self.executor.submit(decode_image, path)
+
+        # Analyse inutile si le manifeste de preprocess_map.py est à jour
+        if obstacle_path is not None and load_obstacle_manifest(
+                get_os_adapted_path("imagesOfMaps", MAP_CHUNKS_FOLDER),
+                obstacle_path, TILE_SIZE) is None:
+            obstacle_future = self.decoded.get(self._key(obstacle_path))
+            if obstacle_future is not None:
+                # L'analyse attend le décodage de la carte puis tourne en parallèle
+                self.tasks["obstacle_tiles"] = self.executor.submit(
+                    lambda: find_obstacle_tiles(obstacle_future.result(), TILE_SIZE))
+
+    def progress(self):
+        """Retourne la part des tâches terminées, entre 0 et 1"""
+        futures = list(self.decoded.values()) + list(self.tasks.values())
+        if not futures:
+            return 1.0
+        return sum(future.done() for future in futures) / len(futures)
+
+    def done(self):
+        return self.progress() >= 1.0
+
+    def finish(self):
+        """Convertit toutes les images décodées (doit tourner sur le thread principal)"""
+        for key, future in self.decoded.items():
+            try:
+                self.images[key] = self._convert(key, future.result())
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Impossible de précharger {key} : {e}")
+        self.decoded = {}
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def _convert(self, path, surface):
+        """Convertit une surface au format de l'écran et alimente le cache brut"""
+        display_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        if surface.get_masks() == display_masks and surface.get_bitsize() == 32:
+            # Déjà au format de l'écran (lue depuis le cache brut)
+            return surface
+        surface = surface.convert_alpha()
+        if surface.get_width() * surface.get_height() >= RAW_CACHE_MIN_PIXELS:
+            try:
+                save_raw_surface(path, surface)
+            except (OSError, pygame.error, ValueError) as e:
+                print(f"Impossible d'écrire le cache de {path} : {e}")
+        return surface
+
+    def result(self, name):
+        """Retourne le résultat d'une tâche parallèle, ou None si elle n'existe pas"""
+        future = self.tasks.pop(name, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"La tâche {name} a échoué : {e}")
+            return None
+
+    def release(self, path):
+        """Oublie une image qui n'est plus utile (ex. : carte découpée en tuiles)"""
+        key = self._key(path)
+        self.images.pop(key, None)
+        self.decoded.pop(key, None)
+        release_raw_surface(path)
+
+    def image(self, path):
+        """Retourne une image convertie, en la chargeant si elle n'a pas été préchargée"""
+        key = self._key(path)
+        if key not in self.images:
+            future = self.decoded.pop(key, None)
+            surface = future.result() if future is not None else decode_image(path)
+            self.images[key] = self._convert(path, surface)
+        return self.images[key]
+
+
+def get_map_manifest():
+    """
+    Retourne le manifeste de preprocess_map.py s'il est à jour pour le sol
+    et les obstacles : la carte est alors chargée par chunks (ChunkedMap)
+    et ses images complètes ne sont jamais décodées. Sinon None.
+    """
+    return load_map_manifest(
+        get_os_adapted_path("imagesOfMaps", MAP_CHUNKS_FOLDER),
+        get_os_adapted_path("imagesOfMaps", "mapFloor.png"),
+        get_os_adapted_path("imagesOfMaps", "mapArbres.png"), TILE_SIZE)
+
+
+def get_preload_paths():
+    """Liste les images du jeu à décoder pendant l'écran de chargement"""
+    # Le monde procédural et la carte par chunks n'utilisent pas les images complètes
+    map_files = [] if PROCEDURAL_WORLD or get_map_manifest() is not None else PRELOAD_FILES
+    paths = [get_os_adapted_path(folder, file) for folder, file in map_files]
+    for folder in PRELOAD_FOLDERS:
+        try:
+            files = sorted(os.listdir(get_os_adapted_path(folder, "")))
+        except OSError:
+            continue
+        paths.extend(get_os_adapted_path(folder, file) for file in files
+                     if file.endswith(".png") and file not in PRELOAD_EXCLUDE)
+    return paths
+
+
+# Instance partagée par toutes les classes du jeu
+asset_loader = AssetLoader()
@@ -0,0 +1,71 @@
+import pygame
+from settings.settings import *
+
+
+class AudioManager:
+    def __init__(self, enabled=SOUND_ENABLED):
+        """Initialise le mixer et réserve un groupe fixe de canaux"""
+        self.enabled = enabled
+        self.sounds = {}  # Cache chemin -> pygame.mixer.Sound (décodé une fois)
+        self.playing = {}  # Cache chemin -> canaux qui jouent ce son
+        self.channels = []
+
+        if not self.enabled:
+            # Ferme le mixer démarré par pygame.init() sur le pilote factice
+            if pygame.mixer.get_init():
+                pygame.mixer.quit()
+            return
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            # Les canaux réservés ne sont jamais pris par find_channel()
+            if pygame.mixer.get_num_channels() < AUDIO_CHANNELS:
+                pygame.mixer.set_num_channels(AUDIO_CHANNELS)
+            pygame.mixer.set_reserved(AUDIO_CHANNELS)
+            self.channels = [pygame.mixer.Channel(i)
+                             for i in range(AUDIO_CHANNELS)]
+        except pygame.error as e:
+            print(f"Audio désactivé : {e}")
+            self.enabled = False
+
+    def load(self, path):
+        """Décode un son une seule fois et le garde en cache"""
+        if not self.enabled:
+            return None
+        if path not in self.sounds:
+            try:
+                sound = pygame.mixer.Sound(path)
+                sound.set_volume(SOUND_VOLUME)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Impossible de charger le son {path} : {e}")
+                sound = None
+            self.sounds[path] = sound
+            self.playing[path] = []
+        return self.sounds[path]
+
+    def play(self, path):
+        """Joue un son sur un canal libre du groupe, dans la limite de AUDIO_MAX_SAME_SOUND"""
+        sound = self.load(path)
+        if sound is None:
+            return None
+
+        # Ne garder que les canaux qui jouent encore ce son
+        active = [channel for channel in self.playing[path]
+                  if channel.get_busy() and channel.get_sound() is sound]
+        self.playing[path] = active
+        if len(active) >= AUDIO_MAX_SAME_SOUND:
+            return None
+
+        for channel in self.channels:
+            if not channel.get_busy():
+                channel.play(sound)
+                active.append(channel)
+                return channel
+        # Tous les canaux sont occupés : on abandonne plutôt que de bloquer
+        return None
+
+    def stop(self):
+        """Arrête tous les sons du groupe de canaux"""
+        for channel in self.channels:
+            channel.stop()
@@ -4,26 +4,53 @@ import os
 from settings.settings import *
 from classes.level import *
 from classes.player import *
-from classes.tile import Tile
+from classes.tile import TileStore
+from classes.particles import ParticleSystem
+from classes.asset_loader import asset_loader
 from functions.get_os_adapted_path import get_os_adapted_path
 
 
 class YsortCameraGroup(pygame.sprite.Group):
-    def __init__(self):
+    def __init__(self, static_sprites=None, particles=None):
+        """
+        Groupe des sprites dynamiques (mis à jour chaque frame).
+        static_sprites est le TileStore des tuiles qui sont seulement
+        dessinées : elles sont fusionnées avec ce groupe au moment du dessin.
+        particles est dessiné par-dessus les sprites, avant le zoom.
+        """
         super().__init__()
+        self.static_sprites = static_sprites if static_sprites is not None \
+            else TileStore()
+        self.particles = particles if particles is not None \
+            else ParticleSystem()
         self.display_surface = pygame.display.get_surface()
         self.half_width = self.display_surface.get_size()[0] // 2
         self.half_height = self.display_surface.get_size()[1] // 2
         self.offset = pygame.math.Vector2()
         self.zoom_scale = 4  # Facteur de zoom (x4)
 
-        # Chargement du floor avec vérification
+        # Monde procédural ou carte par chunks : le sol est dessiné chunk par
+        # chunk par static_sprites. Seul le TileStore demande l'image complète
+        self.floor_surface = None
+        if isinstance(self.static_sprites, TileStore):
+            self.load_floor()
+
+        # Créer une surface pour le zoom
+        self.internal_surface_size = (self.display_surface.get_size()[0] // self.zoom_scale,
+                                      self.display_surface.get_size()[1] // self.zoom_scale)
+        self.internal_surface = pygame.Surface(
+            self.internal_surface_size, pygame.SRCALPHA)
+        self.internal_rect = self.internal_surface.get_rect(
+            center=(self.half_width, self.half_height))
+
+    def load_floor(self):
+        """Chargement du floor avec vérification"""
         try:
             floor_path = get_os_adapted_path("imagesOfMaps", "mapFloor.png")
             if not os.path.isfile(floor_path):
                 raise FileNotFoundError(f"Fichier introuvable : {floor_path}")
 
-            self.floor_surface = pygame.image.load(floor_path).convert_alpha()
+            self.floor_surface = asset_loader.image(floor_path)
             self.floor_rect = self.floor_surface.get_rect(topleft=(0, 0))
 
         except Exception as e:
@@ -31,14 +58,6 @@ class YsortCameraGroup(pygame.sprite.Group):
             pygame.quit()
             sys.exit("Arrêt du programme : image essentielle manquante.")
 
-        # Créer une surface pour le zoom
-        self.internal_surface_size = (self.display_surface.get_size()[0] // self.zoom_scale,
-                                      self.display_surface.get_size()[1] // self.zoom_scale)
-        self.internal_surface = pygame.Surface(
-            self.internal_surface_size, pygame.SRCALPHA)
-        self.internal_rect = self.internal_surface.get_rect(
-            center=(self.half_width, self.half_height))
-
     def custom_draw(self, player):
         self.offset.x = player.rect.centerx - \
             self.internal_surface_size[0] // 2
@@ -49,18 +68,36 @@ class YsortCameraGroup(pygame.sprite.Group):
         self.internal_surface.fill((0, 0, 0, 0))
 
         # Dessiner le sol sur la surface interne
-        floor_offset = self.floor_rect.topleft - self.offset
-        self.internal_surface.blit(self.floor_surface, floor_offset)
+        if self.floor_surface is None:
+            self.static_sprites.draw_floor(self.internal_surface, self.offset)
+        else:
+            floor_offset = self.floor_rect.topleft - self.offset
+            self.internal_surface.blit(self.floor_surface, floor_offset)
         # Ajuster la position du sol pour qu'il soit centré
 
         # Dessiner le sol à la position correcte
 
+        # Sprites statiques visibles à l'écran + sprites dynamiques
+        view_rect = pygame.Rect(self.offset, self.internal_surface_size)
+        sprites = self.static_sprites.sprites_in_rect(view_rect)
+        sprites.extend(self.sprites())
+
         # Dessiner tous les sprites sur la surface interne (avec zoom)
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
+        for sprite in sorted(sprites, key=lambda sprite: sprite.rect.centery):
             offset_pos = sprite.rect.topleft - self.offset
             self.internal_surface.blit(sprite.image, offset_pos)
 
+        # Toutes les particules en un seul appel
+        self.particles.draw(self.internal_surface, self.offset)
+
         # Redimensionner la surface interne vers la surface d'affichage
         zoomed_surface = pygame.transform.scale(self.internal_surface,
                                                 self.display_surface.get_size())
         self.display_surface.blit(zoomed_surface, (0, 0))
+
+    def enemy_update(self, player):
+        """Met à jour les ennemis en leur transmettant le joueur"""
+        enemy_sprites = [sprite for sprite in self.sprites()
+                         if getattr(sprite, "sprite_type", None) == "enemy"]
+        for enemy in enemy_sprites:
+            enemy.enemy_update(player)
@@ -0,0 +1,102 @@
+import os
+import pygame
+from settings.settings import *
+from classes.tile import Tile
+from classes.world import ChunkCache
+
+
+class MapChunk:
+    """Un chunk de la carte dessinée : images du sol et des obstacles (ou None)"""
+    __slots__ = ("floor_surface", "obstacle_surface", "tiles")
+
+    def __init__(self, floor_surface, obstacle_surface):
+        self.floor_surface = floor_surface
+        self.obstacle_surface = obstacle_surface
+        self.tiles = {}  # (x, y) -> image de la tuile (subsurface, créée au besoin)
+
+
+class ChunkedMap(ChunkCache):
+    """
+    Carte dessinée découpée par preprocess_map.py, chargée par chunks.
+
+    Remplace le TileStore quand le manifeste est à jour : les images
+    complètes de la carte ne sont jamais décodées, seuls les chunks du sol
+    et des obstacles proches des joueurs le sont (voir ChunkCache.update).
+    Les collisions utilisent les positions des obstacles du manifeste,
+    connues pour toute la carte : un ennemi loin du joueur est bloqué par
+    les arbres même si leur chunk n'est pas chargé.
+    """
+
+    def __init__(self, manifest, chunks_dir, sprite_type="obstacle"):
+        super().__init__(manifest["chunk_size"])
+        self.sprite_type = sprite_type
+        self.chunks_dir = chunks_dir
+        width, height = manifest["world_size"]
+        self.columns = -(-width // TILE_SIZE)
+        self.rows = -(-height // TILE_SIZE)
+        # Grille des obstacles de toute la carte : 1 octet par case
+        self.grid = bytearray(self.columns * self.rows)
+        self.obstacle_count = 0
+        self.files = {}  # (chunk_x, chunk_y) -> (image du sol, image des obstacles)
+        for chunk in manifest["chunks"]:
+            self.files[(chunk["column"], chunk["row"])] = (chunk["floor"], chunk["obstacles"])
+            for x, y in chunk["obstacle_tiles"]:
+                self.grid[(y // TILE_SIZE) * self.columns + x // TILE_SIZE] = 1
+                self.obstacle_count += 1
+        # Image d'un obstacle dont le chunk n'est pas chargé (seule la hitbox sert)
+        self.placeholder = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+
+    def load_image(self, name):
+        """Décode une image de chunk, ou None si le chunk n'en a pas"""
+        if name is None:
+            return None
+        try:
+            surface = pygame.image.load(os.path.join(self.chunks_dir, name))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Impossible de charger le chunk {name} : {e}")
+            return None
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def generate(self, chunk_x, chunk_y):
+        """Charge les images d'un chunk (aucune en dehors de la carte)"""
+        floor_name, obstacles_name = self.files.get((chunk_x, chunk_y), (None, None))
+        return MapChunk(self.load_image(floor_name), self.load_image(obstacles_name))
+
+    def get_tile(self, x, y):
+        """Retourne la vue Tile de l'obstacle de la case (x, y)"""
+        chunk_x, chunk_y = x // self.chunk_size, y // self.chunk_size
+        chunk = self.chunks.get((chunk_x, chunk_y))
+        image = self.placeholder
+        if chunk is not None and chunk.obstacle_surface is not None:
+            image = chunk.tiles.get((x, y))
+            if image is None:
+                image = chunk.obstacle_surface.subsurface(
+                    (x - chunk_x * self.chunk_size, y - chunk_y * self.chunk_size,
+                     TILE_SIZE, TILE_SIZE))
+                chunk.tiles[(x, y)] = image
+        return Tile((x, y), self.sprite_type, image)
+
+    def sprites_in_rect(self, rect):
+        """Retourne les obstacles dont la case recoupe rect (lecture directe dans la grille)"""
+        left = max(rect.left // TILE_SIZE, 0)
+        right = min((rect.right - 1) // TILE_SIZE, self.columns - 1)
+        top = max(rect.top // TILE_SIZE, 0)
+        bottom = min((rect.bottom - 1) // TILE_SIZE, self.rows - 1)
+        tiles = []
+        for row in range(top, bottom + 1):
+            row_start = row * self.columns
+            for column in range(left, right + 1):
+                if self.grid[row_start + column]:
+                    tiles.append(self.get_tile(column * TILE_SIZE, row * TILE_SIZE))
+        return tiles
+
+    def __len__(self):
+        return self.obstacle_count
+
+    def __iter__(self):
+        for index, obstacle in enumerate(self.grid):
+            if obstacle:
+                row, column = divmod(index, self.columns)
+                yield self.get_tile(column * TILE_SIZE, row * TILE_SIZE)
@@ -2,20 +2,38 @@ import pygame
 import random
 from settings.settings import *
 from classes.entity import Entity
+from classes.asset_loader import asset_loader
+from classes.replay import game_clock
 from functions.get_os_adapted_path import get_os_adapted_path
 
 
 class Enemy(Entity):
-    def __init__(self, pos, groups, obstacle_sprites):
+    def __init__(self, pos, groups, obstacle_sprites, audio=None, enemy_name="ennemy1", grid=None):
         super().__init__(groups)
         self.sprite_type = "enemy"
         self.obstacle_sprites = obstacle_sprites  # Ajout des obstacles
 
+        # Caractéristiques issues de ENNEMY_DATA
+        self.enemy_name = enemy_name
+        enemy_info = ENNEMY_DATA[enemy_name]
+        self.attack_radius = enemy_info["attack_radius"]
+        self.attack_sound = enemy_info["attack_sound"]
+        self.health = enemy_info["health"]
+        self.resistance = enemy_info["resistance"]
+        self.audio = audio  # Gestionnaire audio partagé (sons déjà décodés)
+        self.can_attack = True
+        self.attack_time = None
+
         # Initialisation de l'image et de la position
         self.image = self.get_initial_image()
         self.rect = self.image.get_rect(topleft=pos)
         # Ajout d'une hitbox plus précise
         self.hitbox = self.rect.inflate(0, -10)
+        self.mask = pygame.mask.from_surface(self.image)
+        # Grille spatiale partagée utilisée pour la détection des coups
+        self.grid = grid
+        if self.grid is not None:
+            self.grid.insert(self)
 
         # Paramètres de mouvement
         self.speed = 4
@@ -30,14 +48,33 @@ class Enemy(Entity):
         self.frame_index = 0
         self.animation_speed = 0.15
 
+    def reset(self, pos):
+        """Remet à neuf un ennemi mort pour le réutiliser (pool du spawner)"""
+        self.health = ENNEMY_DATA[self.enemy_name]["health"]
+        self.can_attack = True
+        self.attack_time = None
+        self.status = "idle"
+        self.frame_index = 0
+        self.direction = pygame.math.Vector2()
+        self.random_move_timer = 0
+        self.move_duration = 0
+        self.current_direction = "idle"
+
+        self.image = self.animations["idle"][0]
+        self.mask = self.animation_masks["idle"][0]
+        self.rect = self.image.get_rect(topleft=pos)
+        self.hitbox = self.rect.inflate(0, -10)
+        if self.grid is not None:
+            self.grid.insert(self)
+
     def get_initial_image(self):
         """Retourne l'image initiale de l'ennemi"""
         enemy_path = get_os_adapted_path("imagesOfEnnemies", "20.png")
-        return pygame.image.load(enemy_path).convert_alpha()
+        return asset_loader.image(enemy_path)
 
     def collision(self, direction):
         if direction == "horizontal":
-            for sprite in self.obstacle_sprites:
+            for sprite in self.obstacle_sprites.sprites_in_rect(self.hitbox):
                 if sprite.hitbox.colliderect(self.hitbox):
                     if self.direction.x > 0:  # Moving right
                         self.hitbox.right = sprite.hitbox.left
@@ -46,7 +83,7 @@ class Enemy(Entity):
                     self.rect.centerx = self.hitbox.centerx
 
         if direction == "vertical":
-            for sprite in self.obstacle_sprites:
+            for sprite in self.obstacle_sprites.sprites_in_rect(self.hitbox):
                 if sprite.hitbox.colliderect(self.hitbox):
                     if self.direction.y > 0:  # Moving down
                         self.hitbox.bottom = sprite.hitbox.top
@@ -78,9 +115,12 @@ class Enemy(Entity):
         }
 
         self.animations = {}
+        self.animation_masks = {}  # Masques précalculés pour chaque image
         for status, paths in enemy_assets.items():
-            self.animations[status] = [pygame.image.load(
-                path).convert_alpha() for path in paths]
+            self.animations[status] = [asset_loader.image(
+                path) for path in paths]
+            self.animation_masks[status] = [pygame.mask.from_surface(
+                image) for image in self.animations[status]]
 
     def get_random_direction(self):
         """Génère une direction aléatoire"""
@@ -106,7 +146,8 @@ class Enemy(Entity):
 
     def animate(self):
         """Gère l'animation de l'ennemi"""
-        animation = self.animations.get(self.status, self.animations["idle"])
+        status = self.status if self.status in self.animations else "idle"
+        animation = self.animations[status]
 
         # Incrémentation de l'index d'animation
         self.frame_index += self.animation_speed
@@ -115,6 +156,7 @@ class Enemy(Entity):
 
         # Mise à jour de l'image
         self.image = animation[int(self.frame_index)]
+        self.mask = self.animation_masks[status][int(self.frame_index)]
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def move(self, speed):
@@ -174,13 +216,50 @@ class Enemy(Entity):
         future_pos.x += self.direction.x * check_distance
         future_pos.y += self.direction.y * check_distance
 
-        for sprite in self.obstacle_sprites:
+        for sprite in self.obstacle_sprites.sprites_in_rect(future_pos):
             if sprite.hitbox.colliderect(future_pos):
                 return True
         return False
 
+    def cooldowns(self):
+        """Gestion du cooldown des attaques de l'ennemi"""
+        if not self.can_attack:
+            current_time = game_clock.get_ticks()
+            if current_time - self.attack_time >= ENNEMY_ATTACK_COOLDOWN:
+                self.can_attack = True
+
+    def attack(self, player):
+        """Attaque le joueur s'il est à portée et joue le son d'attaque"""
+        distance = (pygame.math.Vector2(player.rect.center) -
+                    pygame.math.Vector2(self.rect.center)).magnitude()
+        if self.can_attack and distance <= self.attack_radius:
+            self.can_attack = False
+            self.attack_time = game_clock.get_ticks()
+            if self.audio:
+                self.audio.play(self.attack_sound)
+
+    def get_damage(self, damage):
+        """Applique les dégâts d'une arme en tenant compte de la résistance"""
+        self.health -= damage / self.resistance
+
+    def check_death(self):
+        """Supprime l'ennemi s'il n'a plus de vie et retourne True"""
+        if self.health <= 0:
+            if self.grid is not None:
+                self.grid.remove(self)
+            self.kill()
+            return True
+        return False
+
+    def enemy_update(self, player):
+        """Mise à jour de l'ennemi qui dépend du joueur"""
+        self.cooldowns()
+        self.attack(player)
+
     def update(self, player=None):
         """Mise à jour de l'ennemi"""
         self.update_random_movement()
         self.move(self.speed)
         self.animate()
+        if self.grid is not None:
+            self.grid.move(self)
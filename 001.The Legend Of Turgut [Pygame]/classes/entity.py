@@ -23,7 +23,7 @@ class Entity(pygame.sprite.Sprite):
 
     def collision(self, direction):
         """Vérification des collisions du joueur."""
-        for sprite in self.obstacle_sprites:
+        for sprite in self.obstacle_sprites.sprites_in_rect(self.hitbox):
             if hasattr(sprite, "hitbox") and sprite.hitbox.colliderect(self.hitbox):
                 if direction == "horizontal":
                     if self.direction.x > 0:  # Vers la droite
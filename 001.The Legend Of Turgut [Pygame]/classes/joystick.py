@@ -1,8 +1,7 @@
 import pygame
 import sys
 
-# Initialisation de pygame
-pygame.init()
+# Pas de pygame.init() à l'import : init_joystick() n'initialise que les manettes
 
 
 class JoystickEventHandler:
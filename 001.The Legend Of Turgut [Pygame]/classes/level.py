@@ -1,26 +1,76 @@
+import time
 import pygame
 import random
+import struct
+from collections import deque
 from settings.settings import *
 from functions.get_os_adapted_path import get_os_adapted_path
 from functions.csv_reader import import_csv_layout
-from classes.tile import Tile
+from functions.map_chunks import load_obstacle_manifest, find_obstacle_tiles
+from classes.tile import TileStore
+from classes.world import ChunkCache, ChunkedWorld
+from classes.chunked_map import ChunkedMap
+from classes.particles import ParticleSystem
 from classes.player import Player
 from classes.camera import YsortCameraGroup
 from classes.weapon import Weapon
 from classes.ui import UI  # Assuming UI is defined in classes/ui.py
+from classes.minimap import Minimap
+from classes.audio import AudioManager
+from classes.spatial_grid import SpatialGrid
+from classes.save_game import SaveManager, ENEMY_NAMES
+from classes.spawner import EnemySpawner
+from classes.replay import game_clock
 # Assuming Enemy is defined in classes/ennemy.py
 from classes.enemy import Enemy
+from classes.asset_loader import asset_loader, get_map_manifest
 
 
 class Level:
-    def __init__(self):
+    def __init__(self, input_filter=None):
         self.display_surface = pygame.display.get_surface()
-        self.visible_sprites = YsortCameraGroup()
-        self.obstacle_sprites = pygame.sprite.Group()
-        self.current_attack = None
+        # Tuiles d'obstacles : stockage compact, dessinées mais jamais mises à jour
+        self.map_manifest = None
+        if PROCEDURAL_WORLD:
+            # Monde généré par chunks autour du joueur
+            seed = random.getrandbits(32) if WORLD_SEED is None else WORLD_SEED
+            self.obstacle_sprites = ChunkedWorld(seed)
+        else:
+            # Carte découpée par preprocess_map.py : chargée par chunks autour
+            # du joueur. Sinon, les images complètes sont découpées au démarrage
+            self.map_manifest = get_map_manifest()
+            if self.map_manifest is not None:
+                self.obstacle_sprites = ChunkedMap(
+                    self.map_manifest, get_os_adapted_path("imagesOfMaps", MAP_CHUNKS_FOLDER))
+            else:
+                self.obstacle_sprites = TileStore()
+        # Chunks préparés autour des joueurs à chaque frame
+        self.streamed_world = isinstance(self.obstacle_sprites, ChunkCache)
+        # Traînées des armes et éclats des coups
+        self.particles = ParticleSystem()
+        # Joueur, ennemis et armes : mis à jour chaque frame
+        self.visible_sprites = YsortCameraGroup(
+            self.obstacle_sprites, self.particles)
+        # Ennemis pouvant être touchés et leur grille spatiale (phase large)
+        self.attackable_sprites = pygame.sprite.Group()
+        self.enemy_grid = SpatialGrid()
+        self.attacks = {}  # Joueur -> arme de l'attaque en cours
         self.player = None
+        self.players = []  # Joueur local puis joueurs ajoutés (multijoueur)
+        # Enregistreur ou replay des actions du joueur (None en jeu normal)
+        self.input_filter = input_filter
+        # Sons décodés une seule fois et partagés par tous les ennemis
+        self.audio = AudioManager()
+        # Sauvegardes rapides (F5 / F9) et automatiques
+        self.save_manager = SaveManager()
+        # Vagues d'ennemis et pool des ennemis morts
+        self.spawner = EnemySpawner(self)
+        self.frame_time = 0
         self.create_map()
         self.ui = UI()  # Initialize UI, if needed later
+        # La minicarte est construite à partir des images de la carte dessinée
+        # (ou lue telle que preprocess_map.py l'a générée)
+        self.minimap = None if PROCEDURAL_WORLD else Minimap(self.map_manifest)
 
     def create_map(self):
         # Only create the map once
@@ -28,46 +78,49 @@ class Level:
             return
         self.map_created = True
 
+        if not self.streamed_world:
+            self.load_obstacle_map()
+
+        # Place player at random position
+        random_position = random.choice(PLAYER_START_POSITION)
+        self.player = Player(
+            random_position,
+            [self.visible_sprites],
+            self.obstacle_sprites,
+            self.create_attack,
+            self.destroy_attack,
+            self.input_filter
+        )
+        self.players.append(self.player)
+        if self.streamed_world:
+            # Tous les chunks autour du départ, pendant le chargement
+            self.obstacle_sprites.update(self.player.rect.center, None)
+        # Les ennemis apparaissent par vagues (voir EnemySpawner et ENEMY_WAVES)
+
+    def load_obstacle_map(self):
+        """Découpe mapArbres.png en tuiles d'obstacles"""
         try:
             # Load obstacle image with error handling
             obstacle_path = get_os_adapted_path(
                 "imagesOfMaps", "mapArbres.png")
 
-            obstacle_image = pygame.image.load(obstacle_path).convert_alpha()
+            obstacle_image = asset_loader.image(obstacle_path)
 
             # Verify image was loaded properly
             if obstacle_image.get_size() == (0, 0):
                 raise pygame.error("Image failed to load properly")
 
-            img_width, img_height = obstacle_image.get_size()
-
-            # Process the image tiles
-            for y in range(0, img_height, TILE_SIZE):
-                for x in range(0, img_width, TILE_SIZE):
-                    try:
-                        tile_surface = obstacle_image.subsurface(
-                            (x, y, TILE_SIZE, TILE_SIZE))
-
-                        # Check for any non-transparent pixels
-                        has_obstacle = False
-                        for tx in range(TILE_SIZE):
-                            for ty in range(TILE_SIZE):
-                                if tile_surface.get_at((tx, ty))[3] > 0:
-                                    has_obstacle = True
-                                    break
-                            if has_obstacle:
-                                break
-
-                        if has_obstacle:
-                            Tile(
-                                (x, y),
-                                [self.visible_sprites, self.obstacle_sprites],
-                                'obstacle',
-                                tile_surface
-                            )
-                    except ValueError as e:
-                        print(f"Error processing tile at ({x},{y}): {e}")
-                        continue
+            self.obstacle_sprites.set_world_size(*obstacle_image.get_size())
+            for x, y in self.find_obstacle_tiles(obstacle_path, obstacle_image):
+                try:
+                    tile_surface = obstacle_image.subsurface(
+                        (x, y, TILE_SIZE, TILE_SIZE))
+                    self.obstacle_sprites.add((x, y), tile_surface)
+                except ValueError as e:
+                    print(f"Error processing tile at ({x},{y}): {e}")
+                    continue
+            # Les tuiles ont leurs propres copies : la carte complète peut être libérée
+            asset_loader.release(obstacle_path)
 
         except pygame.error as e:
             print(f"Failed to load obstacle image at {obstacle_path}: {e}")
@@ -77,43 +130,140 @@ class Level:
             print(f"Unexpected error processing map: {e}")
             self.map_created = False
 
-        # Place player at random position
-        random_position = random.choice(PLAYER_START_POSITION)
-        self.player = Player(
-            random_position,
+    def create_enemy(self, pos, enemy_name="ennemy1"):
+        """Crée un ennemi dans le niveau"""
+        return Enemy(
+            pos,
+            [self.visible_sprites, self.attackable_sprites],
+            self.obstacle_sprites,
+            self.audio,
+            enemy_name,
+            grid=self.enemy_grid
+        )
+
+    def find_obstacle_tiles(self, obstacle_path, obstacle_image):
+        """Retourne les positions des tuiles d'obstacles de la carte"""
+        # Manifeste généré par preprocess_map.py : pas d'analyse au démarrage
+        manifest = load_obstacle_manifest(
+            get_os_adapted_path("imagesOfMaps", MAP_CHUNKS_FOLDER), obstacle_path, TILE_SIZE)
+        if manifest is not None:
+            return [tuple(position)
+                    for chunk in manifest["chunks"]
+                    for position in chunk["obstacle_tiles"]]
+
+        # Analyse lancée en parallèle pendant l'écran de chargement
+        positions = asset_loader.result("obstacle_tiles")
+        if positions is not None:
+            return positions
+
+        return find_obstacle_tiles(obstacle_image, TILE_SIZE)
+
+    def add_player(self, input_filter):
+        """Ajoute un joueur supplémentaire piloté par input_filter (multijoueur)"""
+        player = Player(
+            random.choice(PLAYER_START_POSITION),
             [self.visible_sprites],
             self.obstacle_sprites,
-            self.create_attack,
-            self.destroy_attack
+            lambda: self.create_attack(player),
+            lambda: self.destroy_attack(player),
+            input_filter
         )
-        # Create enemies at random positions
-        ennemy_path = get_os_adapted_path(
-            "imagesOfennemies", "00.png")
-        ennemy_image = pygame.image.load(ennemy_path).convert_alpha()
-        # Mettre 5 ennemies
-        for _ in range(5):
-            random_position = random.choice(ENNEMY_START_POSITION)
-            Enemy(
-                random_position,
-                [self.visible_sprites],
-                self.obstacle_sprites
-            )
-        # Enemy(
-        #     random.choice(ENNEMY_START_POSITION),
-        #     [self.visible_sprites],
-        #     self.obstacle_sprites  # Ajout des obstacles
-        # )
-
-    def create_attack(self):
-        if self.current_attack is None:
-            self.current_attack = Weapon(self.player, [self.visible_sprites])
-
-    def destroy_attack(self):
-        if self.current_attack:
-            self.current_attack.kill()
-            self.current_attack = None
+        self.players.append(player)
+        return player
+
+    def remove_player(self, player):
+        """Retire un joueur ajouté par add_player"""
+        self.destroy_attack(player)
+        player.kill()
+        self.players.remove(player)
+
+    def create_attack(self, player=None):
+        if player is None:
+            player = self.player
+        if player not in self.attacks:
+            self.attacks[player] = Weapon(
+                player, [self.visible_sprites], self.particles)
+
+    def destroy_attack(self, player=None):
+        weapon = self.attacks.pop(self.player if player is None else player, None)
+        if weapon:
+            weapon.kill()
+
+    def player_attack_logic(self):
+        """Résolution des coups des armes sur les ennemis"""
+        for weapon in list(self.attacks.values()):
+            # Phase large : seulement les ennemis des cellules proches de l'arme
+            for enemy in self.enemy_grid.query(weapon.rect):
+                if enemy in weapon.hit_sprites:
+                    continue
+                # Phase fine : collision pixel par pixel avec les masques en cache
+                if pygame.sprite.collide_mask(weapon, enemy):
+                    weapon.hit_sprites.add(enemy)
+                    enemy.get_damage(weapon.weapon_data["damage"])
+                    self.particles.emit(enemy.rect.center, **PARTICLE_IMPACT)
+                    if enemy.check_death():
+                        self.spawner.release(enemy)
+                        weapon.player.kill_count += 1
+
+    def quick_save(self):
+        self.save_manager.quick_save(self)
+
+    def quick_load(self):
+        """Restaure la dernière sauvegarde rapide"""
+        try:
+            snapshot = self.save_manager.load()
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Impossible de charger la sauvegarde : {e}")
+            return
+        if snapshot is None:
+            return
+        player_record, random_state, spawner_state, enemy_records = snapshot
+        self.destroy_attack()
+
+        x, y, health, energy, kill_count, weapon_index = player_record
+        self.player.hitbox.center = (x, y)
+        self.player.rect.center = self.player.hitbox.center
+        self.player.health = health
+        self.player.energy = energy
+        self.player.kill_count = kill_count
+        self.player.weapon_index = weapon_index
+        self.player.attack_type = list(WEAPON_DATA.keys())[weapon_index]
+
+        for enemy in self.attackable_sprites.sprites():
+            self.spawner.release(enemy)
+        for type_index, x, y, health in enemy_records:
+            enemy = self.spawner.acquire(ENEMY_NAMES[type_index], (0, 0))
+            enemy.hitbox.center = (x, y)
+            enemy.rect.center = (x, y)
+            enemy.health = health
+            self.enemy_grid.move(enemy)
+
+        # Vagues : la suivante arrive avec le même délai qu'à la sauvegarde
+        wave_index, wave_delay, entity_budget, pending = spawner_state
+        self.spawner.wave_index = wave_index
+        self.spawner.next_wave_time = game_clock.get_ticks() + wave_delay
+        self.spawner.entity_budget = entity_budget
+        self.spawner.pending = deque(pending)
+
+        random.setstate(random_state)
+
+    def simulate(self):
+        """Avance le monde d'une frame sans rien dessiner (utilisé seul par le serveur)"""
+        self.spawner.update(self.frame_time)
+        if self.streamed_world:
+            for player in self.players:
+                self.obstacle_sprites.update(player.rect.center)
+        self.visible_sprites.update()
+        self.particles.update()
+        self.visible_sprites.enemy_update(self.player)
+        self.player_attack_logic()
 
     def run(self):
+        start_time = time.perf_counter()
         self.visible_sprites.custom_draw(self.player)
-        self.visible_sprites.update()
+        self.simulate()
         self.ui.display(self.player)
+        if self.minimap is not None:
+            self.minimap.display(self.player, self.attackable_sprites)
+        self.save_manager.autosave(self)
+        self.frame_time = (time.perf_counter() - start_time) * 1000
@@ -0,0 +1,79 @@
+import os
+import pygame
+from settings.settings import *
+from functions.get_os_adapted_path import get_os_adapted_path
+from functions.map_chunks import build_minimap, minimap_cache_name, minimap_size
+
+
+class Minimap:
+    def __init__(self, manifest=None):
+        """manifest : manifeste de preprocess_map.py à jour, qui fournit la minicarte"""
+        self.display_surface = pygame.display.get_surface()
+
+        # Texture du monde réduite, chargée ou générée une seule fois
+        self.texture = self.load_texture(manifest)
+
+        # Fond fixe : bordure + texture, préparé une seule fois
+        self.rect = self.texture.get_rect(
+            topright=(self.display_surface.get_width() - 20, 20))
+        border_rect = self.rect.inflate(6, 6)
+        self.background = pygame.Surface(border_rect.size)
+        self.background.fill(UI_BORDER_COLOR)
+        self.background.blit(self.texture, (3, 3))
+        self.background_pos = border_rect.topleft
+
+        # Marqueurs pré-rendus
+        self.player_marker = pygame.Surface(
+            (MINIMAP_MARKER_SIZE + 2, MINIMAP_MARKER_SIZE + 2))
+        self.player_marker.fill(MINIMAP_PLAYER_COLOR)
+        self.enemy_marker = pygame.Surface(
+            (MINIMAP_MARKER_SIZE, MINIMAP_MARKER_SIZE))
+        self.enemy_marker.fill(MINIMAP_ENEMY_COLOR)
+
+    def load_texture(self, manifest=None):
+        """Charge la minicarte du manifeste ou du cache, sinon la génère à partir des images du monde"""
+        floor_path = get_os_adapted_path("imagesOfMaps", "mapFloor.png")
+        obstacle_path = get_os_adapted_path("imagesOfMaps", "mapArbres.png")
+        cache_dir = get_os_adapted_path("imagesOfMaps", MAP_CHUNKS_FOLDER)
+        # Un fichier par échelle : changer MINIMAP_SCALE ne relit pas l'ancienne
+        cache_path = os.path.join(cache_dir, minimap_cache_name(MINIMAP_SCALE))
+
+        texture = None
+        if manifest is not None and manifest.get("minimap") == minimap_cache_name(MINIMAP_SCALE):
+            # Sources déjà vérifiées par le manifeste : pas de comparaison des dates
+            try:
+                texture = pygame.image.load(cache_path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Minicarte du manifeste illisible : {e}")
+        if texture is None and os.path.isfile(cache_path) and \
+                os.path.getmtime(cache_path) >= os.path.getmtime(floor_path) and \
+                os.path.getmtime(cache_path) >= os.path.getmtime(obstacle_path):
+            texture = pygame.image.load(cache_path)
+            # Taille attendue : le monde a pu changer de dimensions
+            if texture.get_size() != minimap_size(floor_path, MINIMAP_SCALE):
+                texture = None
+        if texture is None:
+            texture = build_minimap(floor_path, obstacle_path, MINIMAP_SCALE)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                pygame.image.save(texture, cache_path)
+            except (OSError, pygame.error) as e:
+                print(f"Impossible d'enregistrer la minicarte : {e}")
+        return texture.convert()
+
+    def to_minimap(self, world_pos, size):
+        """Convertit une position du monde en position sur la minicarte"""
+        return (self.rect.left + int(world_pos[0]) // MINIMAP_SCALE - size // 2,
+                self.rect.top + int(world_pos[1]) // MINIMAP_SCALE - size // 2)
+
+    def display(self, player, enemies):
+        self.display_surface.blit(self.background, self.background_pos)
+
+        # Tous les marqueurs sont envoyés en un seul appel à blits()
+        enemy_size = self.enemy_marker.get_width()
+        markers = [(self.enemy_marker, self.to_minimap(enemy.rect.center, enemy_size))
+                   for enemy in enemies]
+        player_size = self.player_marker.get_width()
+        markers.append((self.player_marker,
+                        self.to_minimap(player.rect.center, player_size)))
+        self.display_surface.blits(markers, doreturn=False)
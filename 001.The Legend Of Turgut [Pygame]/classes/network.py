@@ -0,0 +1,129 @@
+import zlib
+import struct
+
+# Protocole réseau du mode multijoueur (TCP, petit-boutiste).
+# Chaque message : en-tête (type, longueur) puis contenu.
+MESSAGE_HEADER = struct.Struct("<BI")
+MSG_WELCOME = 1  # Serveur -> client : numéro du joueur, fréquence du serveur
+MSG_INPUT = 2  # Client -> serveur : masque d'actions (voir classes/replay.py)
+MSG_SNAPSHOT = 3  # Serveur -> client : différences depuis le snapshot précédent
+MSG_STATS_REQUEST = 4  # Client -> serveur : demande des mesures du serveur
+MSG_STATS = 5  # Serveur -> client : mesures du serveur
+MSG_FULL = 6  # Serveur -> client : partie complète, connexion refusée
+
+# numéro du joueur, ticks par seconde, ticks entre deux snapshots
+WELCOME = struct.Struct("<BHH")
+# tick du client, masque d'actions
+INPUT = struct.Struct("<IH")
+# ticks, durée moyenne et maximale d'un tick (ms), octets envoyés par seconde, clients
+STATS = struct.Struct("<IffdH")
+
+# Snapshot : tick, tick de référence, compressé (zlib), puis le contenu :
+# nombre d'entités modifiées, nombre d'entités supprimées,
+# chaque entité modifiée (identifiant, masque des champs, champs modifiés),
+# puis les identifiants supprimés
+SNAPSHOT_HEADER = struct.Struct("<II?")
+SNAPSHOT_COUNTS = struct.Struct("<HH")
+ENTITY_HEADER = struct.Struct("<IB")
+ENTITY_ID = struct.Struct("<I")
+SNAPSHOT_COMPRESS_MIN = 256  # En dessous, la compression ne vaut pas le coût
+
+# Champs d'une entité, dans l'ordre des bits du masque
+ENTITY_FIELDS = [
+    ("kind", "B"),  # KIND_PLAYER, KIND_ENEMY ou KIND_WEAPON
+    ("variant", "B"),  # Type d'ennemi ou d'arme
+    ("x", "i"),
+    ("y", "i"),
+    ("status", "H"),  # status_code() du statut, ou angle de l'arme
+    ("frame", "B"),
+    ("health", "h"),
+]
+FIELD_STRUCTS = [struct.Struct("<" + field_format)
+                 for _, field_format in ENTITY_FIELDS]
+
+KIND_PLAYER = 0
+KIND_ENEMY = 1
+KIND_WEAPON = 2
+
+
+def status_code(status):
+    """Code sur 16 bits d'un statut d'animation (ex. : "down_idle")"""
+    return zlib.crc32(status.encode("utf-8")) & 0xFFFF
+
+
+def pack_message(message_type, payload=b""):
+    return MESSAGE_HEADER.pack(message_type, len(payload)) + payload
+
+
+async def read_message(reader):
+    """Lit un message complet et retourne (type, contenu)"""
+    header = await reader.readexactly(MESSAGE_HEADER.size)
+    message_type, length = MESSAGE_HEADER.unpack(header)
+    payload = await reader.readexactly(length) if length else b""
+    return message_type, payload
+
+
+def encode_snapshot(tick, baseline_tick, baseline, state):
+    """
+    Encode les différences entre deux états (identifiant -> tuple de champs).
+
+    Seuls les champs modifiés sont envoyés ; une entité absente de baseline
+    est envoyée en entier, une entité absente de state est supprimée.
+    """
+    parts = []
+    changed = 0
+    for entity_id, values in state.items():
+        old_values = baseline.get(entity_id)
+        mask = 0
+        fields = []
+        for index, value in enumerate(values):
+            if old_values is None or old_values[index] != value:
+                mask |= 1 << index
+                fields.append(FIELD_STRUCTS[index].pack(value))
+        if mask:
+            parts.append(ENTITY_HEADER.pack(entity_id, mask))
+            parts.extend(fields)
+            changed += 1
+    removed = [entity_id for entity_id in baseline if entity_id not in state]
+    parts.extend(ENTITY_ID.pack(entity_id) for entity_id in removed)
+
+    body = SNAPSHOT_COUNTS.pack(changed, len(removed)) + b"".join(parts)
+    compressed = len(body) >= SNAPSHOT_COMPRESS_MIN
+    if compressed:
+        body = zlib.compress(body, 1)
+    return SNAPSHOT_HEADER.pack(tick, baseline_tick, compressed) + body
+
+
+def decode_snapshot(baseline, payload):
+    """Applique un snapshot à l'état baseline et retourne (tick, tick de référence, état)"""
+    tick, baseline_tick, compressed = SNAPSHOT_HEADER.unpack_from(payload, 0)
+    body = payload[SNAPSHOT_HEADER.size:]
+    if compressed:
+        body = zlib.decompress(body)
+    changed, removed = SNAPSHOT_COUNTS.unpack_from(body, 0)
+    offset = SNAPSHOT_COUNTS.size
+
+    state = dict(baseline)
+    for _ in range(changed):
+        entity_id, mask = ENTITY_HEADER.unpack_from(body, offset)
+        offset += ENTITY_HEADER.size
+        values = list(state.get(entity_id, (0,) * len(ENTITY_FIELDS)))
+        for index, field_struct in enumerate(FIELD_STRUCTS):
+            if mask & (1 << index):
+                values[index] = field_struct.unpack_from(body, offset)[0]
+                offset += field_struct.size
+        state[entity_id] = tuple(values)
+    for _ in range(removed):
+        state.pop(ENTITY_ID.unpack_from(body, offset)[0], None)
+        offset += ENTITY_ID.size
+    return tick, baseline_tick, state
+
+
+class RemoteInput:
+    def __init__(self):
+        """Filtre d'entrée d'un joueur distant : dernières actions reçues du client"""
+        self.actions = 0
+
+    def __call__(self, actions):
+        # Le clavier du serveur est ignoré
+        return self.actions
@@ -0,0 +1,115 @@
+import math
+import numpy as np
+import pygame
+from settings.settings import *
+
+
+class ParticleSystem:
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        """
+        Particules stockées dans des tableaux NumPy (une ligne par particule).
+
+        Les particules vivantes occupent toujours les count premières lignes :
+        la mise à jour et le dessin traitent toutes les particules d'un coup,
+        sans aucun objet Python par particule.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(capacity, dtype=np.float32)
+        self.max_lifetimes = np.ones(capacity, dtype=np.float32)
+        self.colors = np.zeros(capacity, dtype=np.int32)
+
+        # Générateur séparé : les particules ne modifient pas le module random
+        # (les replays et les sauvegardes restent identiques)
+        self.rng = np.random.default_rng()
+
+        # Couleur -> index, et textures pré-rendues indexées par
+        # couleur * PARTICLE_FADE_STEPS + étape de fondu
+        self.color_indexes = {}
+        self.textures = np.empty(0, dtype=object)
+
+    def get_color_index(self, color):
+        """Retourne l'index d'une couleur et prépare ses textures au premier usage"""
+        color = tuple(color)
+        if color not in self.color_indexes:
+            self.color_indexes[color] = len(self.color_indexes)
+            textures = list(self.textures)
+            for step in range(PARTICLE_FADE_STEPS):
+                texture = pygame.Surface(
+                    (PARTICLE_SIZE, PARTICLE_SIZE), pygame.SRCALPHA)
+                alpha = 255 * (step + 1) // PARTICLE_FADE_STEPS
+                texture.fill((*color[:3], alpha))
+                textures.append(texture)
+            self.textures = np.empty(len(textures), dtype=object)
+            self.textures[:] = textures
+        return self.color_indexes[color]
+
+    def emit(self, pos, count, speed, lifetime, colors):
+        """Émet count particules depuis pos dans des directions aléatoires"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        new = slice(self.count, self.count + count)
+        angles = self.rng.uniform(0, 2 * math.pi, count)
+        speeds = self.rng.uniform(0.2, 1, count) * speed
+
+        self.positions[new] = pos
+        self.velocities[new, 0] = np.cos(angles) * speeds
+        self.velocities[new, 1] = np.sin(angles) * speeds
+        self.lifetimes[new] = self.rng.uniform(0.5, 1, count) * lifetime
+        self.max_lifetimes[new] = self.lifetimes[new]
+        color_indexes = [self.get_color_index(color) for color in colors]
+        self.colors[new] = self.rng.choice(color_indexes, count)
+        self.count += count
+
+    def update(self):
+        """Avance toutes les particules d'une frame en une seule opération vectorisée"""
+        count = self.count
+        if count == 0:
+            return
+        self.velocities[:count, 1] += PARTICLE_GRAVITY
+        self.velocities[:count] *= PARTICLE_DRAG
+        self.positions[:count] += self.velocities[:count]
+        self.lifetimes[:count] -= 1
+
+        # Compactage : les particules vivantes restent au début des tableaux
+        alive = self.lifetimes[:count] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != count:
+            for values in (self.positions, self.velocities, self.lifetimes,
+                           self.max_lifetimes, self.colors):
+                values[:alive_count] = values[:count][alive]
+            self.count = alive_count
+
+    def draw(self, surface, offset):
+        """Dessine les particules visibles en un seul appel fblits/blits"""
+        count = self.count
+        if count == 0:
+            return
+        screen_positions = (self.positions[:count] - (offset.x, offset.y)
+                            - PARTICLE_SIZE // 2).astype(np.int32)
+        width, height = surface.get_size()
+        visible = ((screen_positions[:, 0] > -PARTICLE_SIZE) &
+                   (screen_positions[:, 0] < width) &
+                   (screen_positions[:, 1] > -PARTICLE_SIZE) &
+                   (screen_positions[:, 1] < height))
+        if not visible.any():
+            return
+
+        # Plus la particule vieillit, plus sa texture est transparente
+        fade_steps = (self.lifetimes[:count][visible] /
+                      self.max_lifetimes[:count][visible] *
+                      PARTICLE_FADE_STEPS).astype(np.int32)
+        np.clip(fade_steps, 0, PARTICLE_FADE_STEPS - 1, out=fade_steps)
+        textures = self.textures[self.colors[:count][visible] *
+                                 PARTICLE_FADE_STEPS + fade_steps]
+
+        blit_sequence = list(zip(textures.tolist(),
+                                 screen_positions[visible].tolist()))
+        # fblits (pygame-ce) est plus rapide que blits quand il est disponible
+        if hasattr(surface, "fblits"):
+            surface.fblits(blit_sequence)
+        else:
+            surface.blits(blit_sequence, False)
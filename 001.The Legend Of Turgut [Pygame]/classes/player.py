@@ -4,14 +4,15 @@ from functions.get_os_adapted_path import get_os_adapted_path
 from classes.joystick import joystick_handler
 from classes.weapon import *
 from classes.entity import Entity
+from classes.asset_loader import asset_loader
+from classes.replay import *
 
 
 class Player(Entity):
-    def __init__(self, pos, groups, obstacle_sprites, create_attack, destroy_attack):
+    def __init__(self, pos, groups, obstacle_sprites, create_attack, destroy_attack, input_filter=None):
         super().__init__(groups)
-        self.image = pygame.image.load(
-            get_os_adapted_path("imagesOfTurgut", "row-6-column-1.png")
-        ).convert_alpha()
+        self.image = asset_loader.image(
+            get_os_adapted_path("imagesOfTurgut", "row-6-column-1.png"))
         self.rect = self.image.get_rect(topleft=pos)
         self.hitbox = self.rect.inflate(-PLAYER_HITBOX_OFFSET, -
                                         PLAYER_HITBOX_OFFSET)
@@ -25,6 +26,8 @@ class Player(Entity):
         self.obstacle_sprites = obstacle_sprites
         self.create_attack = create_attack
         self.destroy_attack = destroy_attack
+        # Filtre appliqué aux actions lues (enregistreur ou replay)
+        self.input_filter = input_filter
         self.weapon_index = 0  # Index de l'arme actuelle
         weapon = list(WEAPON_DATA.keys())[self.weapon_index]
         self.stats = {"health": 100, "energy": 100, "kill_count": 0}
@@ -82,7 +85,7 @@ class Player(Entity):
         }
         # Convertir les chemins en images
         for key, path in player_assets.items():
-            converted_image = pygame.image.load(path).convert_alpha()
+            converted_image = asset_loader.image(path)
             player_assets[key] = converted_image
             self.animations = player_assets
 
@@ -103,61 +106,91 @@ class Player(Entity):
             'run_axes': [4, 5]
         }
 
-    def input(self):
-        """Gestion du mouvement du joueur sans déplacement diagonal, avec support pour la manette."""
+    def read_actions(self):
+        """Lit le clavier et la manette et retourne les actions sous forme de masque de bits."""
         keys = pygame.key.get_pressed()
         joystick = getattr(joystick_handler, "joystick", None)
-
-        # Réinitialisation de la direction
-        self.direction.x, self.direction.y = 0, 0
+        actions = 0
 
         # Détection des touches clavier (priorité aux touches pressées)
         if keys[self.key_mappings['left']]:
-            self.direction.x = -1
-            self.status = "left"
+            actions |= ACTION_LEFT
         elif keys[self.key_mappings['right']]:
-            self.direction.x = 1
-            self.status = "right"
+            actions |= ACTION_RIGHT
         elif keys[self.key_mappings['up']]:
-            self.direction.y = -1
-            self.status = "up"
+            actions |= ACTION_UP
         elif keys[self.key_mappings['down']]:
-            self.direction.y = 1
-            self.status = "down"
+            actions |= ACTION_DOWN
 
         # Détection des axes du joystick (si connecté et aucune touche clavier pressée)
-        if joystick and self.direction.length() == 0:
+        if joystick and not actions:
             joystick_x = joystick.get_axis(0)
             joystick_y = joystick.get_axis(1)
 
             if abs(joystick_x) > abs(joystick_y):  # Priorité à l'axe dominant
                 if joystick_x < -0.5:
-                    self.direction.x = -1
-                    self.status = "left"
+                    actions |= ACTION_LEFT
                 elif joystick_x > 0.5:
-                    self.direction.x = 1
-                    self.status = "right"
+                    actions |= ACTION_RIGHT
             else:
                 if joystick_y < -0.5:
-                    self.direction.y = -1
-                    self.status = "up"
+                    actions |= ACTION_UP
                 elif joystick_y > 0.5:
-                    self.direction.y = 1
-                    self.status = "down"
+                    actions |= ACTION_DOWN
+
+        # Touches et boutons d'attaque (une action par arme)
+        for i, key in enumerate(self.key_mappings['attack']):
+            if keys[key]:
+                actions |= ACTION_ATTACKS[i]
+        if joystick:
+            for i, btn in enumerate(self.joystick_buttons['attack']):
+                if joystick.get_button(btn):
+                    actions |= ACTION_ATTACKS[i]
+
+        # Gestion de l'état de course
+        run_pressed = any(keys[btn] for btn in self.key_mappings['run']) or (
+            joystick and (
+                any(joystick.get_button(btn) for btn in self.joystick_buttons['run']) or
+                any(joystick.get_axis(axis) >
+                    0.2 for axis in self.joystick_buttons['run_axes'])
+            )
+        )
+        if run_pressed:
+            actions |= ACTION_RUN
+        return actions
+
+    def input(self):
+        """Gestion du mouvement du joueur sans déplacement diagonal, avec support pour la manette."""
+        actions = self.read_actions()
+        # Enregistrement ou relecture d'une partie (voir classes/replay.py)
+        if self.input_filter is not None:
+            actions = self.input_filter(actions)
 
-                # Normalisation pour éviter les vecteurs diagonaux
+        # Réinitialisation de la direction
+        self.direction.x, self.direction.y = 0, 0
+
+        if actions & ACTION_LEFT:
+            self.direction.x = -1
+            self.status = "left"
+        elif actions & ACTION_RIGHT:
+            self.direction.x = 1
+            self.status = "right"
+        elif actions & ACTION_UP:
+            self.direction.y = -1
+            self.status = "up"
+        elif actions & ACTION_DOWN:
+            self.direction.y = 1
+            self.status = "down"
+
+        # Normalisation pour éviter les vecteurs diagonaux
         if self.direction.length() > 0:
             self.direction = self.direction.normalize()
 
         # Gestion de l'état d'attaque
-        attack_pressed = any(keys[btn] for btn in self.key_mappings['attack']) or (
-            joystick and any(joystick.get_button(btn)
-                             for btn in self.joystick_buttons['attack'])
-        )
+        attack_pressed = any(actions & action for action in ACTION_ATTACKS)
 
-        # --- Traitement des touches clavier ---
-        for i, key in enumerate(self.key_mappings['attack']):
-            if keys[key]:
+        for i, action in enumerate(ACTION_ATTACKS):
+            if actions & action:
                 self.weapon_index = i
 
                 # Mettre à jour les variables d'attaque
@@ -169,28 +202,9 @@ class Player(Entity):
                 if not self.attacking and self.attack_cooldown <= 0:
                     self.create_attack()
                     self.attacking = True
-                    self.attack_time = pygame.time.get_ticks()
+                    self.attack_time = game_clock.get_ticks()
                 break  # sortir après la première touche valide
 
-        # --- Traitement des boutons de manette ---
-        if joystick:
-            for i, btn in enumerate(self.joystick_buttons['attack']):
-                if joystick.get_button(btn):
-                    self.weapon_index = i
-
-                    # Mettre à jour les variables d'attaque
-                    self.attack_type = list(WEAPON_DATA.keys())[
-                        self.weapon_index]
-                    weapon_data = WEAPON_DATA[self.attack_type]
-                    self.attack_cooldown = weapon_data["cooldown"]
-
-                    # Créer l'attaque si le cooldown est terminé
-                    if not self.attacking and self.attack_cooldown <= 0:
-                        self.create_attack()
-                        self.attacking = True
-                        self.attack_time = pygame.time.get_ticks()
-                    break  # sortir après le premier bouton valide
-
         if self.attacking:
             self.create_attack()
             if self.status == "up":
@@ -203,19 +217,10 @@ class Player(Entity):
                 self.status = "right_attack"
 
         if attack_pressed and not self.attacking:
-            self.attack_time = pygame.time.get_ticks()
+            self.attack_time = game_clock.get_ticks()
             self.attacking = True
 
-        # Gestion de l'état de course
-        run_pressed = any(keys[btn] for btn in self.key_mappings['run']) or (
-            joystick and (
-                any(joystick.get_button(btn) for btn in self.joystick_buttons['run']) or
-                any(joystick.get_axis(axis) >
-                    0.2 for axis in self.joystick_buttons['run_axes'])
-            )
-        )
-
-        self.speed = PLAYER_RUN_SPEED if run_pressed else PLAYER_SPEED
+        self.speed = PLAYER_RUN_SPEED if actions & ACTION_RUN else PLAYER_SPEED
 
     def get_status(self):
         if self.direction.x == 0 and self.direction.y == 0:
@@ -233,7 +238,7 @@ class Player(Entity):
 
     def cooldowns(self):
         """Gestion du cooldown des attaques."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         if self.attacking and current_time - self.attack_time < self.attack_cooldown:
             self.speed = PLAYER_NO_SPEED
@@ -281,16 +286,16 @@ class Player(Entity):
         else:
             # Animation de marche se compose de deux images down1 et down2
             if self.status.startswith("down"):
-                self.image = self.animations["down1"] if pygame.time.get_ticks(
+                self.image = self.animations["down1"] if game_clock.get_ticks(
                 ) % 500 < 250 else self.animations["down2"]
             elif self.status.startswith("up"):
-                self.image = self.animations["up1"] if pygame.time.get_ticks(
+                self.image = self.animations["up1"] if game_clock.get_ticks(
                 ) % 500 < 250 else self.animations["up2"]
             elif self.status.startswith("left"):
-                self.image = self.animations["left1"] if pygame.time.get_ticks(
+                self.image = self.animations["left1"] if game_clock.get_ticks(
                 ) % 500 < 250 else self.animations["left2"]
             elif self.status.startswith("right"):
-                self.image = self.animations["right1"] if pygame.time.get_ticks(
+                self.image = self.animations["right1"] if game_clock.get_ticks(
                 ) % 500 < 250 else self.animations["right2"]
 
     def update(self):
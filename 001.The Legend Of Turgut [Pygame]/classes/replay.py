@@ -0,0 +1,103 @@
+import sys
+import zlib
+import struct
+import pygame
+from array import array
+from settings.settings import *
+
+# Actions du joueur pour une frame, regroupées dans un masque de bits
+ACTION_LEFT = 1 << 0
+ACTION_RIGHT = 1 << 1
+ACTION_UP = 1 << 2
+ACTION_DOWN = 1 << 3
+ACTION_ATTACKS = [1 << 4, 1 << 5, 1 << 6, 1 << 7]  # Une par arme de WEAPON_DATA
+ACTION_RUN = 1 << 8
+
+# Fichier d'enregistrement : en-tête puis masques (uint16) compressés avec zlib
+REPLAY_MAGIC = b"TREP"
+# Version 2 : enregistrement avec l'horloge à pas fixe (les fichiers de la
+# version 1 étaient enregistrés en temps réel et ne se rejouent pas à l'identique)
+REPLAY_VERSION = 2
+# magic, version, images par seconde, graine du hasard, nombre de frames
+REPLAY_HEADER = struct.Struct("<4sHHQI")
+
+
+class GameClock:
+    def __init__(self):
+        """Horloge du jeu : temps réel, ou pas fixe par frame pendant un enregistrement ou un replay"""
+        self.fixed_step = False
+        self.frame = 0
+
+    def use_fixed_step(self):
+        """Chaque frame dure exactement 1000 / FPS ms, quelle que soit la machine"""
+        self.fixed_step = True
+        self.frame = 0
+
+    def tick(self):
+        self.frame += 1
+
+    def get_ticks(self):
+        if self.fixed_step:
+            return self.frame * 1000 // FPS
+        return pygame.time.get_ticks()
+
+
+class InputRecorder:
+    def __init__(self, path, seed):
+        """Enregistre les actions du joueur frame par frame"""
+        self.path = path
+        self.seed = seed
+        self.actions = array("H")
+
+    def __call__(self, actions):
+        """Filtre d'entrée du joueur : mémorise les actions puis les laisse passer"""
+        self.actions.append(actions)
+        return actions
+
+    def save(self):
+        """Écrit l'enregistrement sur le disque"""
+        actions = array("H", self.actions)
+        # Le fichier est toujours en petit-boutiste
+        if sys.byteorder == "big":
+            actions.byteswap()
+        with open(self.path, "wb") as replay_file:
+            replay_file.write(REPLAY_HEADER.pack(
+                REPLAY_MAGIC, REPLAY_VERSION, FPS, self.seed, len(actions)))
+            replay_file.write(zlib.compress(actions.tobytes(), 9))
+        print(f"Replay enregistré : {len(actions)} frames -> {self.path}")
+
+
+class InputReplay:
+    def __init__(self, path):
+        """Relit un enregistrement créé par InputRecorder"""
+        with open(path, "rb") as replay_file:
+            data = replay_file.read()
+        magic, version, fps, self.seed, frame_count = REPLAY_HEADER.unpack_from(
+            data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"Fichier de replay invalide : {path}")
+        if fps != FPS:
+            print(f"Replay enregistré à {fps} FPS, le jeu tourne à {FPS} FPS")
+        self.actions = array("H")
+        self.actions.frombytes(zlib.decompress(data[REPLAY_HEADER.size:]))
+        if sys.byteorder == "big":
+            self.actions.byteswap()
+        if len(self.actions) != frame_count:
+            raise ValueError(f"Replay tronqué : {path}")
+        self.frame = 0
+
+    @property
+    def finished(self):
+        return self.frame >= len(self.actions)
+
+    def __call__(self, actions):
+        """Filtre d'entrée du joueur : remplace les actions réelles par celles enregistrées"""
+        if self.finished:
+            return 0
+        actions = self.actions[self.frame]
+        self.frame += 1
+        return actions
+
+
+# Horloge partagée par le joueur et les ennemis
+game_clock = GameClock()
@@ -0,0 +1,156 @@
+import os
+import queue
+import random
+import struct
+import threading
+import zlib
+from settings.settings import *
+from functions.get_os_adapted_path import get_os_adapted_path
+from classes.replay import game_clock
+
+# Format binaire d'une sauvegarde (petit-boutiste), en deux fichiers :
+# - état : en-tête, joueur, générateur aléatoire, spawner (change à chaque frame)
+# - ennemis : un enregistrement par ennemi (souvent identique d'une sauvegarde
+#   à l'autre, il n'est alors pas réécrit)
+SAVE_MAGIC = b"TSAV"
+SAVE_VERSION = 2
+# magic, version, nombre d'ennemis, CRC32 du fichier des ennemis
+SAVE_HEADER = struct.Struct("<4sHII")
+# x, y (centre de la hitbox), santé, énergie, kills, index de l'arme
+PLAYER_RECORD = struct.Struct("<iiffIB")
+# version, 625 mots de l'état de Mersenne Twister, gauss_next présent, gauss_next
+RANDOM_RECORD = struct.Struct("<B625I?d")
+# index de la vague, ms avant la vague suivante, budget d'entités, ennemis en
+# attente (suivis d'un octet par ennemi : index dans ENNEMY_DATA)
+SPAWNER_RECORD = struct.Struct("<IiHI")
+# type (index dans ENNEMY_DATA), x, y, santé
+ENEMY_RECORD = struct.Struct("<Biif")
+
+ENEMY_NAMES = list(ENNEMY_DATA.keys())
+
+
+def get_enemies_path(path):
+    """Chemin du fichier des ennemis d'une sauvegarde (ex. : quicksave_enemies.sav)"""
+    root, extension = os.path.splitext(path)
+    return f"{root}_enemies{extension}"
+
+
+def capture_snapshot(level):
+    """
+    Sérialise l'état de la partie (appelée sur le thread principal, sans copie de sprites)
+    et retourne (état, ennemis)
+    """
+    player = level.player
+    spawner = level.spawner
+    enemies = b"".join(ENEMY_RECORD.pack(ENEMY_NAMES.index(enemy.enemy_name),
+                                         enemy.hitbox.centerx, enemy.hitbox.centery,
+                                         enemy.health)
+                       for enemy in level.attackable_sprites)
+    version, state, gauss_next = random.getstate()
+
+    parts = [
+        SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION,
+                         len(enemies) // ENEMY_RECORD.size, zlib.crc32(enemies)),
+        PLAYER_RECORD.pack(player.hitbox.centerx, player.hitbox.centery,
+                           player.health, player.energy,
+                           player.kill_count, player.weapon_index),
+        RANDOM_RECORD.pack(version, *state, gauss_next is not None,
+                           gauss_next or 0.0),
+        SPAWNER_RECORD.pack(spawner.wave_index,
+                            spawner.next_wave_time - game_clock.get_ticks(),
+                            spawner.entity_budget, len(spawner.pending)),
+        bytes(ENEMY_NAMES.index(enemy_name) for enemy_name in spawner.pending),
+    ]
+    return b"".join(parts), enemies
+
+
+def read_snapshot(data, enemy_data):
+    """Décode une sauvegarde et retourne (joueur, état aléatoire, spawner, ennemis)"""
+    magic, version, enemy_count, enemies_crc = SAVE_HEADER.unpack_from(data, 0)
+    if magic != SAVE_MAGIC or version != SAVE_VERSION:
+        raise ValueError("Fichier de sauvegarde invalide")
+    offset = SAVE_HEADER.size
+    player = PLAYER_RECORD.unpack_from(data, offset)
+    offset += PLAYER_RECORD.size
+
+    random_record = RANDOM_RECORD.unpack_from(data, offset)
+    offset += RANDOM_RECORD.size
+    gauss_next = random_record[-1] if random_record[-2] else None
+    random_state = (random_record[0], tuple(random_record[1:626]), gauss_next)
+
+    wave_index, wave_delay, entity_budget, pending_count = SPAWNER_RECORD.unpack_from(
+        data, offset)
+    offset += SPAWNER_RECORD.size
+    if len(data) != offset + pending_count:
+        raise ValueError("Fichier de sauvegarde tronqué")
+    pending = [ENEMY_NAMES[type_index] for type_index in data[offset:]]
+    spawner = (wave_index, wave_delay, entity_budget, pending)
+
+    # Les deux fichiers doivent venir de la même sauvegarde
+    if (len(enemy_data) != enemy_count * ENEMY_RECORD.size
+            or zlib.crc32(enemy_data) != enemies_crc):
+        raise ValueError("Fichier des ennemis incohérent avec la sauvegarde")
+    enemies = list(ENEMY_RECORD.iter_unpack(enemy_data))
+    return player, random_state, spawner, enemies
+
+
+class SaveManager:
+    def __init__(self, path=None):
+        """Sauvegardes rapides et automatiques écrites par un thread en arrière-plan"""
+        self.path = path or get_os_adapted_path(SAVE_FOLDER, QUICK_SAVE_FILE)
+        self.autosave_path = get_os_adapted_path(SAVE_FOLDER, AUTO_SAVE_FILE)
+        self.last_autosave_time = game_clock.get_ticks()
+        self.written = {}  # Chemin -> dernier contenu écrit (autosave incrémentale)
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def _write_loop(self):
+        """Thread d'écriture : le disque n'est jamais touché par la boucle de jeu"""
+        while True:
+            path, (data, enemy_data) = self.pending.get()
+            # Ennemis d'abord : l'état (qui contient leur CRC) n'est écrit
+            # qu'une fois le fichier des ennemis en place
+            if self._write_file(get_enemies_path(path), enemy_data):
+                self._write_file(path, data)
+            self.pending.task_done()
+
+    def _write_file(self, path, data):
+        """Écrit un fichier de sauvegarde s'il a changé et retourne False en cas d'erreur"""
+        # Rien n'a changé depuis la dernière écriture de ce fichier
+        if self.written.get(path) == data:
+            return True
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary_path = path + ".tmp"
+            with open(temporary_path, "wb") as save_file:
+                save_file.write(data)
+            os.replace(temporary_path, path)
+            self.written[path] = data
+            return True
+        except OSError as e:
+            print(f"Impossible d'écrire la sauvegarde {path} : {e}")
+            return False
+
+    def quick_save(self, level):
+        """Capture la partie et confie l'écriture au thread de fond"""
+        self.pending.put((self.path, capture_snapshot(level)))
+
+    def autosave(self, level):
+        """Sauvegarde automatique toutes les AUTOSAVE_INTERVAL ms"""
+        current_time = game_clock.get_ticks()
+        if current_time - self.last_autosave_time >= AUTOSAVE_INTERVAL:
+            self.last_autosave_time = current_time
+            self.pending.put((self.autosave_path, capture_snapshot(level)))
+
+    def load(self, path=None):
+        """Lit une sauvegarde, ou retourne None si elle n'existe pas"""
+        # Attendre qu'une sauvegarde en cours d'écriture soit terminée
+        self.pending.join()
+        path = path or self.path
+        if not os.path.isfile(path):
+            return None
+        with open(path, "rb") as save_file:
+            data = save_file.read()
+        with open(get_enemies_path(path), "rb") as enemies_file:
+            return read_snapshot(data, enemies_file.read())
@@ -0,0 +1,193 @@
+import time
+import asyncio
+import weakref
+import itertools
+from settings.settings import *
+from classes.level import Level
+from classes.replay import game_clock
+from classes.save_game import ENEMY_NAMES
+from classes.network import (MSG_WELCOME, MSG_INPUT, MSG_SNAPSHOT, MSG_STATS_REQUEST,
+                             MSG_STATS, MSG_FULL, WELCOME, INPUT, STATS,
+                             KIND_PLAYER, KIND_ENEMY, KIND_WEAPON, RemoteInput,
+                             status_code, pack_message, read_message, encode_snapshot)
+
+WEAPON_NAMES = list(WEAPON_DATA.keys())
+
+
+class ClientConnection:
+    def __init__(self, slot, player, remote_input, writer):
+        """Un client connecté : son joueur et le dernier état qu'il a reçu"""
+        self.slot = slot
+        self.player = player
+        self.remote_input = remote_input
+        self.writer = writer
+        self.baseline = {}  # Dernier état envoyé (référence des différences)
+        self.baseline_tick = 0
+
+
+class GameServer:
+    def __init__(self, host=SERVER_HOST, port=SERVER_PORT):
+        """
+        Serveur multijoueur faisant autorité : il simule le Level sans rien
+        dessiner et envoie à chaque client les différences d'état.
+        """
+        self.host = host
+        self.port = port
+        self.level = None
+        self.clients = {}  # Numéro de joueur -> ClientConnection
+        # Le joueur 0 est le joueur principal du Level
+        self.main_input = RemoteInput()
+        # Identifiants réseau stables des sprites (oubliés avec le sprite)
+        self.entity_ids = weakref.WeakKeyDictionary()
+        self.next_entity_id = itertools.count(1)
+        self.tick = 0
+
+        # Mesures remises à zéro toutes les SERVER_STATS_INTERVAL ms
+        self.tick_times = []
+        self.bytes_sent = 0
+        self.stats_start = time.perf_counter()
+        self.last_stats = STATS.pack(0, 0.0, 0.0, 0.0, 0)
+
+    def create_level(self):
+        # Pas fixe : les temps de recharge suivent les ticks du serveur
+        game_clock.use_fixed_step()
+        self.level = Level(self.main_input)
+        # Le serveur n'est jamais rejoué : il garde le budget adapté au temps de tick
+        self.level.spawner.adaptive_budget = True
+
+    def get_entity_id(self, sprite):
+        entity_id = self.entity_ids.get(sprite)
+        if entity_id is None:
+            entity_id = next(self.next_entity_id)
+            self.entity_ids[sprite] = entity_id
+        return entity_id
+
+    def capture_state(self):
+        """État de toutes les entités : identifiant -> champs (voir ENTITY_FIELDS)"""
+        state = {}
+        for player in self.level.players:
+            state[self.get_entity_id(player)] = (
+                KIND_PLAYER, 0, player.rect.centerx, player.rect.centery,
+                status_code(player.status), int(player.frame_index) & 0xFF,
+                round(player.health))
+        for enemy in self.level.attackable_sprites:
+            state[self.get_entity_id(enemy)] = (
+                KIND_ENEMY, ENEMY_NAMES.index(enemy.enemy_name),
+                enemy.rect.centerx, enemy.rect.centery,
+                status_code(enemy.status), int(enemy.frame_index) & 0xFF,
+                round(enemy.health))
+        for weapon in self.level.attacks.values():
+            state[self.get_entity_id(weapon)] = (
+                KIND_WEAPON, WEAPON_NAMES.index(weapon.attack_type),
+                weapon.rect.centerx, weapon.rect.centery,
+                int(weapon.rotation_angle) % 360, weapon.frame_index & 0xFF, 0)
+        return state
+
+    def connect(self, writer):
+        """Attribue un joueur libre au nouveau client, ou None si la partie est pleine"""
+        for slot in range(SERVER_MAX_PLAYERS):
+            if slot not in self.clients:
+                break
+        else:
+            return None
+        if slot == 0:
+            remote_input = self.main_input
+            player = self.level.player
+        else:
+            remote_input = RemoteInput()
+            player = self.level.add_player(remote_input)
+        client = ClientConnection(slot, player, remote_input, writer)
+        self.clients[slot] = client
+        return client
+
+    def disconnect(self, client):
+        del self.clients[client.slot]
+        if client.slot == 0:
+            # Le joueur principal reste dans le niveau, immobile
+            client.remote_input.actions = 0
+        else:
+            self.level.remove_player(client.player)
+
+    async def handle_client(self, reader, writer):
+        client = self.connect(writer)
+        if client is None:
+            writer.write(pack_message(MSG_FULL))
+            writer.close()
+            return
+        writer.write(pack_message(MSG_WELCOME, WELCOME.pack(
+            client.slot, FPS, SNAPSHOT_INTERVAL)))
+        try:
+            while True:
+                message_type, payload = await read_message(reader)
+                if message_type == MSG_INPUT:
+                    _, client.remote_input.actions = INPUT.unpack(payload)
+                elif message_type == MSG_STATS_REQUEST:
+                    writer.write(pack_message(MSG_STATS, self.last_stats))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.disconnect(client)
+            writer.close()
+
+    def broadcast(self):
+        """Envoie à chaque client les différences depuis son dernier snapshot"""
+        state = self.capture_state()
+        for client in list(self.clients.values()):
+            # Client trop lent : on saute ce snapshot, le suivant rattrapera
+            if client.writer.transport.get_write_buffer_size() > SERVER_MAX_BUFFER:
+                continue
+            message = pack_message(MSG_SNAPSHOT, encode_snapshot(
+                self.tick, client.baseline_tick, client.baseline, state))
+            client.writer.write(message)
+            self.bytes_sent += len(message)
+            client.baseline = state
+            client.baseline_tick = self.tick
+
+    def update_stats(self):
+        """Calcule et affiche les mesures toutes les SERVER_STATS_INTERVAL ms"""
+        elapsed = time.perf_counter() - self.stats_start
+        if elapsed * 1000 < SERVER_STATS_INTERVAL or not self.tick_times:
+            return
+        average = sum(self.tick_times) / len(self.tick_times) * 1000
+        maximum = max(self.tick_times) * 1000
+        bytes_per_second = self.bytes_sent / elapsed
+        self.last_stats = STATS.pack(len(self.tick_times), average, maximum,
+                                     bytes_per_second, len(self.clients))
+        print(f"Serveur : {len(self.clients)} clients, tick moyen {average:.2f} ms, "
+              f"max {maximum:.2f} ms, {bytes_per_second / 1024:.1f} Ko/s envoyés")
+        self.tick_times = []
+        self.bytes_sent = 0
+        self.stats_start = time.perf_counter()
+
+    async def run_simulation(self):
+        """Boucle de simulation à FPS ticks par seconde"""
+        loop = asyncio.get_running_loop()
+        tick_duration = 1 / FPS
+        next_tick = loop.time()
+        while True:
+            start_time = time.perf_counter()
+            self.level.simulate()
+            game_clock.tick()
+            self.tick += 1
+            if self.tick % SNAPSHOT_INTERVAL == 0:
+                self.broadcast()
+            tick_time = time.perf_counter() - start_time
+            # Le spawner adapte le nombre d'ennemis au temps de tick
+            self.level.frame_time = tick_time * 1000
+            self.tick_times.append(tick_time)
+            self.update_stats()
+
+            next_tick += tick_duration
+            delay = next_tick - loop.time()
+            if delay < -5 * tick_duration:
+                # Trop de retard : on repart de maintenant plutôt que d'enchaîner les ticks
+                next_tick = loop.time()
+            # Laisse la boucle asyncio lire les actions des clients
+            await asyncio.sleep(max(delay, 0))
+
+    async def serve(self):
+        self.create_level()
+        server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        print(f"Serveur Turgut à l'écoute sur {self.host}:{self.port}")
+        async with server:
+            await self.run_simulation()
@@ -0,0 +1,51 @@
+from settings.settings import *
+
+
+class SpatialGrid:
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        """Grille de hachage spatial : (colonne, ligne) -> ensemble de sprites"""
+        self.cell_size = cell_size
+        self.cells = {}
+        self.sprite_cells = {}  # Cellules occupées par chaque sprite
+
+    def _cells_for_rect(self, rect):
+        """Retourne les cellules recouvertes par un rectangle"""
+        left = rect.left // self.cell_size
+        right = (rect.right - 1) // self.cell_size
+        top = rect.top // self.cell_size
+        bottom = (rect.bottom - 1) // self.cell_size
+        return [(column, row)
+                for column in range(left, right + 1)
+                for row in range(top, bottom + 1)]
+
+    def insert(self, sprite):
+        """Ajoute un sprite dans les cellules que recouvre son rectangle"""
+        cells = self._cells_for_rect(sprite.rect)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(sprite)
+        self.sprite_cells[sprite] = cells
+
+    def remove(self, sprite):
+        """Retire un sprite de la grille"""
+        for cell in self.sprite_cells.pop(sprite, []):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.discard(sprite)
+                if not bucket:
+                    del self.cells[cell]
+
+    def move(self, sprite):
+        """Met à jour un sprite seulement s'il a changé de cellule"""
+        cells = self._cells_for_rect(sprite.rect)
+        if self.sprite_cells.get(sprite) != cells:
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def query(self, rect):
+        """Retourne les sprites proches d'un rectangle (phase large)"""
+        found = set()
+        for cell in self._cells_for_rect(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return found
@@ -0,0 +1,78 @@
+import random
+from collections import deque
+from settings.settings import *
+from classes.replay import game_clock
+
+
+class EnemySpawner:
+    def __init__(self, level):
+        """Planifie les vagues d'ennemis et les fait apparaître sur plusieurs frames"""
+        self.level = level
+        self.pending = deque()  # Noms d'ennemis en attente d'apparition
+        self.pool = {}  # Nom -> ennemis morts réutilisables
+        self.wave_index = 0
+        self.next_wave_time = game_clock.get_ticks() + ENEMY_WAVES[0]["delay"]
+
+        # Budget global d'entités, ajusté selon le temps de frame mesuré.
+        # Le temps mesuré varie d'une machine à l'autre : avec l'horloge à pas
+        # fixe (enregistrement, replay) le budget reste fixe pour que la
+        # partie se rejoue à l'identique.
+        self.entity_budget = MAX_ENEMIES
+        self.adaptive_budget = not game_clock.fixed_step
+        self.frame_time = 0.0  # Moyenne glissante en millisecondes
+
+    def acquire(self, enemy_name, pos):
+        """Retourne un ennemi du pool remis à neuf, ou en crée un nouveau"""
+        pool = self.pool.get(enemy_name)
+        if pool:
+            enemy = pool.pop()
+            enemy.reset(pos)
+            enemy.add(self.level.visible_sprites, self.level.attackable_sprites)
+            return enemy
+        return self.level.create_enemy(pos, enemy_name)
+
+    def release(self, enemy):
+        """Range un ennemi mort dans le pool au lieu de le détruire"""
+        if enemy.grid is not None:
+            enemy.grid.remove(enemy)
+        enemy.kill()
+        self.pool.setdefault(enemy.enemy_name, []).append(enemy)
+
+    def schedule_waves(self):
+        """Met en file la vague suivante quand son heure est venue"""
+        current_time = game_clock.get_ticks()
+        if current_time < self.next_wave_time:
+            return
+        # Après la dernière vague définie, la dernière se répète
+        wave = ENEMY_WAVES[min(self.wave_index, len(ENEMY_WAVES) - 1)]
+        for enemy_name, count in wave["enemies"].items():
+            self.pending.extend([enemy_name] * count)
+        self.wave_index += 1
+        next_wave = ENEMY_WAVES[min(self.wave_index, len(ENEMY_WAVES) - 1)]
+        self.next_wave_time = current_time + next_wave["delay"]
+
+    def update_budget(self, frame_time):
+        """Réduit le nombre d'ennemis autorisés si les frames deviennent trop longues"""
+        if not self.adaptive_budget:
+            return
+        self.frame_time += (frame_time - self.frame_time) * 0.1
+        frame_budget = 1000 / FPS
+        alive = len(self.level.attackable_sprites)
+        if self.frame_time > frame_budget:
+            self.entity_budget = max(MIN_ENEMIES, min(self.entity_budget, alive) - 1)
+        elif self.frame_time < frame_budget * 0.75:
+            self.entity_budget = min(MAX_ENEMIES, self.entity_budget + 1)
+
+    def update(self, frame_time):
+        """Fait apparaître au plus MAX_SPAWNS_PER_FRAME ennemis en attente par frame"""
+        self.update_budget(frame_time)
+        self.schedule_waves()
+
+        # Limite en nombre, pas en temps : le résultat ne dépend pas de la machine
+        spawned = 0
+        while self.pending and spawned < MAX_SPAWNS_PER_FRAME:
+            if len(self.level.attackable_sprites) >= self.entity_budget:
+                break
+            enemy_name = self.pending.popleft()
+            self.acquire(enemy_name, random.choice(ENNEMY_START_POSITION))
+            spawned += 1
@@ -1,13 +1,107 @@
 import pygame
+import hashlib
+from array import array
 from settings.settings import *
 from functions.get_os_adapted_path import get_os_adapted_path
 
 
-class Tile(pygame.sprite.Sprite):
-    def __init__(self, pos, groups, sprite_type, surface=pygame.Surface((TILE_SIZE, TILE_SIZE))):
+class Tile:
+    """Vue légère d'une tuile du TileStore, créée seulement quand on en a besoin"""
+    __slots__ = ("sprite_type", "image", "rect", "hitbox")
+
+    def __init__(self, pos, sprite_type, surface):
         """Initialise un tile avec une image et une position"""
-        super().__init__(groups)
         self.sprite_type = sprite_type
         self.image = surface
         self.rect = self.image.get_rect(topleft=pos)
         self.hitbox = self.rect.inflate(0, -PLAYER_HITBOX_OFFSET)
+
+
+class TileStore:
+    """
+    Stockage compact des tuiles d'obstacles.
+
+    Les tuiles sont rangées dans des tableaux parallèles (positions et index
+    dans l'atlas). Les images identiques ne sont gardées qu'une fois dans
+    l'atlas, et ce sont des copies : l'image complète de la carte n'est plus
+    maintenue en mémoire par des subsurfaces.
+    """
+
+    def __init__(self, sprite_type="obstacle"):
+        self.sprite_type = sprite_type
+        self.xs = array("i")
+        self.ys = array("i")
+        self.atlas_indexes = array("I")
+        self.atlas = []  # Images uniques des tuiles
+        self.atlas_lookup = {}  # Empreinte du contenu -> index dans l'atlas
+        # Grille : index de la tuile + 1 pour chaque case (0 = vide)
+        self.columns = 0
+        self.rows = 0
+        self.grid = array("i")
+
+    def set_world_size(self, width, height):
+        """Prépare la grille pour un monde de width x height pixels"""
+        self.columns = -(-width // TILE_SIZE)
+        self.rows = -(-height // TILE_SIZE)
+        self.grid = array("i", bytes(4 * self.columns * self.rows))
+
+    def add(self, pos, surface):
+        """Ajoute une tuile en réutilisant une image identique si elle existe"""
+        key = hashlib.blake2b(pygame.image.tobytes(
+            surface, "RGBA"), digest_size=16).digest()
+        atlas_index = self.atlas_lookup.get(key)
+        if atlas_index is None:
+            atlas_index = len(self.atlas)
+            # copy() détache l'image de la carte complète
+            self.atlas.append(surface.copy())
+            self.atlas_lookup[key] = atlas_index
+
+        self.xs.append(pos[0])
+        self.ys.append(pos[1])
+        self.atlas_indexes.append(atlas_index)
+        column, row = pos[0] // TILE_SIZE, pos[1] // TILE_SIZE
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            self.grid[row * self.columns + column] = len(self.xs)
+
+    def get_tile(self, index):
+        """Retourne la vue Tile de la tuile numéro index"""
+        return Tile((self.xs[index], self.ys[index]), self.sprite_type,
+                    self.atlas[self.atlas_indexes[index]])
+
+    def sprites_in_rect(self, rect):
+        """Retourne les tuiles dont la case recoupe rect (lecture directe dans la grille)"""
+        left = max(rect.left // TILE_SIZE, 0)
+        right = min((rect.right - 1) // TILE_SIZE, self.columns - 1)
+        top = max(rect.top // TILE_SIZE, 0)
+        bottom = min((rect.bottom - 1) // TILE_SIZE, self.rows - 1)
+        tiles = []
+        for row in range(top, bottom + 1):
+            row_start = row * self.columns
+            for column in range(left, right + 1):
+                index = self.grid[row_start + column]
+                if index:
+                    tiles.append(self.get_tile(index - 1))
+        return tiles
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __iter__(self):
+        for index in range(len(self.xs)):
+            yield self.get_tile(index)
+
+    def memory_estimate(self, source_size):
+        """
+        Estime (calcul d'après les tailles, pas une mesure) la mémoire utilisée
+        face à l'ancien stockage en subsurfaces. Mesure réelle : benchmark_tile_memory.py
+        """
+        arrays_bytes = sum(len(values) * values.itemsize for values in
+                           (self.xs, self.ys, self.atlas_indexes, self.grid))
+        atlas_bytes = len(self.atlas) * TILE_SIZE * TILE_SIZE * 4
+        # Ancien stockage : carte RGBA complète maintenue par les subsurfaces
+        source_bytes = source_size[0] * source_size[1] * 4
+        saved = source_bytes - arrays_bytes - atlas_bytes
+        return (f"Estimation : {len(self)} tuiles, {len(self.atlas)} images uniques : "
+                f"{(arrays_bytes + atlas_bytes) / 1024:.0f} Ko au lieu de "
+                f"{source_bytes / 1024:.0f} Ko pour l'image de la carte "
+                f"(hors sprites), {saved / 1024:.0f} Ko économisés")
@@ -1,15 +1,16 @@
 import pygame
 from settings.settings import *
 from functions.get_os_adapted_path import get_os_adapted_path
+from classes.asset_loader import asset_loader
 
 
 class UI:
     def __init__(self):
         # Initialisation des icônes
-        self.energy_icon = pygame.image.load(
-            get_os_adapted_path("assets", "energy.png")).convert_alpha()
-        self.health_icon = pygame.image.load(
-            get_os_adapted_path("assets", "health.png")).convert_alpha()
+        self.energy_icon = asset_loader.image(
+            get_os_adapted_path("assets", "energy.png"))
+        self.health_icon = asset_loader.image(
+            get_os_adapted_path("assets", "health.png"))
 
         # Redimensionnement
         self.health_icon = pygame.transform.scale(self.health_icon, (48, 48))
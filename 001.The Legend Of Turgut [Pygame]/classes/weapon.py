@@ -4,151 +4,194 @@ import math
 from pygame.locals import *
 from pygame import Vector2
 
-from settings.settings import WEAPON_DATA
+from settings.settings import WEAPON_DATA, PARTICLE_TRAIL
 from functions.get_os_adapted_path import get_os_adapted_path
+from classes.asset_loader import asset_loader
+
+# Vecteur de déplacement et rotation initiale de l'arme selon la direction du joueur
+DIRECTIONS = {
+    "right": (Vector2(1, 0), -90),
+    "left": (Vector2(-1, 0), 90),
+    "up": (Vector2(0, -1), 0),
+    "down": (Vector2(0, 1), 180),
+}
+
+
+def compute_trajectory(animation_data, direction):
+    """
+    Calcule une fois pour toutes la trajectoire d'une attaque.
+
+    Retourne un tuple (frames, loop_start) où frames est une liste de
+    (offset_x, offset_y, angle) indexée par numéro de frame. L'offset est
+    relatif à la position de départ de l'arme, sauf pour "spin" où il est
+    relatif au centre du joueur. Si loop_start n'est pas None, les frames
+    à partir de loop_start se répètent indéfiniment.
+    """
+    direction_vector, initial_rotation = DIRECTIONS[direction]
+    animation_type = animation_data["type"]
+    frames = []
+
+    if animation_type in ["rotate", "swing"]:
+        rotation_angle = initial_rotation
+        distance_traveled = 0
+        position = Vector2()
+        while distance_traveled < animation_data["max_distance"]:
+            rotation_angle = (rotation_angle +
+                              animation_data["rotation_speed"]) % 360
+            position += direction_vector * animation_data["speed"]
+            distance_traveled += animation_data["speed"]
+            frames.append((position.x, position.y, rotation_angle))
+        return frames, None
+
+    if animation_type == "stab":
+        amplitude = 0.5
+        frequency = 50  # Amplitude et fréquence pour l'oscillation
+        rotation_angle = 0
+        distance_traveled = 0
+        position = Vector2()
+        while distance_traveled < animation_data["max_distance"]:
+            # alterner entre la droite et la gauche de manière plus régulière
+            side = 1 if int(distance_traveled * frequency) % 2 == 0 else -1
+            offset = direction_vector.rotate(
+                90 * side) * math.sin(distance_traveled * frequency) * amplitude
+            position += direction_vector * animation_data["speed"] + offset
+            distance_traveled += animation_data["speed"]
+            rotation_angle = (rotation_angle +
+                              animation_data["rotation_speed"]) % 360
+            frames.append((position.x, position.y, rotation_angle))
+        return frames, None
+
+    if animation_type == "spin":
+        max_radius = 40
+        current_radius = 2  # Rayon initial
+        orbit_angle = 0  # Angle pour la rotation autour du joueur
+        rotation_angle = initial_rotation  # Angle pour la rotation sur elle-même
+        # Le mouvement devient périodique une fois le rayon maximal atteint
+        ramp_frames = math.ceil((max_radius - current_radius) / 0.5)
+        period = math.lcm(
+            360 // math.gcd(animation_data["rotation_speed"], 360),
+            360 // math.gcd(animation_data["speed"], 360))
+        for _ in range(ramp_frames + period):
+            current_radius = min(current_radius + 0.5, max_radius)
+            orbit_angle = (orbit_angle +
+                           animation_data["rotation_speed"]) % 360
+            angle_rad = math.radians(orbit_angle)
+            rotation_angle = (rotation_angle + animation_data["speed"]) % 360
+            frames.append((math.cos(angle_rad) * current_radius,
+                           math.sin(angle_rad) * current_radius,
+                           rotation_angle))
+        return frames, ramp_frames
+
+    raise ValueError(f"Type d'animation inconnu : {animation_type}")
+
+
+# Trajectoires précalculées au démarrage : WEAPON_TRAJECTORIES[attaque][direction]
+WEAPON_TRAJECTORIES = {
+    attack_type: {
+        direction: compute_trajectory(weapon_data["animation"], direction)
+        for direction in DIRECTIONS
+    }
+    for attack_type, weapon_data in WEAPON_DATA.items()
+}
+
+# Images tournées partagées entre toutes les attaques : (sprite, angle) -> surface
+_rotated_images = {}
+# Masques de collision des images tournées : (sprite, angle) -> mask
+_rotated_masks = {}
+
+
+def get_rotated_image(sprite_path, angle):
+    """Retourne l'image de l'arme tournée de angle degrés (calculée une seule fois)"""
+    key = (sprite_path, angle)
+    if key not in _rotated_images:
+        original_key = (sprite_path, 0)
+        if original_key not in _rotated_images:
+            _rotated_images[original_key] = asset_loader.image(sprite_path)
+        _rotated_images[key] = pygame.transform.rotate(
+            _rotated_images[original_key], angle)
+    return _rotated_images[key]
+
+
+def get_rotated_mask(sprite_path, angle):
+    """Retourne le masque de l'image tournée (calculé une seule fois)"""
+    key = (sprite_path, angle)
+    if key not in _rotated_masks:
+        _rotated_masks[key] = pygame.mask.from_surface(
+            get_rotated_image(sprite_path, angle))
+    return _rotated_masks[key]
 
 
 class Weapon(pygame.sprite.Sprite):
-    def __init__(self, player, groups):
+    def __init__(self, player, groups, particles=None):
         super().__init__(*groups)
         self.player = player
+        self.particles = particles  # Système de particules pour la traînée
         self.attack_type = player.attack_type
         self.weapon_data = WEAPON_DATA[self.attack_type]
         self.direction = player.status.split("_")[0]
 
         # Charger l'image originale
-        self.original_image = pygame.image.load(
-            self.weapon_data["sprite"]).convert_alpha()
+        self.original_image = get_rotated_image(self.weapon_data["sprite"], 0)
         self.image = self.original_image
+        self.mask = get_rotated_mask(self.weapon_data["sprite"], 0)
+        self.hit_sprites = set()  # Un ennemi n'est touché qu'une fois par attaque
 
         # Variables pour l'animation
         self.animation_data = self.weapon_data["animation"]
         self.rotation_angle = 0
-        self.distance_traveled = 0
-        self.is_returning = False
+        self.frame_index = 0
 
         # Position initiale
         self.set_initial_position()
 
     def set_initial_position(self):
         """Définit la position initiale en fonction de la direction"""
-        offset = 20  # Distance initiale par rapport au joueur
         if "right" in self.direction:
             self.rect = self.image.get_rect(
-                midleft=self.player.rect.midright + pygame.Vector2(0, 0))
-            self.direction_vector = pygame.Vector2(1, 0)
-            self.initial_rotation = -90
+                midleft=self.player.rect.midright)
         elif "left" in self.direction:
             self.rect = self.image.get_rect(
-                midright=self.player.rect.midleft + pygame.Vector2(0, 0))
-            self.direction_vector = pygame.Vector2(-1, 0)
-            self.initial_rotation = 90
+                midright=self.player.rect.midleft)
         elif "up" in self.direction:
             self.rect = self.image.get_rect(
-                midbottom=self.player.rect.midtop + pygame.Vector2(0, 0))
-            self.direction_vector = pygame.Vector2(0, -1)
-            self.initial_rotation = 0
-        elif "down" in self.direction:
+                midbottom=self.player.rect.midtop)
+        else:
+            self.direction = "down"
             self.rect = self.image.get_rect(
-                midtop=self.player.rect.midbottom + pygame.Vector2(0, 0))
-            self.direction_vector = pygame.Vector2(0, 1)
-            self.initial_rotation = 180
+                midtop=self.player.rect.midbottom)
+        self.start_center = Vector2(self.rect.center)
+        self.trajectory, self.loop_start = WEAPON_TRAJECTORIES[self.attack_type][self.direction]
 
         # Appliquer la rotation initiale si nécessaire
         if self.animation_data["type"] in ["rotate", "swing", "spin"]:
-            self.image = pygame.transform.rotate(
-                self.original_image, self.initial_rotation)
-            self.rotation_angle = self.initial_rotation
+            self.rotation_angle = DIRECTIONS[self.direction][1]
+            self.image = get_rotated_image(
+                self.weapon_data["sprite"], self.rotation_angle)
+            self.mask = get_rotated_mask(
+                self.weapon_data["sprite"], self.rotation_angle)
 
     def update(self):
-        # Gérer les différents types d'animation
-        if self.animation_data["type"] == "rotate":
-            self.handle_rotate_animation()
-        elif self.animation_data["type"] == "swing":
-            self.handle_swing_animation()
-        elif self.animation_data["type"] == "stab":
-            self.handle_stab_animation()
-        elif self.animation_data["type"] == "spin":
-            self.handle_spin_animation()
+        # Trajectoire périodique : on reboucle sur la partie qui se répète
+        if self.frame_index >= len(self.trajectory):
+            self.frame_index = self.loop_start
+
+        offset_x, offset_y, self.rotation_angle = self.trajectory[self.frame_index]
+        self.frame_index += 1
+
+        # "spin" tourne autour du joueur, les autres partent du point de départ
+        if self.animation_data["type"] == "spin":
+            anchor = self.player.rect.center
+        else:
+            anchor = self.start_center
+        self.rect.center = (round(anchor[0] + offset_x),
+                            round(anchor[1] + offset_y))
+        self.image = get_rotated_image(
+            self.weapon_data["sprite"], self.rotation_angle)
+        self.mask = get_rotated_mask(
+            self.weapon_data["sprite"], self.rotation_angle)
+        if self.particles is not None:
+            self.particles.emit(self.rect.center, **PARTICLE_TRAIL)
 
         # Vérifier si l'arme doit être supprimée
-        if self.distance_traveled >= self.animation_data["max_distance"] * (2 if self.is_returning else 1):
+        if self.loop_start is None and self.frame_index >= len(self.trajectory):
             self.player.destroy_attack()
-
-    def handle_swing_animation(self):
-        # Rotation de l'arme
-        self.rotation_angle = (self.rotation_angle +
-                               self.animation_data["rotation_speed"]) % 360
-        self.image = pygame.transform.rotate(
-            self.original_image, self.rotation_angle)
-        # avancer l'arme dans la direction du joueur
-        self.rect.center += self.direction_vector * \
-            self.animation_data["speed"]
-        self.distance_traveled += self.animation_data["speed"]
-
-    def handle_rotate_animation(self):
-        # Rotation de l'arme
-        self.rotation_angle = (self.rotation_angle +
-                               self.animation_data["rotation_speed"]) % 360
-        self.image = pygame.transform.rotate(
-            self.original_image, self.rotation_angle)
-        # avancer l'arme dans la direction du joueur
-        self.rect.center += self.direction_vector * \
-            self.animation_data["speed"]
-        self.distance_traveled += self.animation_data["speed"]
-
-    def handle_stab_animation(self):
-        amplitude = 0.5
-        frequency = 50  # Amplitude et fréquence pour l'oscillation
-
-        # alterner entre la droite et la gauche de manière plus régulière
-        direction = 1 if int(self.distance_traveled *
-                             frequency) % 2 == 0 else -1
-        offset = self.direction_vector.rotate(
-            90 * direction) * math.sin(self.distance_traveled * frequency) * amplitude
-
-        self.rect.center += self.direction_vector * \
-            self.animation_data["speed"] + offset
-        self.distance_traveled += self.animation_data["speed"]
-
-        # rotation
-        self.rotation_angle = (self.rotation_angle +
-                               self.animation_data["rotation_speed"]) % 360
-        self.image = pygame.transform.rotate(
-            self.original_image, self.rotation_angle)
-
-    def handle_spin_animation(self):
-        # Initialisations si nécessaires
-        if not hasattr(self, 'current_radius'):
-            self.current_radius = 2  # Rayon initial
-        if not hasattr(self, 'orbit_angle'):
-            self.orbit_angle = 0  # Angle pour la rotation autour du joueur
-
-        if not hasattr(self, 'self_spin_angle'):
-            self.self_spin_angle = 0  # Angle pour la rotation sur elle-même
-
-        # Augmenter le rayon progressivement
-        self.current_radius += 0.5  # Ou un autre incrément selon l'effet souhaité
-        if self.current_radius > 40:
-            self.current_radius = 40
-        # Mise à jour de l'angle orbital
-        self.orbit_angle = (self.orbit_angle +
-                            self.animation_data["rotation_speed"]) % 360
-        angle_rad = math.radians(self.orbit_angle)
-
-        # Calcul de l'offset pour tourner autour du joueur
-        offset = pygame.Vector2(
-            math.cos(angle_rad) * self.current_radius,
-            math.sin(angle_rad) * self.current_radius
-        )
-
-        # Mise à jour de la position
-        self.rect.center = self.player.rect.center + offset
-
-        # Mise à jour de la rotation sur elle-même
-        # Vitesse de rotation propre
-        # rotation
-        self.rotation_angle = (self.rotation_angle +
-                               self.animation_data["speed"]) % 360
-        self.image = pygame.transform.rotate(
-            self.original_image, self.rotation_angle)
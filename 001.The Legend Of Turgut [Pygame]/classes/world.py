@@ -0,0 +1,176 @@
+import math
+import numpy as np
+import pygame
+from collections import OrderedDict
+from settings.settings import *
+from classes.tile import Tile
+from classes.asset_loader import asset_loader
+from functions.get_os_adapted_path import get_os_adapted_path
+from functions.procedural_world import generate_chunk
+
+
+class WorldChunk:
+    """Un chunk généré : image du sol et grille des obstacles"""
+    __slots__ = ("floor_surface", "obstacles", "obstacle_count")
+
+    def __init__(self, floor_surface, obstacles):
+        self.floor_surface = floor_surface
+        self.obstacles = obstacles  # [ligne, colonne] -> image ou -1
+        self.obstacle_count = int(np.count_nonzero(obstacles >= 0))
+
+
+class ChunkCache:
+    """
+    Chunks du monde gardés en mémoire autour des joueurs.
+
+    Les chunks ne sont préparés (generate) que par update(), quelques-uns
+    par frame autour des joueurs : le dessin ne voit que les chunks déjà
+    en mémoire. Les moins récemment utilisés sont oubliés au-delà de
+    WORLD_MAX_CHUNKS : la mémoire reste bornée quelle que soit la taille
+    du monde parcouru.
+    """
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunk_tiles = chunk_size // TILE_SIZE
+        self.chunks = OrderedDict()  # (chunk_x, chunk_y) -> chunk
+        # Les chunks préparés couvrent tout l'écran, plus une marge d'un chunk
+        self.load_radius_x = max(WORLD_LOAD_RADIUS, math.ceil(WIDTH / 2 / chunk_size) + 1)
+        self.load_radius_y = max(WORLD_LOAD_RADIUS, math.ceil(HEIGHT / 2 / chunk_size) + 1)
+        # Les chunks autour du joueur ne doivent jamais être oubliés
+        self.max_chunks = max(WORLD_MAX_CHUNKS,
+                              (2 * self.load_radius_x + 1) * (2 * self.load_radius_y + 1))
+
+    def generate(self, chunk_x, chunk_y):
+        """Prépare un chunk (image du sol dans floor_surface, ou None)"""
+        raise NotImplementedError
+
+    def get_chunk(self, chunk_x, chunk_y):
+        """Retourne un chunk, en le préparant s'il n'est pas en mémoire (appelée par update)"""
+        key = (chunk_x, chunk_y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.generate(chunk_x, chunk_y)
+            self.chunks[key] = chunk
+            # Oublier les chunks les moins récemment utilisés
+            while len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return chunk
+
+    def update(self, center, limit=WORLD_CHUNKS_PER_FRAME):
+        """Prépare les chunks proches du joueur, quelques-uns par frame (tous si limit est None)"""
+        center_x = center[0] // self.chunk_size
+        center_y = center[1] // self.chunk_size
+        missing = []
+        for chunk_y in range(center_y - self.load_radius_y, center_y + self.load_radius_y + 1):
+            for chunk_x in range(center_x - self.load_radius_x, center_x + self.load_radius_x + 1):
+                key = (chunk_x, chunk_y)
+                if key in self.chunks:
+                    self.chunks.move_to_end(key)
+                else:
+                    missing.append(key)
+        # Les plus proches d'abord, le reste attendra les frames suivantes
+        missing.sort(key=lambda key: abs(key[0] - center_x) + abs(key[1] - center_y))
+        for chunk_x, chunk_y in missing[:limit]:
+            self.get_chunk(chunk_x, chunk_y)
+
+    def chunks_in_rect(self, rect):
+        """Retourne (chunk_x, chunk_y, chunk) pour chaque chunk en mémoire qui recoupe rect"""
+        chunks = []
+        for chunk_y in range(rect.top // self.chunk_size, (rect.bottom - 1) // self.chunk_size + 1):
+            for chunk_x in range(rect.left // self.chunk_size, (rect.right - 1) // self.chunk_size + 1):
+                # Jamais de préparation ici : appelée à chaque collision
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if chunk is not None:
+                    chunks.append((chunk_x, chunk_y, chunk))
+        return chunks
+
+    def draw_floor(self, surface, offset):
+        """Dessine le sol des chunks visibles"""
+        view_rect = pygame.Rect(offset, surface.get_size())
+        surface.blits([(chunk.floor_surface,
+                        (chunk_x * self.chunk_size - offset.x, chunk_y * self.chunk_size - offset.y))
+                       for chunk_x, chunk_y, chunk in self.chunks_in_rect(view_rect)
+                       if chunk.floor_surface is not None],
+                      False)
+
+
+class ChunkedWorld(ChunkCache):
+    """
+    Monde procédural généré par chunks autour du joueur.
+
+    Remplace le TileStore pour les obstacles (même méthode sprites_in_rect)
+    et dessine aussi le sol. Les collisions ne voient que les chunks déjà
+    générés (un chunk pas encore prêt n'a ni obstacle ni sol).
+    """
+
+    def __init__(self, seed, sprite_type="obstacle"):
+        super().__init__(CHUNK_SIZE)
+        self.seed = seed
+        self.sprite_type = sprite_type
+
+        self.floor_colors = np.array(
+            [pygame.Color(color)[:3] for color in WORLD_FLOOR_COLORS],
+            dtype=np.uint8)
+        self.obstacle_images = [asset_loader.image(get_os_adapted_path(folder, file))
+                                for folder, file in WORLD_OBSTACLE_IMAGES]
+        # Pas d'arbres sur les positions de départ du joueur et des ennemis
+        self.clearings = [(x / TILE_SIZE, y / TILE_SIZE) for x, y in
+                          PLAYER_START_POSITION + ENNEMY_START_POSITION]
+
+    def generate(self, chunk_x, chunk_y):
+        """Génère un chunk : grilles NumPy puis image du sol à l'échelle des tuiles"""
+        floor, obstacles = generate_chunk(
+            self.seed, chunk_x, chunk_y, self.chunk_tiles,
+            WORLD_TERRAIN_LEVELS, WORLD_FOREST_TERRAINS,
+            WORLD_TERRAIN_SCALE, WORLD_FOREST_SCALE, WORLD_FOREST_DENSITY,
+            len(self.obstacle_images), self.clearings, WORLD_CLEARING_RADIUS)
+
+        # Une couleur par tuile, agrandie sans lissage à la taille du chunk
+        colors = self.floor_colors[floor]
+        small_surface = pygame.surfarray.make_surface(colors.swapaxes(0, 1))
+        floor_surface = pygame.transform.scale(
+            small_surface, (CHUNK_SIZE, CHUNK_SIZE))
+        if pygame.display.get_surface() is not None:
+            floor_surface = floor_surface.convert()
+        return WorldChunk(floor_surface, obstacles)
+
+    def sprites_in_rect(self, rect):
+        """Retourne les obstacles dont la case recoupe rect"""
+        tiles = []
+        left = rect.left // TILE_SIZE
+        right = (rect.right - 1) // TILE_SIZE
+        top = rect.top // TILE_SIZE
+        bottom = (rect.bottom - 1) // TILE_SIZE
+        for chunk_x, chunk_y, chunk in self.chunks_in_rect(rect):
+            if not chunk.obstacle_count:
+                continue
+            first_column = chunk_x * self.chunk_tiles
+            first_row = chunk_y * self.chunk_tiles
+            # Partie de rect contenue dans ce chunk, en cases locales
+            column_start = max(left - first_column, 0)
+            column_end = min(right - first_column, self.chunk_tiles - 1) + 1
+            row_start = max(top - first_row, 0)
+            row_end = min(bottom - first_row, self.chunk_tiles - 1) + 1
+            window = chunk.obstacles[row_start:row_end, column_start:column_end]
+            for row, column in zip(*np.nonzero(window >= 0)):
+                tiles.append(Tile(
+                    ((first_column + column_start + int(column)) * TILE_SIZE,
+                     (first_row + row_start + int(row)) * TILE_SIZE),
+                    self.sprite_type,
+                    self.obstacle_images[window[row, column]]))
+        return tiles
+
+    def __len__(self):
+        return sum(chunk.obstacle_count for chunk in self.chunks.values())
+
+    def __iter__(self):
+        for (chunk_x, chunk_y), chunk in list(self.chunks.items()):
+            rows, columns = np.nonzero(chunk.obstacles >= 0)
+            for row, column in zip(rows, columns):
+                yield Tile(((chunk_x * self.chunk_tiles + int(column)) * TILE_SIZE,
+                            (chunk_y * self.chunk_tiles + int(row)) * TILE_SIZE),
+                           self.sprite_type,
+                           self.obstacle_images[chunk.obstacles[row, column]])
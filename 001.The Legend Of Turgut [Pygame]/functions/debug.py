@@ -1,6 +1,7 @@
 import pygame
 
-pygame.init()
+# Seul le module des polices est nécessaire (pas de pygame.init() à l'import)
+pygame.font.init()
 _debug_font = pygame.font.Font(None, 24)
 
 # Variable pour stocker un seul message de debug
@@ -1,23 +1,33 @@
 # Calculer la taille de l'ecran
+import os
 import tkinter as tk
 
-# Calculer la taille de l'écran et ajuster les dimensions
+# Taille utilisée quand aucun écran n'est disponible (serveur, --headless)
+DEFAULT_SCREEN_SIZE = (900, 550)
 
 
-def get_screen_dimensions():
-    root = tk.Tk()
+def get_screen_size():
+    """Retourne la taille de l'écran, ou DEFAULT_SCREEN_SIZE sans affichage"""
+    # Pilote SDL factice : pas d'écran, inutile (et impossible) d'ouvrir Tk
+    if os.environ.get("SDL_VIDEODRIVER") == "dummy":
+        return DEFAULT_SCREEN_SIZE
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Error getting screen dimensions: {e}")
+        return DEFAULT_SCREEN_SIZE
     try:
         # Obtenir la taille totale de l'écran
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
+        return root.winfo_screenwidth(), root.winfo_screenheight()
+    finally:
         root.destroy()  # Fermer la fenêtre tkinter
-        # Soustraire 5 pixels de chaque dimension
-        WIDTH = max(screen_width - 100, 1)  # Au moins 1 pixel
-        HEIGHT = max(screen_height - 100, 1)  # Au moins 1 pixel
-    except Exception as e:
-        print(f"Error getting screen dimensions: {e}")
-        # En cas d'erreur, utiliser des dimensions par défaut
-        root.destroy()
 
-        WIDTH, HEIGHT = 800, 450
+# Calculer la taille de l'écran et ajuster les dimensions
+
+
+def get_screen_dimensions(screen_size=None):
+    screen_width, screen_height = screen_size or get_screen_size()
+    # Soustraire 100 pixels de chaque dimension
+    WIDTH = max(screen_width - 100, 1)  # Au moins 1 pixel
+    HEIGHT = max(screen_height - 100, 1)  # Au moins 1 pixel
     return WIDTH, HEIGHT
@@ -0,0 +1,163 @@
+import os
+import json
+import struct
+import pygame
+
+# Ce module ne doit pas importer settings.settings : il est chargé par les
+# processus de travail de preprocess_map.py, et settings crée une fenêtre Tk.
+
+MANIFEST_NAME = "manifest.json"
+
+# Images du monde chargées une seule fois par processus de travail
+_worker_images = {}
+
+
+def get_source_signature(path):
+    """Retourne la taille et la date de modification d'un fichier source"""
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": int(stat.st_mtime)}
+
+
+def init_worker(floor_path, obstacle_path):
+    """Initialise un processus de travail en décodant les images une seule fois"""
+    pygame.init()
+    _worker_images["floor"] = pygame.image.load(floor_path)
+    _worker_images["obstacles"] = pygame.image.load(obstacle_path)
+
+
+def find_obstacle_tiles(surface, tile_size, origin=(0, 0)):
+    """
+    Retourne les positions des tuiles contenant au moins un pixel non transparent.
+
+    Utilise un masque (alpha > 0) plutôt que get_at() pixel par pixel.
+    Ne touche pas à l'affichage : peut tourner hors du thread principal.
+    """
+    surface_mask = pygame.mask.from_surface(surface, 0)
+    tile_mask = pygame.mask.Mask((tile_size, tile_size), fill=True)
+    width, height = surface.get_size()
+    positions = []
+    for y in range(0, height, tile_size):
+        for x in range(0, width, tile_size):
+            if surface_mask.overlap_area(tile_mask, (x, y)) > 0:
+                positions.append((origin[0] + x, origin[1] + y))
+    return positions
+
+
+def _save_layer(layer, rect, output_dir, name):
+    """Enregistre la partie d'une couche couverte par rect, ou None si elle est vide"""
+    clipped = rect.clip(layer.get_rect())
+    if clipped.width == 0 or clipped.height == 0:
+        return None
+    # Chunk entièrement transparent : rien à enregistrer
+    if pygame.mask.from_surface(layer.subsurface(clipped), 0).count() == 0:
+        return None
+    chunk_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+    chunk_surface.blit(layer, (clipped.x - rect.x, clipped.y - rect.y), clipped)
+    pygame.image.save(chunk_surface, os.path.join(output_dir, name))
+    return name
+
+
+def process_chunk(task):
+    """
+    Découpe un chunk du monde et calcule ses tuiles d'obstacles.
+
+    task : (colonne, ligne, chunk_size, tile_size, output_dir)
+    Retourne le dictionnaire décrivant le chunk dans le manifeste.
+    """
+    column, row, chunk_size, tile_size, output_dir = task
+    rect = pygame.Rect(column * chunk_size, row * chunk_size,
+                       chunk_size, chunk_size)
+    obstacles = _worker_images["obstacles"]
+
+    # Masque des pixels non transparents (alpha > 0) sur tout le chunk
+    obstacle_tiles = []
+    clipped = rect.clip(obstacles.get_rect())
+    if clipped.width and clipped.height:
+        obstacle_tiles = [list(position) for position in find_obstacle_tiles(
+            obstacles.subsurface(clipped), tile_size, clipped.topleft)]
+
+    chunk = {
+        "column": column,
+        "row": row,
+        "floor": _save_layer(_worker_images["floor"], rect, output_dir,
+                             f"floor_{column}_{row}.png"),
+        "obstacles": None,
+        "obstacle_tiles": obstacle_tiles,
+    }
+    if obstacle_tiles:
+        chunk["obstacles"] = _save_layer(obstacles, rect, output_dir,
+                                         f"obstacles_{column}_{row}.png")
+    chunk["empty"] = chunk["floor"] is None and not obstacle_tiles
+    return chunk
+
+
+def get_png_size(path):
+    """Lit la taille d'une image PNG dans son en-tête, sans la décoder"""
+    with open(path, "rb") as image_file:
+        header = image_file.read(24)
+    if header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        raise ValueError(f"{path} n'est pas une image PNG")
+    return struct.unpack(">II", header[16:24])
+
+
+def minimap_size(floor_path, scale):
+    """Taille de la minicarte pour un monde de la taille de floor_path"""
+    width, height = get_png_size(floor_path)
+    return (max(width // scale, 1), max(height // scale, 1))
+
+
+def minimap_cache_name(scale):
+    """Nom du fichier de la minicarte en cache : l'échelle fait partie de la clé"""
+    return f"minimap_x{scale}.png"
+
+
+def build_minimap(floor_path, obstacle_path, scale):
+    """Assemble le sol et les obstacles puis réduit le monde d'un facteur scale"""
+    floor = pygame.image.load(floor_path)
+    obstacles = pygame.image.load(obstacle_path)
+    world = pygame.Surface(floor.get_size(), pygame.SRCALPHA)
+    world.blit(floor, (0, 0))
+    world.blit(obstacles, (0, 0))
+    size = (max(world.get_width() // scale, 1),
+            max(world.get_height() // scale, 1))
+    return pygame.transform.smoothscale(world, size)
+
+
+def load_chunk_manifest(output_dir, obstacle_path):
+    """
+    Charge le manifeste des chunks s'il existe et correspond à la carte actuelle.
+
+    Retourne None si le manifeste est absent ou périmé : le jeu revient
+    alors à l'analyse de l'image au démarrage.
+    """
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.isfile(manifest_path):
+        return None
+    try:
+        with open(manifest_path, encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError) as e:
+        print(f"Manifeste de carte illisible : {e}")
+        return None
+    if manifest.get("obstacles_source") != get_source_signature(obstacle_path):
+        return None
+    return manifest
+
+
+def load_obstacle_manifest(output_dir, obstacle_path, tile_size):
+    """Retourne le manifeste s'il est valide et découpé avec la taille de tuile actuelle"""
+    manifest = load_chunk_manifest(output_dir, obstacle_path)
+    if manifest is None or manifest.get("tile_size") != tile_size:
+        return None
+    return manifest
+
+
+def load_map_manifest(output_dir, floor_path, obstacle_path, tile_size):
+    """
+    Retourne le manifeste si les chunks du sol et des obstacles peuvent
+    remplacer les images complètes de la carte (les deux sources inchangées).
+    """
+    manifest = load_obstacle_manifest(output_dir, obstacle_path, tile_size)
+    if manifest is None or manifest.get("floor_source") != get_source_signature(floor_path):
+        return None
+    return manifest
@@ -0,0 +1,94 @@
+import numpy as np
+
+# Génération procédurale du monde par chunks (bruit de valeur fractal).
+# Chaque point du réseau de bruit dépend seulement de la graine et de ses
+# coordonnées : un chunk est identique quel que soit l'ordre de génération,
+# et deux chunks voisins se raccordent sans couture.
+
+
+def hash_lattice(seed, xs, ys):
+    """Retourne une valeur pseudo-aléatoire dans [0, 1) pour chaque point entier (xs, ys)"""
+    with np.errstate(over="ignore"):
+        h = (np.asarray(xs, dtype=np.int64).view(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+             ^ np.asarray(ys, dtype=np.int64).view(np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F)
+             ^ np.uint64(seed & 0xFFFFFFFF) * np.uint64(0x165667B19E3779F9))
+        # Mélange final (splitmix64)
+        h ^= h >> np.uint64(30)
+        h *= np.uint64(0xBF58476D1CE4E5B9)
+        h ^= h >> np.uint64(27)
+        h *= np.uint64(0x94D049BB133111EB)
+        h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+def value_noise(seed, xs, ys, scale):
+    """Bruit de valeur lissé, calculé d'un coup pour toutes les coordonnées"""
+    fx = np.asarray(xs, dtype=np.float64) / scale
+    fy = np.asarray(ys, dtype=np.float64) / scale
+    x0 = np.floor(fx)
+    y0 = np.floor(fy)
+    tx = fx - x0
+    ty = fy - y0
+    # Interpolation adoucie (smoothstep) pour éviter l'effet de grille
+    tx = tx * tx * (3 - 2 * tx)
+    ty = ty * ty * (3 - 2 * ty)
+    x0 = x0.astype(np.int64)
+    y0 = y0.astype(np.int64)
+
+    top_left = hash_lattice(seed, x0, y0)
+    top_right = hash_lattice(seed, x0 + 1, y0)
+    bottom_left = hash_lattice(seed, x0, y0 + 1)
+    bottom_right = hash_lattice(seed, x0 + 1, y0 + 1)
+    top = top_left + (top_right - top_left) * tx
+    bottom = bottom_left + (bottom_right - bottom_left) * tx
+    return top + (bottom - top) * ty
+
+
+def fractal_noise(seed, xs, ys, scale, octaves=4, persistence=0.5):
+    """Somme de plusieurs octaves de bruit, normalisée dans [0, 1)"""
+    total = np.zeros(np.shape(xs), dtype=np.float64)
+    amplitude = 1.0
+    amplitude_sum = 0.0
+    for octave in range(octaves):
+        total += value_noise(seed + octave, xs, ys, scale) * amplitude
+        amplitude_sum += amplitude
+        amplitude *= persistence
+        scale = max(scale / 2, 1)
+    return total / amplitude_sum
+
+
+def generate_chunk(seed, chunk_x, chunk_y, chunk_tiles, terrain_levels,
+                   forest_terrains, terrain_scale, forest_scale,
+                   forest_density, obstacle_variants, clearings=(),
+                   clearing_radius=0):
+    """
+    Génère les grilles d'un chunk, en coordonnées de tuiles.
+
+    Retourne (floor, obstacles) : deux tableaux chunk_tiles x chunk_tiles
+    indexés [ligne, colonne]. floor contient le type de sol (nombre de
+    seuils de terrain_levels dépassés), obstacles l'image de l'obstacle ou
+    -1 si la case est libre. Les cases à moins de clearing_radius tuiles
+    d'un point de clearings restent toujours libres.
+    """
+    columns = np.arange(chunk_tiles) + chunk_x * chunk_tiles
+    rows = np.arange(chunk_tiles) + chunk_y * chunk_tiles
+    xs, ys = np.meshgrid(columns, rows)
+
+    height = fractal_noise(seed, xs, ys, terrain_scale)
+    floor = np.digitize(height, terrain_levels).astype(np.uint8)
+
+    # Forêts : un second bruit, seulement sur les sols autorisés
+    forest = fractal_noise(seed + 1000, xs, ys, forest_scale, octaves=3)
+    has_obstacle = (forest > 1 - forest_density) & np.isin(floor, forest_terrains)
+
+    if len(clearings) and clearing_radius > 0:
+        points = np.asarray(clearings, dtype=np.float64)
+        dx = xs[..., None] + 0.5 - points[:, 0]
+        dy = ys[..., None] + 0.5 - points[:, 1]
+        near = ((dx * dx + dy * dy) < clearing_radius ** 2).any(axis=-1)
+        has_obstacle &= ~near
+
+    variants = (hash_lattice(seed + 2000, xs, ys) *
+                obstacle_variants).astype(np.int8)
+    obstacles = np.where(has_obstacle, variants, np.int8(-1))
+    return floor, obstacles
@@ -0,0 +1,133 @@
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import pygame
+
+# Cache des grandes images déjà décodées et converties au format de l'écran.
+# Le fichier .raw contient un en-tête puis les pixels bruts non compressés :
+# il est projeté en mémoire (mmap) et relu avec pygame.image.frombuffer,
+# sans aucun décodage PNG.
+
+CACHE_FOLDER = ".cache"
+MAGIC = b"TRAW"
+# magic, format des pixels, largeur, hauteur, mtime (ns) et taille de la source,
+# empreinte du contenu de la source
+HEADER = struct.Struct("<4s8sIIQQ16s")
+# mtime (ns) et taille de la source, réécrits sur place dans l'en-tête
+SOURCE_STAT = struct.Struct("<QQ")
+SOURCE_STAT_OFFSET = struct.calcsize("<4s8sII")
+
+# Les projections mémoire doivent rester ouvertes tant que la surface existe
+_mappings = {}
+
+
+def get_cache_path(source_path):
+    """Retourne le chemin du fichier de cache rangé à côté de l'image source"""
+    folder, file = os.path.split(source_path)
+    return os.path.join(folder, CACHE_FOLDER, file + ".raw")
+
+
+def hash_file(path):
+    """Empreinte du contenu d'un fichier (utilisée si la date a changé)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as source_file:
+        for block in iter(lambda: source_file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def get_pixel_format(surface):
+    """Retourne l'ordre des octets d'une surface 32 bits pour frombuffer/tobytes"""
+    masks = tuple(surface.get_masks())
+    channels = {masks[0]: "R", masks[1]: "G", masks[2]: "B", masks[3]: "A"}
+    shifts = [0x000000FF, 0x0000FF00, 0x00FF0000, 0xFF000000]
+    if sys.byteorder == "big":
+        shifts.reverse()
+    pixel_format = "".join(channels.get(mask, "") for mask in shifts)
+    # Ordres acceptés par pygame.image.frombuffer et tobytes
+    return pixel_format if pixel_format in ("RGBA", "ARGB", "BGRA") else "RGBA"
+
+
+def load_raw_surface(source_path):
+    """
+    Charge une image depuis le cache brut s'il est à jour.
+
+    Retourne la surface (au format de l'écran) ou None si le cache est
+    absent ou périmé. Peut être appelée hors du thread principal.
+    """
+    cache_path = get_cache_path(source_path)
+    if not os.path.isfile(cache_path):
+        return None
+    try:
+        source_stat = os.stat(source_path)
+        with open(cache_path, "rb") as cache_file:
+            mapping = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapping) < HEADER.size:
+        mapping.close()
+        return None
+    magic, pixel_format, width, height, mtime_ns, size, source_hash = \
+        HEADER.unpack_from(mapping, 0)
+    if magic != MAGIC or len(mapping) != HEADER.size + width * height * 4:
+        mapping.close()
+        return None
+
+    # Date ou taille différente : on ne garde le cache que si le contenu est identique
+    if (mtime_ns, size) != (source_stat.st_mtime_ns, source_stat.st_size):
+        if hash_file(source_path) != source_hash:
+            mapping.close()
+            return None
+        # Même contenu : l'en-tête prend la nouvelle date pour ne plus
+        # recalculer l'empreinte aux lancements suivants
+        update_source_stat(cache_path, source_stat)
+
+    pixels = memoryview(mapping)[HEADER.size:]
+    surface = pygame.image.frombuffer(
+        pixels, (width, height), pixel_format.rstrip(b"\0").decode("ascii"))
+    _mappings[os.path.normcase(source_path)] = mapping
+    return surface
+
+
+def update_source_stat(cache_path, source_stat):
+    """Réécrit sur place la date et la taille de la source dans l'en-tête du cache"""
+    try:
+        with open(cache_path, "r+b") as cache_file:
+            cache_file.seek(SOURCE_STAT_OFFSET)
+            cache_file.write(SOURCE_STAT.pack(source_stat.st_mtime_ns,
+                                              source_stat.st_size))
+    except OSError:
+        # Dossier en lecture seule : l'empreinte sera recalculée au prochain lancement
+        pass
+
+
+def save_raw_surface(source_path, surface):
+    """Écrit les pixels d'une surface convertie dans le cache brut"""
+    cache_path = get_cache_path(source_path)
+    source_stat = os.stat(source_path)
+    pixel_format = get_pixel_format(surface)
+    header = HEADER.pack(MAGIC, pixel_format.encode("ascii"),
+                         surface.get_width(), surface.get_height(),
+                         source_stat.st_mtime_ns, source_stat.st_size,
+                         hash_file(source_path))
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Écriture dans un fichier temporaire pour ne jamais laisser un cache tronqué
+    temporary_path = cache_path + ".tmp"
+    with open(temporary_path, "wb") as cache_file:
+        cache_file.write(header)
+        cache_file.write(pygame.image.tobytes(surface, pixel_format))
+    os.replace(temporary_path, cache_path)
+
+
+def release_raw_surface(source_path):
+    """Ferme la projection mémoire d'une image qui n'est plus utilisée"""
+    mapping = _mappings.pop(os.path.normcase(source_path), None)
+    if mapping is not None:
+        try:
+            mapping.close()
+        except BufferError:
+            # Encore référencée par une surface : fermée par le ramasse-miettes
+            pass
@@ -0,0 +1,157 @@
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+from settings.settings import *
+from classes.replay import ACTION_LEFT, ACTION_RIGHT, ACTION_UP, ACTION_DOWN, ACTION_ATTACKS, ACTION_RUN
+from classes.network import (MSG_WELCOME, MSG_INPUT, MSG_SNAPSHOT, MSG_STATS_REQUEST,
+                             MSG_STATS, MSG_FULL, WELCOME, INPUT, STATS,
+                             pack_message, read_message, decode_snapshot)
+
+# Test de charge du serveur multijoueur : N clients simulés envoient des
+# actions aléatoires et décodent les snapshots reçus.
+# Usage : python load_test.py [--clients 8] [--duration 20] [--no-server]
+
+# server.py est à côté de ce script, quel que soit le répertoire courant
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+MOVES = [0, ACTION_LEFT, ACTION_RIGHT, ACTION_UP, ACTION_DOWN]
+
+
+class SimulatedClient:
+    def __init__(self, index, host, port):
+        self.index = index
+        self.host = host
+        self.port = port
+        self.rng = random.Random(index)
+        self.bytes_received = 0
+        self.snapshots = 0
+        self.baseline_errors = 0  # Snapshots dont la référence n'est pas la bonne
+        self.state = {}
+        self.tick = 0
+        self.server_stats = None
+
+    async def send_inputs(self, writer, tick_rate):
+        """Change d'action de temps en temps, comme un joueur"""
+        actions = 0
+        tick = 0
+        while True:
+            if self.rng.random() < 0.05:
+                actions = self.rng.choice(MOVES)
+                if self.rng.random() < 0.3:
+                    actions |= self.rng.choice(ACTION_ATTACKS)
+                if self.rng.random() < 0.2:
+                    actions |= ACTION_RUN
+            tick += 1
+            writer.write(pack_message(MSG_INPUT, INPUT.pack(tick, actions)))
+            await asyncio.sleep(1 / tick_rate)
+
+    async def run(self, duration, request_stats):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        message_type, payload = await read_message(reader)
+        if message_type == MSG_FULL:
+            print(f"Client {self.index} : partie complète")
+            writer.close()
+            return
+        if message_type != MSG_WELCOME:
+            raise ValueError(f"Message inattendu : {message_type}")
+        _, tick_rate, _ = WELCOME.unpack(payload)
+
+        sender = asyncio.create_task(self.send_inputs(writer, tick_rate))
+        end_time = time.perf_counter() + duration
+        stats_requested = False
+        try:
+            while True:
+                # Pas de délai pendant le test : annuler une lecture à moitié
+                # faite désynchroniserait le flux (un snapshot arrive toutes
+                # les SNAPSHOT_INTERVAL frames de toute façon)
+                timeout = None
+                if time.perf_counter() >= end_time:
+                    if not request_stats or self.server_stats is not None:
+                        break
+                    if not stats_requested:
+                        writer.write(pack_message(MSG_STATS_REQUEST))
+                        stats_requested = True
+                    timeout = 5
+                message_type, payload = await asyncio.wait_for(
+                    read_message(reader), timeout)
+                self.bytes_received += len(payload)
+                if message_type == MSG_SNAPSHOT:
+                    tick, baseline_tick, self.state = decode_snapshot(
+                        self.state, payload)
+                    if baseline_tick != self.tick:
+                        self.baseline_errors += 1
+                    self.tick = tick
+                    self.snapshots += 1
+                elif message_type == MSG_STATS:
+                    self.server_stats = STATS.unpack(payload)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            sender.cancel()
+            writer.close()
+
+
+async def wait_for_server(host, port, timeout):
+    """Attend que le serveur accepte les connexions (le niveau met du temps à charger)"""
+    end_time = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > end_time:
+                raise
+            await asyncio.sleep(0.5)
+
+
+async def load_test(arguments):
+    server_process = None
+    if not arguments.no_server:
+        server_process = await asyncio.create_subprocess_exec(
+            sys.executable, SERVER_SCRIPT, "--host", arguments.host,
+            "--port", str(arguments.port), "--seed", "0")
+    try:
+        await wait_for_server(arguments.host, arguments.port, 60)
+        clients = [SimulatedClient(index, arguments.host, arguments.port)
+                   for index in range(arguments.clients)]
+        await asyncio.gather(*(client.run(arguments.duration, index == 0)
+                               for index, client in enumerate(clients)))
+    finally:
+        if server_process is not None:
+            # pygame intercepte SIGTERM (événement QUIT jamais lu par le
+            # serveur) : kill() est le seul arrêt qui ne bloque pas
+            server_process.kill()
+            await server_process.wait()
+
+    total_bytes = sum(client.bytes_received for client in clients)
+    print(f"{len(clients)} clients pendant {arguments.duration} s :")
+    print(f"  reçu {total_bytes / arguments.duration / 1024:.1f} Ko/s au total, "
+          f"{total_bytes / arguments.duration / len(clients) / 1024:.2f} Ko/s par client")
+    print(f"  {sum(client.snapshots for client in clients)} snapshots, "
+          f"{sum(client.baseline_errors for client in clients)} erreurs de référence, "
+          f"{len(clients[0].state)} entités dans le dernier état")
+    if clients[0].server_stats is not None:
+        ticks, average, maximum, bytes_per_second, connected = clients[0].server_stats
+        print(f"  serveur : {ticks} ticks mesurés, tick moyen {average:.2f} ms, "
+              f"max {maximum:.2f} ms, {bytes_per_second / 1024:.1f} Ko/s envoyés, "
+              f"{connected} clients")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Test de charge du serveur multijoueur")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--no-server", action="store_true",
+                        help="Utilise un serveur déjà lancé")
+    asyncio.run(load_test(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
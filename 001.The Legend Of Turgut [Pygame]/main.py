@@ -1,16 +1,48 @@
-import pygame
+import os
 import sys
+import time
+import random
+import argparse
+
+# Mode sans fenêtre pour rejouer un enregistrement (doit précéder pygame.init())
+if "--headless" in sys.argv:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
 from random import choice
 from settings.settings import *
 from functions.debug import debug
 from functions.get_os_adapted_path import get_os_adapted_path
 from functions.apply_font import apply_font
 from classes.level import Level
+from classes.asset_loader import asset_loader, get_preload_paths
+from classes.replay import InputRecorder, InputReplay, game_clock
 
 
 class Game:
-    def __init__(self):
-        # Initialisation de Pygame
+    def __init__(self, record_path=None, replay_path=None, seed=None):
+        # Enregistrement / relecture des actions pour des parties reproductibles
+        self.recorder = None
+        self.replay = None
+        if replay_path:
+            self.replay = InputReplay(replay_path)
+            seed = self.replay.seed
+        elif seed is None:
+            seed = random.randrange(2 ** 32)
+        if replay_path or record_path:
+            # Même horloge à l'enregistrement et à la relecture : une frame
+            # perdue pendant l'enregistrement ne décale pas les cooldowns
+            game_clock.use_fixed_step()
+        random.seed(seed)
+        if record_path:
+            self.recorder = InputRecorder(record_path, seed)
+        self.frame_times = []
+
+        # Initialisation de Pygame. Sans son, pygame.init() n'ouvre pas le
+        # vrai périphérique audio : le mixer démarre sur le pilote factice
+        if not SOUND_ENABLED:
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
 
         # Configuration de la fenêtre
@@ -23,7 +55,44 @@ class Game:
         # Configuration du jeu
         self.clock = pygame.time.Clock()
         self.running = True
-        self.level = Level()
+        self.level = self._load_level()
+
+    def _load_level(self):
+        """Décode les images en parallèle en affichant un écran de chargement"""
+        obstacle_path = get_os_adapted_path("imagesOfMaps", "mapArbres.png")
+        asset_loader.start(get_preload_paths(), obstacle_path)
+        font = pygame.font.Font(UI_FONT, UI_FONT_SIZE)
+
+        while not asset_loader.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+            self._draw_loading_screen(font, asset_loader.progress())
+            self.clock.tick(30)
+
+        # convert_alpha() doit être appelé sur le thread principal
+        asset_loader.finish()
+        return Level(self.recorder or self.replay)
+
+    def _draw_loading_screen(self, font, progress):
+        """Affiche la barre de progression du chargement"""
+        self.screen.fill((0, 0, 0))
+        bar_rect = pygame.Rect(0, 0, HEALTH_BAR_WIDTH, BAR_HEIGHT)
+        bar_rect.center = self.screen.get_rect().center
+        pygame.draw.rect(self.screen, UI_BORDER_COLOR,
+                         bar_rect.inflate(6, 6), border_radius=5)
+        pygame.draw.rect(self.screen, UI_BACKGROUND_COLOR,
+                         bar_rect, border_radius=5)
+        progress_rect = bar_rect.copy()
+        progress_rect.width = int(bar_rect.width * progress)
+        pygame.draw.rect(self.screen, ENERGY_BAR_COLOR, progress_rect)
+
+        text_surf = font.render(
+            f"CHARGEMENT {int(progress * 100)}%", True, UI_TEXT_COLOR)
+        self.screen.blit(text_surf, text_surf.get_rect(
+            midbottom=(bar_rect.centerx, bar_rect.top - 12)))
+        pygame.display.flip()
 
     def _setup_window(self):
         """Configure l'icône et le titre de la fenêtre"""
@@ -40,20 +109,53 @@ class Game:
         try:
             while self.running:
                 self._handle_events()
+                start_time = time.perf_counter()
                 self._render()
-                self.clock.tick(FPS)
+                game_clock.tick()
+                if self.replay:
+                    # Relecture : aussi vite que possible, temps de frame mesuré
+                    self.frame_times.append(time.perf_counter() - start_time)
+                    if self.replay.finished:
+                        self.running = False
+                else:
+                    self.clock.tick(FPS)
         except Exception as e:
             debug(f"Error: {e}", 10, 30)
         finally:
+            if self.recorder:
+                self.recorder.save()
+            if self.replay:
+                self._print_replay_stats()
             pygame.quit()
             sys.exit()
 
+    def _print_replay_stats(self):
+        """Affiche les temps de frame mesurés pendant la relecture"""
+        if not self.frame_times:
+            return
+        frame_times = sorted(self.frame_times)
+        average = sum(frame_times) / len(frame_times)
+        print(f"Replay : {len(frame_times)} frames, "
+              f"moyenne {average * 1000:.2f} ms, "
+              f"médiane {frame_times[len(frame_times) // 2] * 1000:.2f} ms, "
+              f"max {frame_times[-1] * 1000:.2f} ms")
+
     def _handle_events(self):
         """Gère les événements du jeu"""
         for event in pygame.event.get():
             # si la touche échappe est pressée, on quitte le jeu
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self.running = False
+            # F5 : sauvegarde rapide, F9 : chargement rapide. Désactivés pendant
+            # un enregistrement ou un replay : ils ne sont pas dans le masque
+            # des actions et l'état chargé ferait diverger la relecture
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_F5, pygame.K_F9):
+                if self.recorder or self.replay:
+                    print("Sauvegarde rapide désactivée pendant un enregistrement ou un replay")
+                elif event.key == pygame.K_F5:
+                    self.level.quick_save()
+                else:
+                    self.level.quick_load()
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -64,6 +166,20 @@ class Game:
         pygame.display.flip()
 
 
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="The Legend of Turgut")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="Enregistre les actions de la partie")
+    parser.add_argument("--replay", metavar="FICHIER",
+                        help="Rejoue un enregistrement puis quitte")
+    parser.add_argument("--seed", type=int,
+                        help="Graine du hasard (ignorée avec --replay)")
+    parser.add_argument("--headless", action="store_true",
+                        help="Sans fenêtre ni son (pour --replay)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    game = Game()
+    arguments = parse_arguments()
+    game = Game(arguments.record, arguments.replay, arguments.seed)
     game.run()
@@ -0,0 +1,92 @@
+import os
+import sys
+import json
+import time
+import argparse
+import pygame
+from concurrent.futures import ProcessPoolExecutor
+from functions.get_os_adapted_path import get_os_adapted_path
+from functions.map_chunks import (MANIFEST_NAME, build_minimap,
+                                  get_source_signature, init_worker,
+                                  minimap_cache_name, process_chunk)
+
+# Outil hors ligne : découpe les images du monde en chunks, calcule les
+# tuiles d'obstacles de chaque chunk et génère la minicarte.
+# Usage : python preprocess_map.py [--workers N] [--chunk-size 256]
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Prétraitement des cartes de The Legend of Turgut")
+    parser.add_argument("--floor", default=get_os_adapted_path(
+        "imagesOfMaps", "mapFloor.png"), help="Image du sol")
+    parser.add_argument("--obstacles", default=get_os_adapted_path(
+        "imagesOfMaps", "mapArbres.png"), help="Image des obstacles")
+    parser.add_argument("--output", default=None,
+                        help="Dossier de sortie des chunks")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Taille d'un chunk en pixels")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Nombre de processus (par défaut : nombre de coeurs)")
+    return parser.parse_args()
+
+
+def main():
+    # Import ici : settings crée une fenêtre Tk et ne doit pas être rechargé
+    # par chaque processus de travail
+    from settings.settings import TILE_SIZE, CHUNK_SIZE, MAP_CHUNKS_FOLDER, MINIMAP_SCALE
+
+    arguments = parse_arguments()
+    chunk_size = arguments.chunk_size or CHUNK_SIZE
+    output_dir = arguments.output or get_os_adapted_path(
+        "imagesOfMaps", MAP_CHUNKS_FOLDER)
+    if chunk_size % TILE_SIZE != 0:
+        sys.exit(f"La taille d'un chunk doit être un multiple de {TILE_SIZE}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    start_time = time.perf_counter()
+    pygame.init()
+    floor_size = pygame.image.load(arguments.floor).get_size()
+    obstacle_size = pygame.image.load(arguments.obstacles).get_size()
+    world_width = max(floor_size[0], obstacle_size[0])
+    world_height = max(floor_size[1], obstacle_size[1])
+    columns = -(-world_width // chunk_size)
+    rows = -(-world_height // chunk_size)
+
+    tasks = [(column, row, chunk_size, TILE_SIZE, output_dir)
+             for row in range(rows) for column in range(columns)]
+
+    # Chaque processus décode les images une seule fois puis traite ses chunks
+    with ProcessPoolExecutor(max_workers=arguments.workers,
+                             initializer=init_worker,
+                             initargs=(arguments.floor, arguments.obstacles)) as executor:
+        chunks = list(executor.map(process_chunk, tasks,
+                                   chunksize=max(len(tasks) // 64, 1)))
+
+    minimap = build_minimap(arguments.floor, arguments.obstacles, MINIMAP_SCALE)
+    pygame.image.save(minimap, os.path.join(
+        output_dir, minimap_cache_name(MINIMAP_SCALE)))
+
+    manifest = {
+        "tile_size": TILE_SIZE,
+        "chunk_size": chunk_size,
+        "world_size": [world_width, world_height],
+        "columns": columns,
+        "rows": rows,
+        "floor_source": get_source_signature(arguments.floor),
+        "obstacles_source": get_source_signature(arguments.obstacles),
+        "minimap": minimap_cache_name(MINIMAP_SCALE),
+        "chunks": chunks,
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+    empty_chunks = sum(1 for chunk in chunks if chunk["empty"])
+    obstacle_tiles = sum(len(chunk["obstacle_tiles"]) for chunk in chunks)
+    print(f"{len(chunks)} chunks ({empty_chunks} vides), "
+          f"{obstacle_tiles} tuiles d'obstacles, "
+          f"{time.perf_counter() - start_time:.2f} s -> {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
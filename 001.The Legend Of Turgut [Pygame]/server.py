@@ -0,0 +1,42 @@
+import os
+import random
+import asyncio
+import argparse
+
+# Le serveur simule le niveau sans fenêtre ni son (doit précéder pygame.init())
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+from settings.settings import *
+from classes.server import GameServer
+
+# Serveur multijoueur local : les clients se connectent en TCP et reçoivent
+# l'état du monde sous forme de snapshots différentiels.
+# Usage : python server.py [--host 127.0.0.1] [--port 5050] [--seed 42]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serveur multijoueur de The Legend of Turgut")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--seed", type=int, help="Graine du hasard")
+    arguments = parser.parse_args()
+
+    random.seed(arguments.seed)
+    pygame.init()
+    # Le niveau a besoin d'une surface d'affichage, même invisible
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    server = GameServer(arguments.host, arguments.port)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
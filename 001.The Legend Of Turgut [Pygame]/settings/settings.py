@@ -1,15 +1,13 @@
-import tkinter as tk
-from functions.get_screen_dimensions import get_screen_dimensions
+from functions.get_screen_dimensions import get_screen_size, get_screen_dimensions
 from functions.get_os_adapted_path import get_os_adapted_path
 # Ce fichier contient les paramètres de configuration du jeu {Variables globales}
-root = tk.Tk()
 UI_FONT = get_os_adapted_path("font", "retro.ttf")
 UI_FONT_SIZE = 18
 # Couleur de fond de l'UI
 BAR_HEIGHT = 24  # Hauteur de la barre d'UI
 # Calculer la taille de l'écran et ajuster les dimensions
-SCREEN_WIDTH = root.winfo_screenwidth()
-SCREEN_HEIGHT = root.winfo_screenheight()
+# (taille par défaut sans affichage : serveur et replays --headless)
+SCREEN_WIDTH, SCREEN_HEIGHT = get_screen_size()
 # 40% de la taille de l'écran
 HEALTH_BAR_WIDTH = int(SCREEN_WIDTH * 0.4)  # Largeur de la barre de vie
 ENEGY_BAR_WIDTH = int(SCREEN_WIDTH * 0.4)  # Largeur de la barre de mana
@@ -21,11 +19,42 @@ HEALTH_BAR_COLOR = "#9C1E1E"  # Couleur de la barre de vie
 ENERGY_BAR_COLOR = "#3B1C84"  # Couleur de la barre de mana
 UI_BORDER_COLOR_ACTIVE = "gold"
 # Utilisation de la fonction pour obtenir les dimensions de l'écran
-WIDTH, HEIGHT = get_screen_dimensions()
+WIDTH, HEIGHT = get_screen_dimensions((SCREEN_WIDTH, SCREEN_HEIGHT))
 # Images par seconde
 FPS = 60
+# Préchargement des images pendant l'écran de chargement
+LOADER_THREADS = 4
+PRELOAD_FOLDERS = ["ImagesOfTurgut", "imagesOfEnnemies", "assets"]
+PRELOAD_FILES = [("imagesOfMaps", "mapFloor.png"),
+                 ("imagesOfMaps", "mapArbres.png")]
+PRELOAD_EXCLUDE = ["AllImages.png", "AllSprites.png"]  # Planches non utilisées
+# Images à partir de cette taille (en pixels) gardées dans le cache brut .cache/
+RAW_CACHE_MIN_PIXELS = 1024 * 1024
 # Taille de la tuile
 TILE_SIZE = 16
+# Prétraitement de la carte (preprocess_map.py)
+CHUNK_SIZE = 256  # Taille d'un chunk en pixels (multiple de TILE_SIZE)
+MAP_CHUNKS_FOLDER = "chunks"  # Sous-dossier de imagesOfMaps
+# Monde procédural (remplace mapFloor.png / mapArbres.png si activé)
+PROCEDURAL_WORLD = False
+WORLD_SEED = None  # None : graine tirée du module random (replays reproductibles)
+WORLD_LOAD_RADIUS = 2  # Chunks préparés autour du joueur (au minimum : tout l'écran l'est)
+WORLD_MAX_CHUNKS = 64  # Chunks gardés en mémoire (les plus anciens sont oubliés)
+WORLD_CHUNKS_PER_FRAME = 1  # Chunks préparés à l'avance par frame
+WORLD_TERRAIN_SCALE = 48  # Taille des reliefs en tuiles
+WORLD_TERRAIN_LEVELS = [0.35, 0.42, 0.65]  # Seuils eau / sable / herbe / herbe haute
+WORLD_FLOOR_COLORS = ["#3A6EA5", "#D8C48A", "#5E9E3F", "#477A2F"]
+WORLD_FOREST_TERRAINS = [2, 3]  # Sols sur lesquels poussent les arbres
+WORLD_FOREST_SCALE = 24
+WORLD_FOREST_DENSITY = 0.35  # Part approximative des cases boisées
+WORLD_CLEARING_RADIUS = 4  # Clairière (en tuiles) autour des positions de départ
+WORLD_OBSTACLE_IMAGES = [("assets", "Layer 1_sprite_1.png"),
+                         ("assets", "Layer 1_sprite_6.png"),
+                         ("assets", "Layer 1_sprite_9.png")]
+MINIMAP_SCALE = 16  # Facteur de réduction du monde pour la minicarte
+MINIMAP_MARKER_SIZE = 3  # Taille des marqueurs de la minicarte en pixels
+MINIMAP_PLAYER_COLOR = "gold"
+MINIMAP_ENEMY_COLOR = "#9C1E1E"
 # Vitesse du joueur
 PLAYER_SPEED = 2
 PLAYER_RUN_SPEED = 4
@@ -41,6 +70,49 @@ PLAYER_HITBOX_OFFSET = 4
 PLAYER_START_POSITION = [(662, 615), (1591, 439), (1274, 817), (854, 1319), (1206, 1393), (913, 1587), (2287, 2139), (844, 2105), (1413, 2107), (1725, 1924), (1856, 2477), (2441, 31900), (
     2559, 2367), (1952, 3317)]
 ENNEMY_START_POSITION = [(1295, 382), (1342, 382), (1389, 382), (1436, 382)]
+# Taille des cellules de la grille spatiale (détection des coups)
+GRID_CELL_SIZE = 64
+# Sauvegardes (dossier relatif à la racine du jeu)
+SAVE_FOLDER = "saves"
+QUICK_SAVE_FILE = "quicksave.sav"
+AUTO_SAVE_FILE = "autosave.sav"
+AUTOSAVE_INTERVAL = 30000  # Millisecondes entre deux sauvegardes automatiques
+# Vagues d'ennemis : délai (ms) avant la vague et nombre d'ennemis par type.
+# Une fois la liste épuisée, la dernière vague se répète.
+ENEMY_WAVES = [
+    {"delay": 0, "enemies": {"ennemy1": 5}},
+    {"delay": 30000, "enemies": {"ennemy1": 5, "ennemy2": 3}},
+    {"delay": 30000, "enemies": {"ennemy2": 5, "ennemy3": 3}},
+    {"delay": 45000, "enemies": {"ennemy3": 5, "ennemy4": 3}},
+]
+MAX_ENEMIES = 60  # Budget maximal d'ennemis vivants
+MIN_ENEMIES = 5  # Le budget ne descend jamais en dessous
+MAX_SPAWNS_PER_FRAME = 2  # Apparitions étalées sur plusieurs frames
+# Particules (tableaux NumPy mis à jour en une seule opération par frame)
+PARTICLE_CAPACITY = 4096  # Nombre maximal de particules vivantes
+PARTICLE_SIZE = 2  # Côté d'une particule en pixels (avant le zoom)
+PARTICLE_FADE_STEPS = 8  # Niveaux de transparence pré-rendus
+PARTICLE_GRAVITY = 0.05
+PARTICLE_DRAG = 0.95  # Ralentissement appliqué à chaque frame
+# Traînée de l'arme (émise chaque frame) et éclats quand un ennemi est touché
+PARTICLE_TRAIL = {"count": 3, "speed": 0.6, "lifetime": 18,
+                  "colors": [(200, 200, 210), (150, 150, 160)]}
+PARTICLE_IMPACT = {"count": 40, "speed": 2.5, "lifetime": 30,
+                   "colors": [(200, 30, 30), (240, 120, 40), (255, 220, 80)]}
+# Serveur multijoueur (server.py) et test de charge (load_test.py)
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 5050
+SERVER_MAX_PLAYERS = 8
+SNAPSHOT_INTERVAL = 3  # Ticks entre deux snapshots (20 par seconde à 60 FPS)
+SERVER_MAX_BUFFER = 64 * 1024  # Octets en attente au-delà desquels un client est sauté
+SERVER_STATS_INTERVAL = 5000  # Millisecondes entre deux mesures du serveur
+# Temps entre deux attaques d'un ennemi en millisecondes
+ENNEMY_ATTACK_COOLDOWN = 1000
+# Paramètres audio
+SOUND_ENABLED = True  # False : aucun périphérique audio ouvert ni son chargé (voir main.py)
+SOUND_VOLUME = 0.5
+AUDIO_CHANNELS = 8  # Nombre de canaux réservés aux effets sonores
+AUDIO_MAX_SAME_SOUND = 3  # Lectures simultanées maximales d'un même son
 WEAPON_DATA = {
     "attack1": {  # Attaque en cercle
         "name": "Hache1",
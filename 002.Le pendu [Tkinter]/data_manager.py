@@ -4,8 +4,17 @@ Ce module s'occupe du chargement des mots et de la gestion des statistiques.
 """
 
 import json
+import sqlite3
+import struct
 import unicodedata
 import os
+from word_store import WordStore, construire_index
+from word_index import WordIndex
+from stats_store import StatsStore, JOUEUR_PAR_DEFAUT
+
+# Nombre de parties dans le journal au-delà duquel il est intégré
+# (compacté) dans le fichier des statistiques
+SEUIL_COMPACTAGE = 50
 
 
 def normaliser_texte(texte):
@@ -50,14 +59,80 @@ class DataManager:
         # Chemin du fichier contenant la liste des mots
         self.fichier_mots = "mots.json"
 
+        # Index binaire compilé depuis mots.json (voir word_store.py)
+        self.fichier_index = "mots.idx"
+
         # Chemin du fichier des statistiques
         self.fichier_stats = "statistiques_pendu.json.json"
 
+        # Journal des parties jouées depuis la dernière sauvegarde complète
+        # (ancien format : relu avec le fichier des statistiques, plus écrit)
+        self.fichier_journal = "statistiques_pendu.jsonl"
+        self.nb_parties_journal = 0  # Parties dans le journal
+
+        # Base SQLite des statistiques de tous les joueurs (voir stats_store.py).
+        # Les fichiers JSON ne servent plus que si la base est inutilisable,
+        # et pour reprendre les anciennes statistiques.
+        self.fichier_base = "statistiques_pendu.db"
+        self.stats_store = None
+        self.joueur = JOUEUR_PAR_DEFAUT
+
+        # Parties pas encore enregistrées dans la base (base inutilisable) :
+        # une ligne JSON par partie, reprise dans la base à la prochaine
+        # ouverture réussie, puis le fichier est supprimé
+        self.fichier_attente = "statistiques_pendu_attente.jsonl"
+
         # Variables pour stocker les données en mémoire
-        self.mots = []  # Liste des mots chargés
+        self.mots = []  # Liste des mots chargés (ou WordStore)
+        # Index des mots par longueur, lettres et difficulté (voir word_index.py)
+        self.index_mots = None
         self.statistiques = {}  # Dictionnaire des statistiques
 
     def charger_mots(self):
+        """
+        Charge la liste des mots depuis l'index binaire mots.idx.
+        L'index est (re)construit si mots.json est plus récent.
+        En cas de problème avec l'index, les mots sont lus dans mots.json.
+
+        Returns:
+            list: Liste des mots chargés (WordStore), ou liste vide en cas d'erreur
+        """
+        # Vérifie si le fichier existe
+        if not os.path.exists(self.fichier_mots):
+            print(f"Erreur : Le fichier {self.fichier_mots} n'existe pas.")
+            return []
+
+        try:
+            self.mots = self.ouvrir_index()
+            self.index_mots = self.mots.lire_index()
+            print(f"✓ {len(self.mots)} mots chargés depuis l'index.")
+            return self.mots
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Index des mots indisponible ({e}), lecture de mots.json.")
+            self.charger_mots_json()
+            # L'index de difficulté est alors calculé en mémoire
+            self.index_mots = WordIndex.construire(
+                [normaliser_texte(mot) for mot in self.mots])
+            return self.mots
+
+    def ouvrir_index(self):
+        """
+        Ouvre l'index binaire des mots, en le construisant s'il est absent ou périmé.
+
+        Returns:
+            WordStore: Les mots lus directement dans l'index
+        """
+        if os.path.exists(self.fichier_index):
+            try:
+                return WordStore(self.fichier_index, self.fichier_mots)
+            except ValueError:
+                pass  # Index périmé : on le reconstruit
+
+        nombre = construire_index(self.fichier_mots, self.fichier_index)
+        print(f"✓ Index des mots construit ({nombre} mots).")
+        return WordStore(self.fichier_index, self.fichier_mots)
+
+    def charger_mots_json(self):
         """
         Charge la liste des mots depuis le fichier mots.json.
 
@@ -65,11 +140,6 @@ class DataManager:
             list: Liste des mots chargés, ou liste vide en cas d'erreur
         """
         try:
-            # Vérifie si le fichier existe
-            if not os.path.exists(self.fichier_mots):
-                print(f"Erreur : Le fichier {self.fichier_mots} n'existe pas.")
-                return []
-
             # Ouvre et lit le fichier JSON
             with open(self.fichier_mots, 'r', encoding='utf-8') as fichier:
                 data = json.load(fichier)
@@ -94,9 +164,105 @@ class DataManager:
             print(f"Erreur inattendue lors du chargement des mots : {e}")
             return []
 
+    def obtenir_mot_normalise(self, index):
+        """
+        Retourne la forme normalisée d'un mot (précalculée dans l'index).
+
+        Args:
+            index (int): Position du mot dans self.mots
+
+        Returns:
+            str: Le mot normalisé (majuscules, sans accents)
+        """
+        if isinstance(self.mots, WordStore):
+            return self.mots.mot_normalise(index)
+        return normaliser_texte(self.mots[index])
+
     def charger_stats(self):
         """
-        Charge les statistiques depuis le fichier.
+        Charge les statistiques du joueur depuis la base SQLite.
+        À la première utilisation, les statistiques du fichier JSON sont
+        reprises dans la base pour le joueur par défaut, puis les parties en
+        attente (jouées pendant une panne de la base) y sont enregistrées.
+        Si la base est inutilisable, les statistiques sont lues dans les
+        fichiers JSON, complétées par les parties en attente du joueur.
+
+        Returns:
+            dict: Dictionnaire contenant les statistiques
+        """
+        try:
+            if self.stats_store is None:
+                self.stats_store = StatsStore(self.fichier_base)
+
+            if (self.joueur == JOUEUR_PAR_DEFAUT
+                    and self.stats_store.statistiques(self.joueur)["parties_jouees"] == 0
+                    and os.path.exists(self.fichier_stats)):
+                if self.stats_store.importer(self.joueur, self.charger_stats_json()):
+                    print("✓ Anciennes statistiques reprises dans la base.")
+
+            self.reprendre_parties_en_attente()
+            self.statistiques = self.stats_store.statistiques(self.joueur)
+            print(f"✓ Statistiques de {self.joueur} chargées.")
+            return self.statistiques
+
+        except sqlite3.Error as e:
+            print(f"Base des statistiques indisponible ({e}), lecture des fichiers JSON.")
+            self.stats_store = None
+            self.charger_stats_json()
+            for partie in self.lire_parties_en_attente():
+                if partie["joueur"] == self.joueur:
+                    self.appliquer_partie(
+                        partie["victoire"], partie["mot"], partie["erreurs"])
+            return self.statistiques
+
+    def lire_parties_en_attente(self):
+        """
+        Lit les parties en attente d'enregistrement dans la base.
+        Une dernière ligne incomplète (arrêt pendant l'écriture) est ignorée.
+
+        Returns:
+            list: Parties (dictionnaires joueur, mot, victoire, erreurs, propositions)
+        """
+        parties = []
+        if not os.path.exists(self.fichier_attente):
+            return parties
+        try:
+            with open(self.fichier_attente, 'r', encoding='utf-8') as fichier:
+                for ligne in fichier:
+                    try:
+                        parties.append(json.loads(ligne))
+                    except json.JSONDecodeError:
+                        continue  # Ligne incomplète
+        except OSError as e:
+            print(f"Erreur lors de la lecture des parties en attente : {e}")
+        return parties
+
+    def reprendre_parties_en_attente(self):
+        """
+        Enregistre dans la base les parties en attente (une seule transaction)
+        puis supprime le fichier.
+
+        Raises:
+            sqlite3.Error: Si la base refuse les parties (le fichier est gardé)
+        """
+        parties = self.lire_parties_en_attente()
+        if not parties:
+            return
+        self.stats_store.enregistrer_parties([
+            (partie["joueur"], partie["mot"], partie["victoire"], partie["erreurs"],
+             partie.get("propositions", ()))
+            for partie in parties])
+        try:
+            os.remove(self.fichier_attente)
+        except OSError as e:
+            # Les parties seraient enregistrées deux fois au prochain lancement
+            print(f"Impossible de supprimer {self.fichier_attente} : {e}")
+        print(f"✓ {len(parties)} partie(s) en attente enregistrée(s) dans la base.")
+
+    def charger_stats_json(self):
+        """
+        Charge les statistiques depuis le fichier, puis rejoue les parties
+        du journal enregistrées depuis.
         Si le fichier n'existe pas, initialise des statistiques par défaut.
 
         Returns:
@@ -107,32 +273,28 @@ class DataManager:
             if os.path.exists(self.fichier_stats):
                 with open(self.fichier_stats, 'r', encoding='utf-8') as fichier:
                     self.statistiques = json.load(fichier)
+                    # Ensemble en mémoire : test d'appartenance en temps constant
+                    self.statistiques["mots_trouves"] = set(
+                        self.statistiques.get("mots_trouves", []))
                     print("✓ Statistiques chargées.")
             else:
                 # Initialise des statistiques par défaut
-                self.statistiques = {
-                    "parties_jouees": 0,      # Nombre total de parties
-                    "parties_gagnees": 0,     # Nombre de parties gagnées
-                    "parties_perdues": 0,     # Nombre de parties perdues
-                    "pourcentage_victoire": 0,  # Pourcentage de victoires
-                    "mot_le_plus_long": "",   # Le mot le plus long trouvé
-                    # Score le plus bas (moins d'erreurs)
-                    "meilleur_score": 0,
-                    "total_erreurs": 0,       # Total des erreurs commises
-                    "mots_trouves": []        # Liste des mots trouvés
-                }
+                self.charger_stats_par_defaut()
                 print("✓ Statistiques initialisées avec les valeurs par défaut.")
 
-            return self.statistiques
-
         except json.JSONDecodeError as e:
             print(f"Erreur lors de la lecture des statistiques : {e}")
-            # Retourne des stats par défaut en cas d'erreur
-            return self.charger_stats_par_defaut()
+            # Statistiques par défaut en cas d'erreur
+            self.charger_stats_par_defaut()
         except Exception as e:
             print(
                 f"Erreur inattendue lors du chargement des statistiques : {e}")
-            return self.charger_stats_par_defaut()
+            self.charger_stats_par_defaut()
+
+        self.rejouer_journal()
+        if self.nb_parties_journal >= SEUIL_COMPACTAGE:
+            self.sauvegarder_stats()
+        return self.statistiques
 
     def charger_stats_par_defaut(self):
         """
@@ -142,37 +304,67 @@ class DataManager:
             dict: Statistiques par défaut
         """
         self.statistiques = {
-            "parties_jouees": 0,
-            "parties_gagnees": 0,
-            "parties_perdues": 0,
-            "pourcentage_victoire": 0,
-            "mot_le_plus_long": "",
+            "parties_jouees": 0,      # Nombre total de parties
+            "parties_gagnees": 0,     # Nombre de parties gagnées
+            "parties_perdues": 0,     # Nombre de parties perdues
+            "pourcentage_victoire": 0,  # Pourcentage de victoires
+            "mot_le_plus_long": "",   # Le mot le plus long trouvé
+            # Score le plus bas (moins d'erreurs)
             "meilleur_score": 0,
-            "total_erreurs": 0,
-            "mots_trouves": []
+            "total_erreurs": 0,       # Total des erreurs commises
+            "mots_trouves": set()     # Mots trouvés (liste dans le fichier)
         }
         return self.statistiques
 
+    def rejouer_journal(self):
+        """
+        Applique aux statistiques les parties du journal qui n'y sont pas encore.
+
+        Chaque ligne porte le numéro de la partie : les lignes déjà comptées
+        dans le fichier des statistiques (compactage interrompu) sont ignorées,
+        ainsi qu'une dernière ligne incomplète (arrêt pendant l'écriture).
+        """
+        self.nb_parties_journal = 0
+        if not os.path.exists(self.fichier_journal):
+            return
+
+        try:
+            with open(self.fichier_journal, 'r', encoding='utf-8') as fichier:
+                for ligne in fichier:
+                    try:
+                        partie = json.loads(ligne)
+                    except json.JSONDecodeError:
+                        continue  # Ligne incomplète
+                    self.nb_parties_journal += 1
+                    if partie["partie"] > self.statistiques["parties_jouees"]:
+                        self.appliquer_partie(
+                            partie["victoire"], partie["mot"], partie["erreurs"])
+        except (OSError, KeyError, TypeError) as e:
+            print(f"Erreur lors de la lecture du journal des statistiques : {e}")
+
     def sauvegarder_stats(self):
         """
-        Sauvegarde les statistiques dans le fichier.
-        Cette méthode est appelée après chaque partie terminée.
+        Sauvegarde toutes les statistiques dans le fichier et vide le journal
+        (compactage). Appelée quand le journal dépasse SEUIL_COMPACTAGE parties.
 
         Returns:
             bool: True si la sauvegarde a réussi, False sinon
         """
         try:
-            # Calcule le pourcentage de victoire
-            if self.statistiques["parties_jouees"] > 0:
-                self.statistiques["pourcentage_victoire"] = round(
-                    (self.statistiques["parties_gagnees"] /
-                     self.statistiques["parties_jouees"]) * 100, 1
-                )
-
-            # Sauvegarde dans le fichier
-            with open(self.fichier_stats, 'w', encoding='utf-8') as fichier:
-                json.dump(self.statistiques, fichier,
+            statistiques = dict(self.statistiques)
+            statistiques["mots_trouves"] = sorted(self.statistiques["mots_trouves"])
+
+            # Écriture dans un fichier temporaire pour ne jamais laisser
+            # des statistiques tronquées
+            fichier_temporaire = self.fichier_stats + ".tmp"
+            with open(fichier_temporaire, 'w', encoding='utf-8') as fichier:
+                json.dump(statistiques, fichier,
                           indent=2, ensure_ascii=False)
+            os.replace(fichier_temporaire, self.fichier_stats)
+
+            # Les parties du journal sont maintenant dans le fichier
+            open(self.fichier_journal, 'w', encoding='utf-8').close()
+            self.nb_parties_journal = 0
 
             print("✓ Statistiques sauvegardées.")
             return True
@@ -181,9 +373,9 @@ class DataManager:
             print(f"Erreur lors de la sauvegarde des statistiques : {e}")
             return False
 
-    def mettre_a_jour_stats(self, victoire, mot_trouve, nb_erreurs):
+    def appliquer_partie(self, victoire, mot_trouve, nb_erreurs):
         """
-        Met à jour les statistiques après une partie.
+        Ajoute le résultat d'une partie aux statistiques en mémoire.
 
         Args:
             victoire (bool): True si le joueur a gagné
@@ -197,9 +389,13 @@ class DataManager:
         if victoire:
             self.statistiques["parties_gagnees"] += 1
 
-            # Ajoute le mot à la liste des mots trouvés (s'il n'y est pas déjà)
-            if mot_trouve not in self.statistiques["mots_trouves"]:
-                self.statistiques["mots_trouves"].append(mot_trouve)
+            if "mots_trouves" in self.statistiques:
+                # Ajoute le mot aux mots trouvés (ensemble : pas de doublon)
+                self.statistiques["mots_trouves"].add(mot_trouve)
+            else:
+                # Totaux lus dans la base, sans la liste des mots : le mot est
+                # compté comme nouveau (la base recompte à la reprise)
+                self.statistiques["nb_mots_trouves"] += 1
 
             # Met à jour le mot le plus long trouvé
             if len(mot_trouve) > len(self.statistiques["mot_le_plus_long"]):
@@ -214,8 +410,104 @@ class DataManager:
         # Ajoute les erreurs au total
         self.statistiques["total_erreurs"] += nb_erreurs
 
-        # Sauvegarde automatiquement
-        self.sauvegarder_stats()
+        # Calcule le pourcentage de victoire
+        self.statistiques["pourcentage_victoire"] = round(
+            (self.statistiques["parties_gagnees"] /
+             self.statistiques["parties_jouees"]) * 100, 1
+        )
+
+    def mettre_a_jour_stats(self, victoire, mot_trouve, nb_erreurs, propositions=()):
+        """
+        Met à jour les statistiques après une partie et l'enregistre
+        (dans la base, ou dans le fichier des parties en attente si la base
+        est inutilisable). Le coût de la sauvegarde ne dépend pas de la
+        taille de l'historique.
+
+        Args:
+            victoire (bool): True si le joueur a gagné
+            mot_trouve (str): Le mot qui était à deviner
+            nb_erreurs (int): Nombre d'erreurs commises
+            propositions (list): (lettre, correcte) dans l'ordre des propositions
+        """
+        if self.stats_store is not None:
+            try:
+                self.stats_store.enregistrer_partie(
+                    self.joueur, mot_trouve, victoire, nb_erreurs, propositions)
+                # Totaux mis à jour par la base : une seule ligne relue
+                self.statistiques = self.stats_store.statistiques(self.joueur)
+                return
+            except sqlite3.Error as e:
+                # Les totaux de la base restent en mémoire, la partie attend
+                # la prochaine ouverture de la base
+                print(f"Base des statistiques indisponible ({e}), partie mise en attente.")
+                self.stats_store = None
+
+        self.appliquer_partie(victoire, mot_trouve, nb_erreurs)
+
+        # Une ligne ajoutée au fichier des parties en attente
+        partie = {
+            "joueur": self.joueur,
+            "mot": mot_trouve,
+            "victoire": victoire,
+            "erreurs": nb_erreurs,
+            "propositions": list(propositions)
+        }
+        try:
+            with open(self.fichier_attente, 'a', encoding='utf-8') as fichier:
+                fichier.write(json.dumps(partie, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde de la partie : {e}")
+
+    def changer_joueur(self, nom):
+        """
+        Change de joueur (créé s'il n'existe pas) et charge ses statistiques.
+
+        Args:
+            nom (str): Nom du joueur (vide = joueur par défaut)
+
+        Returns:
+            str: Nom du joueur retenu
+        """
+        self.joueur = nom.strip() or JOUEUR_PAR_DEFAUT
+        self.charger_stats()
+        return self.joueur
+
+    def obtenir_classement(self, limite=5):
+        """
+        Retourne le classement des joueurs.
+
+        Args:
+            limite (int): Nombre de joueurs retournés
+
+        Returns:
+            list: Tuples (nom, victoires, parties, erreurs moyennes),
+                liste vide sans base de données
+        """
+        if self.stats_store is None:
+            return []
+        try:
+            return self.stats_store.classement(limite)
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la lecture du classement : {e}")
+            return []
+
+    def obtenir_statistiques_mot(self, mot):
+        """
+        Retourne les résultats de tous les joueurs sur un mot.
+
+        Args:
+            mot (str): Le mot (forme originale)
+
+        Returns:
+            dict: Voir StatsStore.statistiques_mot, ou None sans base de données
+        """
+        if self.stats_store is None:
+            return None
+        try:
+            return self.stats_store.statistiques_mot(mot)
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la lecture des statistiques du mot : {e}")
+            return None
 
     def obtenir_statistiques_formatees(self):
         """
@@ -233,6 +525,12 @@ class DataManager:
         else:
             moyenne_erreurs = 0
 
+        # Nombre de mots trouvés : compté par la base, ou ensemble des mots (JSON)
+        if "nb_mots_trouves" in stats:
+            nb_mots_trouves = stats["nb_mots_trouves"]
+        else:
+            nb_mots_trouves = len(stats["mots_trouves"])
+
         # Formate le texte des statistiques
         texte_stats = f"""📊 STATISTIQUES 📊
         
@@ -245,6 +543,24 @@ Mot le plus long trouvé : {stats['mot_le_plus_long'] or 'Aucun'}
 Meilleur score : {stats['meilleur_score']} erreur(s)
 Moyenne d'erreurs : {moyenne_erreurs}
 
-Mots trouvés : {len(stats['mots_trouves'])}"""
+Mots trouvés : {nb_mots_trouves}"""
 
         return texte_stats
+
+    def obtenir_classement_formate(self, limite=5):
+        """
+        Retourne le classement des joueurs sous forme de texte pour l'affichage.
+
+        Args:
+            limite (int): Nombre de joueurs affichés
+
+        Returns:
+            str: Classement formaté, ou texte vide sans base de données
+        """
+        classement = self.obtenir_classement(limite)
+        if not classement:
+            return ""
+        texte_classement = "🏆 CLASSEMENT 🏆\n"
+        for rang, (nom, victoires, parties, erreurs) in enumerate(classement, 1):
+            texte_classement += f"\n{rang}. {nom[:12]} : {victoires}/{parties} ({erreurs} err.)"
+        return texte_classement
@@ -0,0 +1,161 @@
+"""
+Module du cache disque des images d'animation du pendu.
+
+Redimensionner les 63 images (LANCZOS, 284x284 vers 252x252) à chaque
+lancement coûte cher. Chaque animation redimensionnée est donc enregistrée
+une fois dans une planche PNG (les images côte à côte) dans le dossier
+cache_animations/. Le nom de la planche contient une empreinte des
+fichiers sources (chemin, taille, date de modification) et de la taille
+cible : si une image change, la planche est refaite automatiquement.
+
+Ce module n'utilise que PIL (pas Tk) : il peut être appelé depuis un thread.
+"""
+
+import hashlib
+import os
+from PIL import Image
+
+# Dossier des planches, à côté du module
+DOSSIER_CACHE = os.path.join(os.path.dirname(__file__), "cache_animations")
+
+# À changer si le format des planches change (invalide tout le cache)
+VERSION_CACHE = 1
+
+
+def empreinte_images(chemins, taille):
+    """
+    Calcule l'empreinte d'une animation pour une taille donnée.
+
+    Args:
+        chemins (list): Chemins des images sources, dans l'ordre
+        taille (tuple): (largeur, hauteur) des images redimensionnées
+
+    Returns:
+        str: Empreinte hexadécimale (16 caractères)
+
+    Raises:
+        OSError: Si une image source est inaccessible
+    """
+    empreinte = hashlib.sha1(f"{VERSION_CACHE}:{taille[0]}x{taille[1]}".encode())
+    for chemin in chemins:
+        stat = os.stat(chemin)
+        empreinte.update(f"|{os.path.basename(chemin)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return empreinte.hexdigest()[:16]
+
+
+class FrameCache:
+    """
+    Cache des images d'animation redimensionnées.
+    Retourne des images PIL : la création des PhotoImage reste à faire
+    dans le thread de Tk.
+    """
+
+    def __init__(self, taille, dossier_cache=DOSSIER_CACHE):
+        """
+        Initialise le cache.
+
+        Args:
+            taille (tuple): (largeur, hauteur) des images redimensionnées
+            dossier_cache (str): Dossier des planches
+        """
+        self.taille = taille
+        self.dossier_cache = dossier_cache
+
+    def charger(self, nom, chemins):
+        """
+        Retourne les images redimensionnées d'une animation, depuis la
+        planche en cache si elle est à jour, sinon depuis les images sources.
+
+        Args:
+            nom (str): Nom de l'animation (ex : "animation01")
+            chemins (list): Chemins des images sources, dans l'ordre
+
+        Returns:
+            list: Images PIL (RGBA) à la taille du cache
+        """
+        if not chemins:
+            return []
+        try:
+            fichier_planche = os.path.join(
+                self.dossier_cache, f"{nom}_{empreinte_images(chemins, self.taille)}.png")
+        except OSError:
+            return self.redimensionner(chemins)
+
+        if os.path.exists(fichier_planche):
+            try:
+                with Image.open(fichier_planche) as planche:
+                    planche.load()
+                    return self.decouper(planche)
+            except (OSError, ValueError) as e:
+                print(f"Planche {fichier_planche} illisible, reconstruction : {e}")
+
+        images = self.redimensionner(chemins)
+        # Une image en erreur : on ne met pas en cache une animation incomplète
+        if len(images) == len(chemins):
+            self.ecrire_planche(nom, fichier_planche, images)
+        return images
+
+    def redimensionner(self, chemins):
+        """
+        Ouvre et redimensionne les images sources.
+
+        Args:
+            chemins (list): Chemins des images sources
+
+        Returns:
+            list: Images PIL (RGBA) redimensionnées (les images en erreur sont ignorées)
+        """
+        images = []
+        for chemin in chemins:
+            try:
+                with Image.open(chemin) as image:
+                    images.append(image.convert("RGBA").resize(
+                        self.taille, Image.Resampling.LANCZOS))
+            except Exception as e:
+                print(f"Erreur lors du chargement de {chemin}: {e}")
+        return images
+
+    def decouper(self, planche):
+        """
+        Découpe une planche en images.
+
+        Args:
+            planche (Image): Images côte à côte, de la taille du cache
+
+        Returns:
+            list: Images PIL de la planche, de gauche à droite
+        """
+        largeur, hauteur = self.taille
+        if planche.height != hauteur or planche.width % largeur:
+            raise ValueError("dimensions de planche inattendues")
+        return [planche.crop((rang * largeur, 0, (rang + 1) * largeur, hauteur))
+                for rang in range(planche.width // largeur)]
+
+    def ecrire_planche(self, nom, fichier_planche, images):
+        """
+        Enregistre une planche et supprime les anciennes planches de l'animation.
+
+        Args:
+            nom (str): Nom de l'animation
+            fichier_planche (str): Chemin de la planche à écrire
+            images (list): Images redimensionnées
+        """
+        largeur, hauteur = self.taille
+        planche = Image.new("RGBA", (largeur * len(images), hauteur))
+        for rang, image in enumerate(images):
+            planche.paste(image, (rang * largeur, 0))
+
+        try:
+            os.makedirs(self.dossier_cache, exist_ok=True)
+            # Fichier temporaire pour ne jamais laisser une planche tronquée
+            fichier_temporaire = fichier_planche + ".tmp"
+            # Compression faible : la planche est relue à chaque lancement
+            planche.save(fichier_temporaire, format="PNG", compress_level=1)
+            os.replace(fichier_temporaire, fichier_planche)
+
+            for fichier in os.listdir(self.dossier_cache):
+                chemin = os.path.join(self.dossier_cache, fichier)
+                if fichier.startswith(f"{nom}_") and chemin != fichier_planche:
+                    os.remove(chemin)
+        except OSError as e:
+            print(f"Impossible d'écrire le cache des animations : {e}")
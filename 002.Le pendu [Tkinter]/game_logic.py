@@ -5,20 +5,36 @@ Ce module gère l'état du jeu, les propositions de lettres et les dessins ASCII
 
 import random
 import os
+import time
 from data_manager import DataManager, normaliser_texte
+from solver import CandidateEngine
 
 
 class AnimationManager:
     """
     Classe qui gère les animations du pendu.
     Contient les chemins vers les 8 animations (de 0 à 7 erreurs).
+
+    La liste des images de chaque animation (le manifeste) est construite
+    une seule fois : la consulter ne touche plus au disque.
     """
 
-    def __init__(self):
+    # Extensions d'images supportées
+    EXTENSIONS_IMAGES = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+
+    # Intervalle minimum entre deux vérifications des dossiers (secondes)
+    DELAI_SURVEILLANCE = 2.0
+
+    def __init__(self, surveiller=False):
         """
         Initialise les chemins vers les animations du pendu.
         Animation 1 = état initial (0 erreur)
         Animation 7 = fin lors de l'échec (6 erreurs max)
+
+        Args:
+            surveiller (bool): Si True, le manifeste est reconstruit quand
+                un dossier d'animation est modifié (pratique pour créer
+                des animations sans relancer le jeu)
         """
         # Chemin de base vers le dossier images
         self.chemin_images = os.path.join(os.path.dirname(__file__), "images")
@@ -33,6 +49,67 @@ class AnimationManager:
                 self.chemin_images, dossier_animation)
             self.animations.append(chemin_animation)
 
+        self.surveiller = surveiller
+        self.derniere_verification = 0.0
+        self.dates_dossiers = {}  # Dossier -> date de modification au dernier listage
+        self.manifeste = {}       # Niveau (0 à 6 ou "victoire") -> tuple des images
+        self.construire_manifeste()
+
+    def construire_manifeste(self):
+        """
+        Liste une fois les images de chaque animation.
+        """
+        dossiers = {niveau: self.obtenir_chemin_animation(niveau)
+                    for niveau in range(7)}
+        dossiers["victoire"] = self.obtenir_animation_victoire()
+
+        self.dates_dossiers = {dossier: self._date_dossier(dossier)
+                               for dossier in dossiers.values()}
+        self.manifeste = {niveau: self._lister_dossier(dossier)
+                          for niveau, dossier in dossiers.items()}
+
+    def _date_dossier(self, dossier):
+        """Retourne la date de modification d'un dossier (None s'il n'existe pas)"""
+        try:
+            return os.stat(dossier).st_mtime_ns
+        except OSError:
+            return None
+
+    def _lister_dossier(self, dossier_animation):
+        """Retourne le tuple trié des chemins des images d'un dossier"""
+        images = []
+        try:
+            fichiers = os.listdir(dossier_animation)
+            for fichier in sorted(fichiers):  # Tri pour ordre cohérent
+                if fichier.lower().endswith(self.EXTENSIONS_IMAGES):
+                    chemin_complet = os.path.join(dossier_animation, fichier)
+                    images.append(chemin_complet)
+        except OSError:
+            pass  # Dossier absent ou inaccessible
+
+        return tuple(images)
+
+    def verifier_modifications(self):
+        """
+        Reconstruit le manifeste si un dossier d'animation a été modifié
+        (ajout, suppression ou renommage d'image).
+
+        Returns:
+            bool: True si le manifeste a été reconstruit
+        """
+        self.derniere_verification = time.monotonic()
+        if all(self._date_dossier(dossier) == date
+               for dossier, date in self.dates_dossiers.items()):
+            return False
+        self.construire_manifeste()
+        return True
+
+    def _surveiller_dossiers(self):
+        """Vérifie les dossiers au plus une fois par DELAI_SURVEILLANCE (mode surveillance)"""
+        if (self.surveiller and
+                time.monotonic() - self.derniere_verification >= self.DELAI_SURVEILLANCE):
+            self.verifier_modifications()
+
     def obtenir_chemin_animation(self, nb_erreurs):
         """
         Retourne le chemin vers le dossier d'animation correspondant au nombre d'erreurs.
@@ -59,27 +136,10 @@ class AnimationManager:
             nb_erreurs (int): Nombre d'erreurs (0 à 6)
 
         Returns:
-            list: Liste des chemins vers les images de l'animation
+            tuple: Chemins vers les images de l'animation
         """
-        dossier_animation = self.obtenir_chemin_animation(nb_erreurs)
-
-        if not os.path.exists(dossier_animation):
-            return []
-
-        # Extensions d'images supportées
-        extensions_images = {'.png', '.jpg', '.jpeg', '.gif', '.bmp'}
-
-        images = []
-        try:
-            fichiers = os.listdir(dossier_animation)
-            for fichier in sorted(fichiers):  # Tri pour ordre cohérent
-                if any(fichier.lower().endswith(ext) for ext in extensions_images):
-                    chemin_complet = os.path.join(dossier_animation, fichier)
-                    images.append(chemin_complet)
-        except OSError:
-            pass  # Dossier inaccessible
-
-        return images
+        self._surveiller_dossiers()
+        return self.manifeste[min(max(nb_erreurs, 0), 6)]
 
     def obtenir_animation_victoire(self):
         """
@@ -96,27 +156,10 @@ class AnimationManager:
         Retourne la liste des fichiers images dans le dossier d'animation de victoire.
 
         Returns:
-            list: Liste des chemins vers les images de l'animation de victoire
+            tuple: Chemins vers les images de l'animation de victoire
         """
-        dossier_animation = self.obtenir_animation_victoire()
-
-        if not os.path.exists(dossier_animation):
-            return []
-
-        # Extensions d'images supportées
-        extensions_images = {'.png', '.jpg', '.jpeg', '.gif', '.bmp'}
-
-        images = []
-        try:
-            fichiers = os.listdir(dossier_animation)
-            for fichier in sorted(fichiers):  # Tri pour ordre cohérent
-                if any(fichier.lower().endswith(ext) for ext in extensions_images):
-                    chemin_complet = os.path.join(dossier_animation, fichier)
-                    images.append(chemin_complet)
-        except OSError:
-            pass  # Dossier inaccessible
-
-        return images
+        self._surveiller_dossiers()
+        return self.manifeste["victoire"]
 
     def obtenir_dessin(self, nb_erreurs):
         """
@@ -137,12 +180,18 @@ class GameManager:
     Elle s'occupe de l'état du jeu, des propositions de lettres et des conditions de victoire/défaite.
     """
 
-    def __init__(self):
+    def __init__(self, data_manager=None, avec_statistiques=True):
         """
         Initialise le gestionnaire de jeu.
+
+        Args:
+            data_manager (DataManager): Gestionnaire de données partagé avec
+                l'interface (un nouveau est créé si absent)
+            avec_statistiques (bool): False pour ne charger que les mots :
+                aucun fichier de statistiques n'est lu ni créé (simulateur)
         """
         # Gestionnaire de données pour charger les mots et stats
-        self.data_manager = DataManager()
+        self.data_manager = data_manager or DataManager()
 
         # Gestionnaire d'animations
         self.animation_manager = AnimationManager()
@@ -151,9 +200,11 @@ class GameManager:
         self.mot_secret = ""           # Le mot à deviner (normalisé)
         self.mot_original = ""         # Le mot original (avec accents)
         self.mot_affiche = ""          # Le mot affiché avec les lettres trouvées
+        self.lettres_du_mot = set()    # Lettres distinctes du mot secret
         self.lettres_essayees = set()  # Ensemble des lettres déjà essayées
         self.lettres_correctes = set()  # Ensemble des lettres correctes trouvées
         self.lettres_incorrectes = set()  # Ensemble des lettres incorrectes
+        self.historique_lettres = []   # (lettre, correcte) dans l'ordre des propositions
         self.erreurs = 0               # Nombre d'erreurs actuelles
         # Nombre maximum d'erreurs autorisées (7 animations : 0 à 6)
         self.max_erreurs = 6
@@ -163,13 +214,24 @@ class GameManager:
 
         # Charge les données au démarrage
         self.data_manager.charger_mots()
-        self.data_manager.charger_stats()
+        if avec_statistiques:
+            self.data_manager.charger_stats()
 
-    def nouvelle_partie(self):
+        # Moteur d'indices : mots encore possibles et meilleure lettre
+        self.solveur = CandidateEngine(self.data_manager)
+
+    def nouvelle_partie(self, longueur_min=None, longueur_max=None,
+                        difficulte=None, lettres_exclues=""):
         """
         Démarre une nouvelle partie en sélectionnant un mot aléatoire
         et en réinitialisant toutes les variables de jeu.
 
+        Args:
+            longueur_min (int): Nombre de lettres minimum du mot (optionnel)
+            longueur_max (int): Nombre de lettres maximum du mot (optionnel)
+            difficulte (str): "facile", "moyen" ou "difficile" (optionnel)
+            lettres_exclues (str): Lettres que le mot ne doit pas contenir (optionnel)
+
         Returns:
             bool: True si une nouvelle partie a pu commencer, False sinon
         """
@@ -178,26 +240,49 @@ class GameManager:
             print("Erreur : Aucun mot disponible pour jouer.")
             return False
 
-        # Sélectionne un mot aléatoire
-        self.mot_original = random.choice(self.data_manager.mots)
-        self.mot_secret = normaliser_texte(self.mot_original)
+        # Sélectionne un mot aléatoire (forme normalisée déjà calculée dans l'index)
+        if longueur_min or longueur_max or difficulte or lettres_exclues:
+            index = self.data_manager.index_mots.choisir(
+                random, longueur_min, longueur_max, difficulte,
+                normaliser_texte(lettres_exclues))
+            if index is None:
+                print("Erreur : Aucun mot ne correspond à ces critères.")
+                return False
+        else:
+            index = random.randrange(len(self.data_manager.mots))
+        self.commencer_partie(index)
+
+        print(
+            f"✓ Nouvelle partie commencée ! Mot à deviner : {len(self.mot_secret)} lettres")
+        # Pour le développement
+        print(f"Debug - Mot secret : {self.mot_secret}")
+
+        return True
+
+    def commencer_partie(self, index):
+        """
+        Réinitialise le jeu avec un mot donné de la liste (sans message).
+        Utilisé par nouvelle_partie et par le simulateur (simulateur.py).
+
+        Args:
+            index (int): Position du mot dans la liste des mots
+        """
+        self.mot_original = self.data_manager.mots[index]
+        self.mot_secret = self.data_manager.obtenir_mot_normalise(index)
+        self.lettres_du_mot = set(
+            lettre for lettre in self.mot_secret if lettre.isalpha())
 
         # Réinitialise les variables de jeu
         self.lettres_essayees = set()
         self.lettres_correctes = set()
         self.lettres_incorrectes = set()
+        self.historique_lettres = []
         self.erreurs = 0
         self.partie_terminee = False
 
         # Met à jour l'affichage du mot
         self.mettre_a_jour_mot_affiche()
-
-        print(
-            f"✓ Nouvelle partie commencée ! Mot à deviner : {len(self.mot_secret)} lettres")
-        # Pour le développement
-        print(f"Debug - Mot secret : {self.mot_secret}")
-
-        return True
+        self.solveur.demarrer(self.obtenir_motif())
 
     def mettre_a_jour_mot_affiche(self):
         """
@@ -263,10 +348,12 @@ class GameManager:
         self.lettres_essayees.add(lettre)
 
         # Vérifie si la lettre est dans le mot
+        self.historique_lettres.append((lettre, lettre in self.mot_secret))
         if lettre in self.mot_secret:
             # Lettre correcte
             self.lettres_correctes.add(lettre)
             self.mettre_a_jour_mot_affiche()
+            self.solveur.appliquer_lettre(lettre, True, self.obtenir_motif())
 
             # Compte combien de fois la lettre apparaît
             nb_occurrences = self.mot_secret.count(lettre)
@@ -281,6 +368,7 @@ class GameManager:
             # Lettre incorrecte
             self.lettres_incorrectes.add(lettre)
             self.erreurs += 1
+            self.solveur.appliquer_lettre(lettre, False, self.obtenir_motif())
 
             return {
                 "valide": True,
@@ -296,16 +384,13 @@ class GameManager:
         Returns:
             bool: True si le joueur a gagné, False sinon
         """
-        # Récupère toutes les lettres uniques du mot secret
-        lettres_du_mot = set(
-            lettre for lettre in self.mot_secret if lettre.isalpha())
-
         # Vérifie qu'il y a bien des lettres dans le mot
-        if not lettres_du_mot:
+        # (lettres distinctes calculées au début de la partie)
+        if not self.lettres_du_mot:
             return False
 
         # Vérifie si toutes les lettres ont été trouvées
-        return lettres_du_mot.issubset(self.lettres_correctes)
+        return self.lettres_du_mot.issubset(self.lettres_correctes)
 
     def est_perdu(self):
         """
@@ -325,6 +410,40 @@ class GameManager:
         """
         return self.mot_affiche
 
+    def obtenir_motif(self):
+        """
+        Retourne le mot affiché sans les espaces de séparation.
+
+        Exemple : "S A _ N T - _ I _ _ _ _" donne "SA_NT-_I____"
+
+        Returns:
+            str: Le motif du mot
+        """
+        return self.mot_affiche[::2]
+
+    def obtenir_indice(self, nb_exemples=5):
+        """
+        Calcule un indice à partir de ce que voit le joueur uniquement
+        (motif du mot et lettres proposées, jamais le mot secret).
+
+        Le gain est l'information apportée par la lettre conseillée. Tant
+        qu'il reste plus de SEUIL_POSITIONS candidats (solver.py), seule la
+        présence de la lettre est comptée : le gain est alors au plus 1 bit.
+
+        Args:
+            nb_exemples (int): Nombre de mots possibles à retourner
+
+        Returns:
+            dict: Nombre de candidats, exemples, meilleure lettre et son gain (bits)
+        """
+        lettre, gain = self.solveur.meilleure_lettre()
+        return {
+            "candidats": self.solveur.nombre_candidats(),
+            "exemples": self.solveur.obtenir_candidats(nb_exemples),
+            "lettre": lettre,
+            "gain": round(gain, 2)
+        }
+
     def obtenir_lettres_essayees_formatees(self):
         """
         Retourne une chaîne formatée des lettres essayées.
@@ -356,7 +475,7 @@ class GameManager:
         Retourne la liste des images de l'animation correspondant au nombre d'erreurs actuel.
 
         Returns:
-            list: Liste des chemins vers les images de l'animation
+            tuple: Chemins vers les images de l'animation (manifeste en mémoire)
         """
         return self.animation_manager.lister_images_animation(self.erreurs)
 
@@ -374,13 +493,15 @@ class GameManager:
         Retourne la liste des images de l'animation de victoire.
 
         Returns:
-            list: Liste des chemins vers les images de l'animation de victoire
+            tuple: Chemins vers les images de l'animation de victoire (manifeste en mémoire)
         """
         return self.animation_manager.lister_images_animation_victoire()
 
     def obtenir_info_jeu(self):
         """
         Retourne un dictionnaire contenant toutes les informations actuelles du jeu.
+        Appelée à chaque lettre tapée : aucun champ ne lit le disque
+        (les images viennent du manifeste de AnimationManager).
 
         Returns:
             dict: Informations complètes sur l'état du jeu
@@ -415,7 +536,8 @@ class GameManager:
         self.data_manager.mettre_a_jour_stats(
             victoire=victoire,
             mot_trouve=self.mot_original,
-            nb_erreurs=self.erreurs
+            nb_erreurs=self.erreurs,
+            propositions=self.historique_lettres
         )
 
         # Message de fin de partie
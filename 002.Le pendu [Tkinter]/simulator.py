@@ -0,0 +1,213 @@
+"""
+Simulateur de parties du pendu sans interface (auto-jeu).
+
+Des stratégies de choix de lettres jouent des milliers de parties contre
+GameManager.proposer_lettre, réparties sur plusieurs processus. Le résultat
+donne la difficulté de chaque mot (erreurs commises par chaque stratégie)
+et sert aussi de mesure de performance (parties par seconde).
+
+Stratégies disponibles :
+- aleatoire : une lettre non proposée au hasard
+- frequence : les lettres dans l'ordre de leur fréquence dans le dictionnaire
+- entropie  : la meilleure lettre du moteur d'indices (solver.py)
+
+Usage :
+    python simulator.py                          # 2000 mots au hasard, toutes les stratégies
+    python simulator.py --tous --processus 8     # Tout le dictionnaire
+    python simulator.py --strategies entropie --nombre 500 --sortie difficulte.csv
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import multiprocessing
+import os
+import random
+import time
+from game_logic import GameManager
+from solver import ALPHABET
+
+STRATEGIES = ("aleatoire", "frequence", "entropie")
+
+# Partie courante de chaque processus (créée par initialiser_processus)
+jeu = None
+generateur = None
+ordre_frequence = ""
+premiers_coups = {}  # Motif de départ -> première lettre (stratégie entropie)
+
+
+def initialiser_processus(graine):
+    """
+    Prépare un processus de simulation : un GameManager (sans Tk ni
+    statistiques du joueur) et l'ordre des lettres par fréquence.
+
+    Args:
+        graine (int): Graine du hasard (None = aléatoire)
+    """
+    global jeu, generateur, ordre_frequence
+    # Les messages de chargement de chaque processus sont ignorés
+    with contextlib.redirect_stdout(io.StringIO()):
+        jeu = GameManager(avec_statistiques=False)
+    generateur = random.Random(graine)
+
+    # Nombre de mots contenant chaque lettre (masques de l'index)
+    presences = [0] * 26
+    for masque in jeu.data_manager.index_mots.masques:
+        for rang in range(26):
+            if masque >> rang & 1:
+                presences[rang] += 1
+    ordre_frequence = "".join(sorted(ALPHABET, key=lambda lettre: -presences[ord(lettre) - 65]))
+
+
+def choisir_lettre(strategie):
+    """
+    Choisit la prochaine lettre à proposer.
+
+    Args:
+        strategie (str): Une des STRATEGIES
+
+    Returns:
+        str: Lettre à proposer
+    """
+    if strategie == "aleatoire":
+        return generateur.choice([lettre for lettre in ALPHABET
+                                  if lettre not in jeu.lettres_essayees])
+    if strategie == "frequence":
+        return next(lettre for lettre in ordre_frequence
+                    if lettre not in jeu.lettres_essayees)
+
+    # Entropie : le premier coup ne dépend que du motif de départ, il est
+    # donc calculé une seule fois par motif (c'est le calcul le plus long)
+    motif = jeu.obtenir_motif()
+    if not jeu.lettres_essayees and motif in premiers_coups:
+        return premiers_coups[motif]
+    lettre, _ = jeu.solveur.meilleure_lettre()
+    if lettre is None:
+        # Mot absent des candidats (ne devrait pas arriver) : repli sur la fréquence
+        return choisir_lettre("frequence")
+    if not jeu.lettres_essayees:
+        premiers_coups[motif] = lettre
+    return lettre
+
+
+def jouer_partie(tache):
+    """
+    Joue une partie complète sur un mot donné.
+
+    Args:
+        tache (tuple): (position du mot, stratégie)
+
+    Returns:
+        tuple: (position du mot, stratégie, victoire, erreurs, lettres proposées)
+    """
+    index, strategie = tache
+    jeu.commencer_partie(index)
+    while not jeu.est_gagne() and not jeu.est_perdu():
+        jeu.proposer_lettre(choisir_lettre(strategie))
+    # Pas de terminer_partie : les statistiques du joueur ne sont pas modifiées
+    return index, strategie, jeu.est_gagne(), jeu.erreurs, len(jeu.lettres_essayees)
+
+
+def simuler(indices, strategies, nb_processus, graine):
+    """
+    Joue chaque mot avec chaque stratégie, en parallèle.
+
+    Args:
+        indices (list): Positions des mots à jouer
+        strategies (list): Stratégies à comparer
+        nb_processus (int): Nombre de processus de simulation
+        graine (int): Graine du hasard
+
+    Returns:
+        tuple: (résultats, durée en secondes) où résultats associe chaque
+            position de mot à {stratégie: (victoire, erreurs, lettres proposées)}
+    """
+    taches = [(index, strategie) for index in indices for strategie in strategies]
+    resultats = {index: {} for index in indices}
+    debut = time.perf_counter()
+    with multiprocessing.Pool(nb_processus, initialiser_processus, (graine,)) as pool:
+        for index, strategie, victoire, erreurs, coups in pool.imap_unordered(
+                jouer_partie, taches, chunksize=64):
+            resultats[index][strategie] = (victoire, erreurs, coups)
+    return resultats, time.perf_counter() - debut
+
+
+def ecrire_difficultes(fichier_sortie, resultats, strategies, mots, scores):
+    """
+    Écrit la difficulté de chaque mot au format CSV.
+    La difficulté est la moyenne des erreurs des stratégies (0 à 6).
+
+    Args:
+        fichier_sortie (str): Chemin du fichier CSV
+        resultats (dict): Résultats retournés par simuler
+        strategies (list): Stratégies jouées
+        mots (list): Liste des mots (DataManager.mots)
+        scores (array): Scores de rareté des lettres (WordIndex.scores)
+    """
+    with open(fichier_sortie, 'w', encoding='utf-8', newline='') as fichier:
+        ecrivain = csv.writer(fichier)
+        ecrivain.writerow(["mot", "score_lettres"] +
+                          [f"erreurs_{strategie}" for strategie in strategies] +
+                          ["difficulte"])
+        for index in sorted(resultats):
+            erreurs = [resultats[index][strategie][1] for strategie in strategies]
+            ecrivain.writerow([mots[index], f"{scores[index]:.3f}"] + erreurs +
+                              [f"{sum(erreurs) / len(erreurs):.2f}"])
+
+
+def afficher_resume(resultats, strategies, duree):
+    """
+    Affiche le bilan de chaque stratégie et le débit de la simulation.
+
+    Args:
+        resultats (dict): Résultats retournés par simuler
+        strategies (list): Stratégies jouées
+        duree (float): Durée de la simulation en secondes
+    """
+    nb_parties = len(resultats) * len(strategies)
+    print(f"✓ {nb_parties} parties en {duree:.1f} s ({nb_parties / duree:.0f} parties/s)")
+    for strategie in strategies:
+        parties = [resultats[index][strategie] for index in resultats]
+        victoires = sum(1 for victoire, _, _ in parties if victoire)
+        print(f"  {strategie:<10} : {victoires / len(parties) * 100:5.1f} % de victoires, "
+              f"{sum(erreurs for _, erreurs, _ in parties) / len(parties):.2f} erreurs, "
+              f"{sum(coups for _, _, coups in parties) / len(parties):.1f} lettres par partie")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulateur de parties du pendu (auto-jeu)")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES,
+                        default=list(STRATEGIES))
+    parser.add_argument("--nombre", type=int, default=2000,
+                        help="Nombre de mots tirés au hasard")
+    parser.add_argument("--tous", action="store_true",
+                        help="Joue tous les mots du dictionnaire")
+    parser.add_argument("--processus", type=int, default=os.cpu_count())
+    parser.add_argument("--graine", type=int, help="Graine du hasard")
+    parser.add_argument("--sortie", default="difficulte_mots.csv",
+                        help="Fichier CSV des difficultés par mot")
+    arguments = parser.parse_args()
+
+    # Les fichiers de données sont à côté du script
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        jeu_principal = GameManager(avec_statistiques=False)
+    mots = jeu_principal.data_manager.mots
+    if arguments.tous:
+        indices = list(range(len(mots)))
+    else:
+        indices = random.Random(arguments.graine).sample(
+            range(len(mots)), min(arguments.nombre, len(mots)))
+
+    resultats, duree = simuler(indices, arguments.strategies,
+                               arguments.processus, arguments.graine)
+    afficher_resume(resultats, arguments.strategies, duree)
+    ecrire_difficultes(arguments.sortie, resultats, arguments.strategies,
+                       mots, jeu_principal.data_manager.index_mots.scores)
+    print(f"✓ Difficultés écrites dans {arguments.sortie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Module du moteur d'indices (mode solveur) du jeu du pendu.
+
+À partir de ce que voit le joueur (le motif du mot et les lettres déjà
+proposées), le moteur garde la liste des mots encore possibles et propose
+la lettre qui apporte le plus d'information.
+
+Quand le motif n'a que des lettres (cas le plus courant), les candidats
+sont cherchés par une seule expression régulière dans le bloc de texte des
+mots de cette longueur (voir word_index.py). Sinon (tiret, apostrophe),
+ils sont pris dans la tranche de l'index correspondant au nombre de lettres
+du mot, puis filtrés avec les masques de lettres : on ne lit le texte d'un
+mot que s'il a déjà passé les filtres par masque. Après chaque lettre
+proposée, seuls les candidats restants sont refiltrés.
+
+Le premier indice d'une partie utilise les statistiques d'ouverture de
+l'index : aucun mot n'est relu avant la première lettre.
+"""
+
+import itertools
+import math
+import re
+from collections import Counter
+from word_index import compter_lettres, masque_lettres
+
+# Au-delà de ce nombre de candidats, le gain d'information est estimé avec
+# la seule présence des lettres (masques) plutôt qu'avec leurs positions :
+# deux réponses possibles, donc un gain d'au plus 1 bit
+SEUIL_POSITIONS = 2000
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class CandidateEngine:
+    """
+    Liste des mots compatibles avec une partie en cours.
+    Les lettres proposées sont mémorisées et appliquées seulement quand
+    un indice est demandé (rien n'est calculé si le joueur n'en veut pas).
+    """
+
+    def __init__(self, data_manager):
+        """
+        Initialise le moteur.
+
+        Args:
+            data_manager (DataManager): Gestionnaire des mots et de leur index
+        """
+        self.data_manager = data_manager
+        self.motif = ""               # Mot affiché sans espaces ("SA_NT-_I____")
+        self.lettres_correctes = set()
+        self.lettres_incorrectes = set()
+        self.candidats = None         # Liste de (index, mot normalisé), None = pas encore calculée
+        self.lettres_en_attente = []  # Lettres proposées pas encore appliquées
+
+    def demarrer(self, motif):
+        """
+        Démarre une nouvelle partie.
+
+        Args:
+            motif (str): Motif du mot avec "_" pour les lettres cachées
+        """
+        self.motif = motif
+        self.lettres_correctes = set()
+        self.lettres_incorrectes = set()
+        self.candidats = None
+        self.lettres_en_attente = []
+
+    def appliquer_lettre(self, lettre, correcte, motif):
+        """
+        Mémorise le résultat d'une lettre proposée.
+
+        Args:
+            lettre (str): Lettre normalisée proposée
+            correcte (bool): True si la lettre est dans le mot
+            motif (str): Nouveau motif du mot après la proposition
+        """
+        if correcte:
+            self.lettres_correctes.add(lettre)
+        else:
+            self.lettres_incorrectes.add(lettre)
+        self.motif = motif
+        self.lettres_en_attente.append((lettre, correcte))
+
+    def _expression_motif(self):
+        """
+        Expression régulière des mots qui ont exactement les lettres connues
+        aux positions du motif (compilée une fois par calcul, pas par mot).
+        """
+        # Une case cachée contient une lettre ([^\W\d_]) pas encore trouvée
+        case_cachee = "[^\\W\\d_" + "".join(sorted(self.lettres_correctes)) + "]"
+        return re.compile("".join(case_cachee if caractere == "_" else re.escape(caractere)
+                                  for caractere in self.motif))
+
+    def _parcourir_bloc(self, ouverture):
+        """Cherche les candidats (index, mot) d'un motif sans tiret ni apostrophe dans le bloc de sa longueur"""
+        _, _, indices, bloc = ouverture
+        # Une case cachée ne contient ni une lettre trouvée ni une lettre absente
+        interdites = self.lettres_correctes | self.lettres_incorrectes
+        case_cachee = "[^\n" + "".join(sorted(interdites)) + "]"
+        # Ancrée en début de ligne : les autres positions échouent tout de suite
+        expression = re.compile(("^" + "".join(case_cachee if caractere == "_" else caractere
+                                               for caractere in self.motif) + "$").encode('ascii'),
+                                re.MULTILINE)
+        largeur = len(self.motif) + 1  # Mot et fin de ligne
+        for correspondance in expression.finditer(bloc):
+            yield (indices[correspondance.start() // largeur],
+                   correspondance.group().decode('ascii'))
+
+    def _parcourir_tranche(self):
+        """Parcourt la tranche de la bonne longueur et donne les candidats (index, mot)"""
+        index_mots = self.data_manager.index_mots
+        if compter_lettres(self.motif.replace("_", "A")) == len(self.motif):
+            ouverture = index_mots.ouvertures.get(len(self.motif))
+            if ouverture is not None:
+                yield from self._parcourir_bloc(ouverture)
+                return
+
+        masque_requis = masque_lettres("".join(self.lettres_correctes))
+        masque_exclu = masque_lettres("".join(self.lettres_incorrectes))
+        debut, fin = index_mots.longueurs.get(
+            compter_lettres(self.motif.replace("_", "A")), (0, 0))
+
+        correspond = self._expression_motif().fullmatch
+        for position in range(debut, fin):
+            index = index_mots.ordre[position]
+            masque = index_mots.masques[index]
+            if masque & masque_exclu or masque & masque_requis != masque_requis:
+                continue
+            mot = self.data_manager.obtenir_mot_normalise(index)
+            if correspond(mot):
+                yield index, mot
+
+    def _calculer_candidats(self):
+        """Premier calcul : tranche de la bonne longueur puis filtrage par masques"""
+        self.candidats = list(self._parcourir_tranche())
+        self.lettres_en_attente = []
+
+    def _ouverture(self):
+        """
+        Retourne les statistiques d'ouverture de l'index (nombre de candidats,
+        candidats contenant chaque lettre) tant que les candidats ne sont pas
+        calculés, qu'aucune lettre n'est proposée et que le motif n'a que des
+        cases cachées ; sinon None.
+        """
+        if (self.candidats is not None or self.lettres_correctes
+                or self.lettres_incorrectes or self.motif.strip("_")):
+            return None
+        return self.data_manager.index_mots.ouvertures.get(len(self.motif))
+
+    def _mettre_a_jour(self):
+        """Applique les lettres proposées depuis le dernier calcul"""
+        if self.candidats is None:
+            self._calculer_candidats()
+            return
+        if not self.lettres_en_attente:
+            return
+        index_mots = self.data_manager.index_mots
+        for lettre, correcte in self.lettres_en_attente:
+            bit = masque_lettres(lettre)
+            if correcte:
+                # Positions exactes de la lettre dans le motif
+                self.candidats = [(index, mot) for index, mot in self.candidats
+                                  if all((caractere == lettre) == (motif == lettre)
+                                         for caractere, motif in zip(mot, self.motif))]
+            else:
+                self.candidats = [(index, mot) for index, mot in self.candidats
+                                  if not index_mots.masques[index] & bit]
+        self.lettres_en_attente = []
+
+    def obtenir_candidats(self, limite=None):
+        """
+        Retourne les mots (originaux) encore possibles.
+
+        Args:
+            limite (int): Nombre maximum de mots retournés (None = tous)
+
+        Returns:
+            list: Mots compatibles avec la partie en cours
+        """
+        if limite is not None and self._ouverture() is not None:
+            # Début de partie : les premiers mots suffisent, pas toute la tranche
+            candidats = list(itertools.islice(self._parcourir_tranche(), limite))
+        else:
+            self._mettre_a_jour()
+            candidats = self.candidats if limite is None else self.candidats[:limite]
+        return [self.data_manager.mots[index] for index, _ in candidats]
+
+    def nombre_candidats(self):
+        """Retourne le nombre de mots encore possibles"""
+        ouverture = self._ouverture()
+        if ouverture is not None:
+            return ouverture[0]
+        self._mettre_a_jour()
+        return len(self.candidats)
+
+    def meilleure_lettre(self):
+        """
+        Retourne la lettre non proposée qui apporte le plus d'information.
+
+        Le gain d'une lettre est l'entropie de la répartition des candidats
+        selon la réponse (absente, ou présente à telles positions). Au-delà
+        de SEUIL_POSITIONS candidats, seule la présence compte : le gain
+        vaut alors au plus 1 bit et sous-estime celui des positions.
+
+        Returns:
+            tuple: (lettre, gain en bits), ou (None, 0.0) s'il n'y a plus de candidat
+        """
+        ouverture = self._ouverture()
+        if ouverture is not None and ouverture[0] > SEUIL_POSITIONS:
+            # Premier indice : présences précalculées dans l'index
+            total, presences, _, _ = ouverture
+        else:
+            self._mettre_a_jour()
+            total = len(self.candidats)
+            presences = None
+        if total == 0:
+            return None, 0.0
+        deja_proposees = self.lettres_correctes | self.lettres_incorrectes
+
+        if total == 1:
+            # Mot trouvé : on propose une de ses lettres encore cachées
+            mot = self.candidats[0][1]
+            for caractere, motif in zip(mot, self.motif):
+                if motif == "_":
+                    return caractere, 0.0
+            return None, 0.0
+
+        if total > SEUIL_POSITIONS:
+            # Beaucoup de candidats : présence ou absence des lettres seulement
+            if presences is None:
+                # Lettres différentes de chaque mot, comptées en une passe
+                compteur = Counter(itertools.chain.from_iterable(
+                    set(mot) for _, mot in self.candidats))
+                presences = [compteur[lettre] for lettre in ALPHABET]
+            repartitions = {lettre: [presences[rang], total - presences[rang]]
+                            for rang, lettre in enumerate(ALPHABET)}
+        else:
+            # Répartition selon les positions exactes de chaque lettre
+            groupes = {lettre: {} for lettre in ALPHABET}
+            for _, mot in self.candidats:
+                positions = {}
+                for rang, caractere in enumerate(mot):
+                    if caractere in groupes:
+                        positions.setdefault(caractere, []).append(rang)
+                for lettre, rangs in positions.items():
+                    cle = tuple(rangs)
+                    groupes[lettre][cle] = groupes[lettre].get(cle, 0) + 1
+            repartitions = {}
+            for lettre, groupe in groupes.items():
+                presents = sum(groupe.values())
+                repartitions[lettre] = list(groupe.values()) + [total - presents]
+
+        meilleure, meilleur_gain = None, -1.0
+        for lettre in ALPHABET:
+            if lettre in deja_proposees:
+                continue
+            gain = -sum(nombre / total * math.log2(nombre / total)
+                        for nombre in repartitions[lettre] if nombre)
+            if gain > meilleur_gain:
+                meilleure, meilleur_gain = lettre, gain
+        return meilleure, max(meilleur_gain, 0.0)
@@ -0,0 +1,261 @@
+"""
+Module de stockage des statistiques du pendu dans une base SQLite.
+
+La base (statistiques_pendu.db) contient :
+- joueurs : un joueur par nom, avec ses totaux (parties, victoires,
+  erreurs, meilleur score, mot le plus long, nombre de mots trouvés)
+- parties : l'historique de chaque partie (joueur, mot, résultat, erreurs)
+- propositions : les lettres proposées pendant chaque partie, dans l'ordre
+- mots_trouves : les mots différents trouvés par chaque joueur
+
+Les totaux d'un joueur sont mis à jour dans la même transaction que
+l'ajout de la partie : afficher les statistiques ne relit jamais
+l'historique, même avec des millions de parties. Les questions sur
+l'historique (classement, statistiques d'un mot) passent par des index.
+
+La base est en mode WAL : une écriture ne bloque pas les lectures.
+"""
+
+import sqlite3
+
+# Nom du joueur quand aucun n'est choisi
+JOUEUR_PAR_DEFAUT = "Joueur"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS joueurs (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL UNIQUE,
+    parties INTEGER NOT NULL DEFAULT 0,
+    victoires INTEGER NOT NULL DEFAULT 0,
+    total_erreurs INTEGER NOT NULL DEFAULT 0,
+    meilleur_score INTEGER NOT NULL DEFAULT 0,
+    mot_le_plus_long TEXT NOT NULL DEFAULT '',
+    nb_mots_trouves INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS joueurs_classement ON joueurs (victoires DESC, parties);
+
+CREATE TABLE IF NOT EXISTS parties (
+    id INTEGER PRIMARY KEY,
+    joueur_id INTEGER NOT NULL REFERENCES joueurs (id),
+    mot TEXT NOT NULL,
+    victoire INTEGER NOT NULL,
+    erreurs INTEGER NOT NULL,
+    date TEXT NOT NULL DEFAULT (datetime('now'))
+);
+CREATE INDEX IF NOT EXISTS parties_joueur ON parties (joueur_id);
+CREATE INDEX IF NOT EXISTS parties_mot ON parties (mot);
+
+CREATE TABLE IF NOT EXISTS propositions (
+    partie_id INTEGER NOT NULL REFERENCES parties (id),
+    rang INTEGER NOT NULL,
+    lettre TEXT NOT NULL,
+    correcte INTEGER NOT NULL,
+    PRIMARY KEY (partie_id, rang)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS mots_trouves (
+    joueur_id INTEGER NOT NULL REFERENCES joueurs (id),
+    mot TEXT NOT NULL,
+    PRIMARY KEY (joueur_id, mot)
+) WITHOUT ROWID;
+"""
+
+# Mise à jour des totaux d'un joueur après une partie
+# (même règles que DataManager.appliquer_partie)
+MISE_A_JOUR_JOUEUR = """
+UPDATE joueurs SET
+    parties = parties + 1,
+    victoires = victoires + :victoire,
+    total_erreurs = total_erreurs + :erreurs,
+    meilleur_score = CASE
+        WHEN :victoire AND (meilleur_score = 0 OR :erreurs < meilleur_score)
+        THEN :erreurs ELSE meilleur_score END,
+    mot_le_plus_long = CASE
+        WHEN :victoire AND length(:mot) > length(mot_le_plus_long)
+        THEN :mot ELSE mot_le_plus_long END,
+    nb_mots_trouves = nb_mots_trouves + :nouveau_mot
+WHERE id = :joueur_id
+"""
+
+
+class StatsStore:
+    """
+    Statistiques de plusieurs joueurs dans une base SQLite.
+    """
+
+    def __init__(self, fichier_base):
+        """
+        Ouvre (ou crée) la base des statistiques.
+
+        Args:
+            fichier_base (str): Chemin du fichier SQLite
+
+        Raises:
+            sqlite3.Error: Si la base ne peut pas être ouverte
+        """
+        self.connexion = sqlite3.connect(fichier_base)
+        self.connexion.row_factory = sqlite3.Row
+        self.connexion.execute("PRAGMA journal_mode = WAL")
+        # En WAL, NORMAL reste cohérent après un arrêt brutal
+        self.connexion.execute("PRAGMA synchronous = NORMAL")
+        self.connexion.execute("PRAGMA foreign_keys = ON")
+        self.connexion.executescript(SCHEMA)
+        self.ids_joueurs = {}  # Nom -> id (évite une requête par partie)
+
+    def obtenir_joueur(self, nom):
+        """
+        Retourne l'identifiant d'un joueur, en le créant s'il n'existe pas.
+
+        Args:
+            nom (str): Nom du joueur
+
+        Returns:
+            int: Identifiant du joueur
+        """
+        if nom not in self.ids_joueurs:
+            with self.connexion:
+                self.connexion.execute(
+                    "INSERT OR IGNORE INTO joueurs (nom) VALUES (?)", (nom,))
+            self.ids_joueurs[nom] = self.connexion.execute(
+                "SELECT id FROM joueurs WHERE nom = ?", (nom,)).fetchone()["id"]
+        return self.ids_joueurs[nom]
+
+    def enregistrer_partie(self, nom, mot, victoire, erreurs, propositions=()):
+        """
+        Enregistre une partie et met à jour les totaux du joueur
+        (une seule transaction).
+
+        Args:
+            nom (str): Nom du joueur
+            mot (str): Le mot qui était à deviner
+            victoire (bool): True si le joueur a gagné
+            erreurs (int): Nombre d'erreurs commises
+            propositions (list): (lettre, correcte) dans l'ordre des propositions
+        """
+        self.enregistrer_parties([(nom, mot, victoire, erreurs, propositions)])
+
+    def enregistrer_parties(self, parties):
+        """
+        Enregistre plusieurs parties dans une seule transaction : si une
+        partie échoue, aucune n'est enregistrée.
+
+        Args:
+            parties (list): Tuples (nom, mot, victoire, erreurs, propositions)
+                au format de enregistrer_partie
+        """
+        # Joueurs créés avant la transaction (obtenir_joueur valide la sienne)
+        ids_joueurs = [self.obtenir_joueur(nom) for nom, _, _, _, _ in parties]
+        with self.connexion:
+            for joueur_id, (_, mot, victoire, erreurs, propositions) in zip(ids_joueurs, parties):
+                partie_id = self.connexion.execute(
+                    "INSERT INTO parties (joueur_id, mot, victoire, erreurs) VALUES (?, ?, ?, ?)",
+                    (joueur_id, mot, int(victoire), erreurs)).lastrowid
+                self.connexion.executemany(
+                    "INSERT INTO propositions (partie_id, rang, lettre, correcte) VALUES (?, ?, ?, ?)",
+                    [(partie_id, rang, lettre, int(correcte))
+                     for rang, (lettre, correcte) in enumerate(propositions)])
+
+                nouveau_mot = 0
+                if victoire:
+                    nouveau_mot = self.connexion.execute(
+                        "INSERT OR IGNORE INTO mots_trouves (joueur_id, mot) VALUES (?, ?)",
+                        (joueur_id, mot)).rowcount
+                self.connexion.execute(MISE_A_JOUR_JOUEUR, {
+                    "joueur_id": joueur_id, "mot": mot, "victoire": int(victoire),
+                    "erreurs": erreurs, "nouveau_mot": nouveau_mot})
+
+    def importer(self, nom, statistiques):
+        """
+        Reprend les statistiques d'un ancien fichier JSON, seulement si
+        aucune partie n'a encore été jouée dans la base (l'historique
+        détaillé n'existe pas dans le JSON, seuls les totaux sont repris).
+
+        Args:
+            nom (str): Nom du joueur
+            statistiques (dict): Statistiques au format de DataManager
+
+        Returns:
+            bool: True si les statistiques ont été importées
+        """
+        joueur_id = self.obtenir_joueur(nom)
+        with self.connexion:
+            deja_jouee = self.connexion.execute(
+                "SELECT 1 FROM joueurs WHERE parties > 0 LIMIT 1").fetchone()
+            if deja_jouee or not statistiques.get("parties_jouees"):
+                return False
+            self.connexion.executemany(
+                "INSERT OR IGNORE INTO mots_trouves (joueur_id, mot) VALUES (?, ?)",
+                [(joueur_id, mot) for mot in statistiques.get("mots_trouves", ())])
+            self.connexion.execute(
+                """UPDATE joueurs SET parties = ?, victoires = ?, total_erreurs = ?,
+                       meilleur_score = ?, mot_le_plus_long = ?,
+                       nb_mots_trouves = (SELECT count(*) FROM mots_trouves WHERE joueur_id = ?)
+                   WHERE id = ?""",
+                (statistiques["parties_jouees"], statistiques["parties_gagnees"],
+                 statistiques["total_erreurs"], statistiques["meilleur_score"],
+                 statistiques["mot_le_plus_long"], joueur_id, joueur_id))
+        return True
+
+    def statistiques(self, nom):
+        """
+        Retourne les statistiques d'un joueur (une ligne de la table joueurs).
+
+        Args:
+            nom (str): Nom du joueur
+
+        Returns:
+            dict: Statistiques au format de DataManager, avec nb_mots_trouves
+                à la place de la liste mots_trouves
+        """
+        ligne = self.connexion.execute(
+            "SELECT * FROM joueurs WHERE id = ?", (self.obtenir_joueur(nom),)).fetchone()
+        parties = ligne["parties"]
+        return {
+            "parties_jouees": parties,
+            "parties_gagnees": ligne["victoires"],
+            "parties_perdues": parties - ligne["victoires"],
+            "pourcentage_victoire": round(ligne["victoires"] / parties * 100, 1) if parties else 0,
+            "mot_le_plus_long": ligne["mot_le_plus_long"],
+            "meilleur_score": ligne["meilleur_score"],
+            "total_erreurs": ligne["total_erreurs"],
+            "nb_mots_trouves": ligne["nb_mots_trouves"]
+        }
+
+    def classement(self, limite=10):
+        """
+        Retourne les meilleurs joueurs (le plus de victoires d'abord).
+
+        Args:
+            limite (int): Nombre de joueurs retournés
+
+        Returns:
+            list: Tuples (nom, victoires, parties, erreurs moyennes)
+        """
+        lignes = self.connexion.execute(
+            """SELECT nom, victoires, parties, total_erreurs FROM joueurs
+               WHERE parties > 0 ORDER BY victoires DESC, parties LIMIT ?""",
+            (limite,))
+        return [(ligne["nom"], ligne["victoires"], ligne["parties"],
+                 round(ligne["total_erreurs"] / ligne["parties"], 1))
+                for ligne in lignes]
+
+    def statistiques_mot(self, mot):
+        """
+        Retourne les résultats de tous les joueurs sur un mot.
+
+        Args:
+            mot (str): Le mot (forme originale)
+
+        Returns:
+            dict: Nombre de parties, de victoires et erreurs moyennes
+        """
+        ligne = self.connexion.execute(
+            """SELECT count(*) AS parties, coalesce(sum(victoire), 0) AS victoires,
+                      coalesce(avg(erreurs), 0) AS erreurs
+               FROM parties WHERE mot = ?""", (mot,)).fetchone()
+        return {"parties": ligne["parties"], "victoires": ligne["victoires"],
+                "erreurs_moyennes": round(ligne["erreurs"], 1)}
+
+    def fermer(self):
+        """Ferme la base"""
+        self.connexion.close()
@@ -11,13 +11,16 @@ Fonctionnalités :
 """
 
 import tkinter as tk
-from tkinter import messagebox, font
+from tkinter import messagebox, simpledialog, font
 from PIL import Image, ImageTk
 import os
+import queue
 import threading
 import time
+from collections import OrderedDict
 from game_logic import GameManager
 from data_manager import DataManager
+from frame_cache import FrameCache
 
 
 # =============================================================================
@@ -73,19 +76,58 @@ class CouleursHybride:
 class AnimationPlayer:
     """
     Classe pour gérer la lecture des animations du pendu.
-    SYSTÈME SIMPLE : Une seule animation à la fois, pas de file d'attente.
+    Une seule animation à la fois, avec une file pour les animations d'erreur.
+
+    Toute la lecture se fait dans la boucle d'événements de Tk : un seul
+    after() est programmé à la fois, pour la prochaine image à afficher ou
+    le prochain démarrage d'animation en attente. Une animation figée sur
+    sa dernière image ne programme plus rien.
     """
 
+    # Délais entre deux images (ms)
+    INITIAL_FRAME_DELAY = 300   # Animation initiale en boucle
+    ERROR_FRAME_DELAY = 400     # Animations d'erreur
+    VICTORY_FRAME_DELAY = 500   # Animation de victoire (plus lente pour être visible)
+
+    # Nombre maximum d'animations gardées en mémoire : les moins récemment
+    # utilisées sont libérées et rechargées depuis le cache disque si besoin
+    MAX_ANIMATIONS = 8
+
     def __init__(self, label_widget):
         self.label = label_widget
         self.images = []
         self.current_frame = 0
         self.is_playing = False
-        self.animation_thread = None
         self.current_animation_level = 0  # Niveau d'animation actuel (0-6)
-        self.all_animations = {}  # Stocke toutes les animations chargées
+
+        # Ligne de temps de l'animation affichée
+        self.frame_delay = self.INITIAL_FRAME_DELAY  # Délai entre deux images (ms)
+        self.loop = False                 # Recommence au début à la fin
+        self.next_frame_time = 0.0        # Heure (time.monotonic) de la prochaine image
+        self.on_finished = None           # Appelée à la fin d'une animation sans boucle
+        self.timer_id = None              # Unique after() programmé
+
+        # File des animations d'erreur : (niveau, délai avant le début en s)
+        self.animation_queue = []
+        self.pending_start = None         # (heure de début, niveau) de la prochaine
+        self.victory_animation_played = False
+        # Animations chargées, de la moins à la plus récemment utilisée
+        self.all_animations = OrderedDict()
         # Bloque les nouvelles animations d'erreur
         self.is_error_animation_playing = False
+        # Images redimensionnées enregistrées sur disque (voir frame_cache.py)
+        self.frame_cache = FrameCache(CouleursHybride.ANIMATION_SIZE)
+        self.animation_paths = {}  # Niveau -> chemins des images sources
+        self.animation_names = {}  # Niveau -> nom du dossier d'animation
+
+        # Chargement en arrière-plan : le thread ne fait que le travail PIL,
+        # les PhotoImage sont créées dans le thread de Tk
+        self.load_queue = queue.PriorityQueue()  # (priorité, numéro, niveau) à charger
+        self.loaded_frames = queue.Queue()       # (niveau, images PIL) prêtes
+        self.pending_levels = {}                 # Niveau demandé -> priorité
+        self.load_counter = 0                    # Départage les priorités égales
+        self.loader_thread = None
+        self.is_receiving = False                # Réception programmée avec after()
 
     def get_optimal_size(self, force_recalculate=False):
         """
@@ -101,49 +143,115 @@ class AnimationPlayer:
         return CouleursHybride.ANIMATION_SIZE
 
     def load_all_animations(self, game_manager):
-        """Charge toutes les animations au démarrage."""
-        self.all_animations = {}
-
-        # Calcule la taille optimale
-        optimal_size = self.get_optimal_size()
+        """
+        Prépare les animations au démarrage.
+        Le niveau 0 est chargé tout de suite et lancé, les autres niveaux
+        sont chargés en arrière-plan dans l'ordre où ils seront utiles.
+        """
+        self.all_animations = OrderedDict()
 
-        # Charge les animations d'erreurs (0 à 6)
-        for level in range(7):  # 0 à 6 erreurs
-            images = []
-            # Récupère les images pour ce niveau d'erreur
-            image_paths = game_manager.animation_manager.lister_images_animation(
+        # Chemins des images de chaque niveau d'erreur (0 à 6) et de la victoire
+        self.animation_paths = {}
+        self.animation_names = {}
+        for level in range(7):
+            self.animation_paths[level] = game_manager.animation_manager.lister_images_animation(
                 level)
+            self.animation_names[level] = os.path.basename(
+                game_manager.animation_manager.obtenir_chemin_animation(level))
+        self.animation_paths["victoire"] = game_manager.animation_manager.lister_images_animation_victoire()
+        self.animation_names["victoire"] = os.path.basename(
+            game_manager.animation_manager.obtenir_animation_victoire())
+
+        # Lance l'animation initiale (niveau 0) en boucle dès qu'elle est prête
+        self.load_level(0)
+        self.start_initial_animation()
 
-            for path in image_paths:
-                try:
-                    img = Image.open(path)
-                    img = img.resize(optimal_size, Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    images.append(photo)
-                except Exception as e:
-                    print(f"Erreur lors du chargement de {path}: {e}")
+        # Première erreur d'abord, puis la victoire, puis les erreurs suivantes
+        for priority, level in enumerate([1, "victoire", 2, 3, 4, 5, 6]):
+            self.request_level(level, priority + 1)
 
-            self.all_animations[level] = images
+    def load_level(self, level):
+        """
+        Charge un niveau d'animation tout de suite (dans le thread de Tk)
+        s'il n'est pas déjà en mémoire. Avec le cache disque, cela ne prend
+        que quelques millisecondes.
 
-        # Charge l'animation de victoire (niveau spécial "victoire")
-        victory_images = []
-        victory_paths = game_manager.animation_manager.lister_images_animation_victoire()
+        Args:
+            level: Niveau d'erreur (0 à 6) ou "victoire"
+        """
+        if level in self.all_animations:
+            self.all_animations.move_to_end(level)
+            return
+        if level not in self.animation_paths:
+            return
+        self.pending_levels.pop(level, None)
+        self._store_level(level, self.frame_cache.charger(
+            self.animation_names[level], self.animation_paths[level]))
 
-        for path in victory_paths:
+    def request_level(self, level, priority):
+        """
+        Demande le chargement d'un niveau en arrière-plan.
+
+        Args:
+            level: Niveau d'erreur (0 à 6) ou "victoire"
+            priority (int): Priorité (0 = le plus urgent)
+        """
+        if level in self.all_animations or level not in self.animation_paths:
+            return
+        # Déjà demandé avec une priorité au moins aussi forte
+        if self.pending_levels.get(level, priority + 1) <= priority:
+            return
+        self.pending_levels[level] = priority
+        self.load_counter += 1
+        self.load_queue.put((priority, self.load_counter, level))
+
+        if self.loader_thread is None:
+            self.loader_thread = threading.Thread(
+                target=self._loader_loop, daemon=True)
+            self.loader_thread.start()
+        if not self.is_receiving:
+            self.is_receiving = True
+            self.label.after(50, self._receive_loaded_frames)
+
+    def _loader_loop(self):
+        """Charge les niveaux demandés (exécutée dans un thread séparé, PIL seulement)."""
+        while True:
+            _, _, level = self.load_queue.get()
+            # Niveau déjà reçu (demandé deux fois ou chargé directement)
+            if level not in self.pending_levels:
+                continue
+            frames = self.frame_cache.charger(
+                self.animation_names[level], self.animation_paths[level])
+            self.loaded_frames.put((level, frames))
+
+    def _receive_loaded_frames(self):
+        """Récupère les niveaux chargés par le thread (appelée par after())."""
+        while True:
             try:
-                img = Image.open(path)
-                img = img.resize(optimal_size, Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                victory_images.append(photo)
-            except Exception as e:
-                print(
-                    f"Erreur lors du chargement de l'animation de victoire {path}: {e}")
+                level, frames = self.loaded_frames.get_nowait()
+            except queue.Empty:
+                break
+            if level in self.pending_levels:
+                del self.pending_levels[level]
+                self._store_level(level, frames)
+
+        if self.pending_levels:
+            self.label.after(50, self._receive_loaded_frames)
+        else:
+            self.is_receiving = False
 
-        self.all_animations["victoire"] = victory_images
-        print(f"Animation de victoire chargée : {len(victory_images)} images")
+    def _store_level(self, level, frames):
+        """Crée les PhotoImage d'un niveau et libère les plus anciens au-delà de MAX_ANIMATIONS."""
+        self.all_animations[level] = [ImageTk.PhotoImage(frame) for frame in frames]
+        if level == "victoire":
+            print(f"Animation de victoire chargée : {len(frames)} images")
 
-        # Lance l'animation initiale (niveau 0) en boucle
-        self.start_initial_animation()
+        # Le niveau 0 et l'animation affichée ne sont jamais libérés
+        for old_level in list(self.all_animations):
+            if len(self.all_animations) <= self.MAX_ANIMATIONS:
+                break
+            if old_level not in (0, level, self.current_animation_level):
+                del self.all_animations[old_level]
 
     def load_animation(self, image_paths):
         """Charge une animation à partir d'une liste de chemins d'images (méthode de compatibilité)."""
@@ -167,19 +275,12 @@ class AnimationPlayer:
         """Lance l'animation initiale (niveau 0) en boucle continue."""
         # Remet à zéro et vide la file
         self.is_error_animation_playing = False
-        if hasattr(self, 'animation_queue'):
-            self.animation_queue.clear()
+        self.animation_queue.clear()
+        self.pending_start = None
 
         if 0 in self.all_animations and self.all_animations[0]:
             self.current_animation_level = 0
-            self.images = self.all_animations[0]
-            self.stop_animation()
-            self.is_playing = True
-            self.animation_thread = threading.Thread(
-                target=self._animate_loop_continuous,
-                daemon=True
-            )
-            self.animation_thread.start()
+            self._play(self.all_animations[0], self.INITIAL_FRAME_DELAY, loop=True)
 
     def continue_current_animation(self):
         """Continue l'animation actuelle si ce n'est pas une animation d'erreur figée."""
@@ -190,12 +291,13 @@ class AnimationPlayer:
 
     def play_victory_animation(self):
         """Lance l'animation de victoire une seule fois."""
+        self.load_level("victoire")
         if "victoire" not in self.all_animations or not self.all_animations["victoire"]:
             print("Animation de victoire non disponible")
             return
 
         # Vérifie si l'animation de victoire est déjà en cours
-        if hasattr(self, 'victory_animation_played') and self.victory_animation_played:
+        if self.victory_animation_played:
             print("Animation de victoire déjà jouée - ignorée")
             return
 
@@ -204,67 +306,30 @@ class AnimationPlayer:
         # Marque que l'animation de victoire va être jouée
         self.victory_animation_played = True
 
-        # Arrête toute animation en cours
-        self.stop_animation()
-        self.is_error_animation_playing = False
-
         # Vide la file d'attente des animations d'erreur
-        if hasattr(self, 'animation_queue'):
-            self.animation_queue.clear()
+        self.is_error_animation_playing = False
+        self.animation_queue.clear()
+        self.pending_start = None
 
-        # Configure l'animation de victoire
+        # Joue l'animation de victoire une seule fois et reste sur la dernière image
         self.current_animation_level = "victoire"
-        self.images = self.all_animations["victoire"]
-        self.is_playing = True
-
-        # Lance l'animation de victoire en une seule fois (pas en boucle)
-        self.animation_thread = threading.Thread(
-            target=self._animate_victory_once,
-            daemon=True
-        )
-        self.animation_thread.start()
-
-    def _animate_victory_once(self):
-        """Animation de victoire qui se joue une seule fois."""
-        if not self.images:
-            print("Pas d'images pour l'animation de victoire")
-            return
-
-        print(f"Début animation de victoire : {len(self.images)} images")
-
-        for i, img in enumerate(self.images):
-            if not self.is_playing:
-                print("Animation de victoire interrompue")
-                break
-
-            print(f"Frame victoire {i+1}/{len(self.images)}")
-            # Met à jour l'image dans le thread principal
-            self.label.after(0, self._update_image, img)
-
-            # Délai entre les frames (plus lent pour la victoire)
-            time.sleep(0.5)  # 500ms entre chaque frame pour plus de visibilité
-
-        print("Animation de victoire terminée - ARRÊT")
-
-        # Arrête explicitement l'animation
-        self.is_playing = False
-
-        # Reste sur la dernière image de victoire
-        if self.images:
-            self.label.after(0, self._update_image, self.images[-1])
-            print("Affichage de la dernière image de victoire")
+        self._play(self.all_animations["victoire"], self.VICTORY_FRAME_DELAY,
+                   loop=False,
+                   on_finished=lambda: print("Animation de victoire terminée"))
 
     def play_error_animation(self, error_level, delay_before_start=2.0):
         """Ajoute l'animation à la file d'attente - N'exécute JAMAIS directement."""
-        if error_level not in self.all_animations:
+        if error_level not in self.animation_paths:
             return
 
+        # Chargement pendant le délai avant l'animation, et du niveau suivant
+        self.request_level(error_level, 0)
+        if isinstance(error_level, int):
+            self.request_level(error_level + 1, 1)
+
         print(f"Ajout animation niveau {error_level} à la file")
 
         # Ajoute TOUJOURS à la file, même si une animation est en cours
-        if not hasattr(self, 'animation_queue'):
-            self.animation_queue = []
-
         self.animation_queue.append((error_level, delay_before_start))
 
         # Démarre le traitement de la file si elle n'est pas en cours
@@ -272,7 +337,7 @@ class AnimationPlayer:
             self._process_next_animation()
 
     def _process_next_animation(self):
-        """Traite la prochaine animation dans la file."""
+        """Programme le début de la prochaine animation de la file."""
         if not self.animation_queue or self.is_error_animation_playing:
             return
 
@@ -281,218 +346,117 @@ class AnimationPlayer:
         print(
             f"Traitement animation niveau {error_level} (reste {len(self.animation_queue)} en file)")
 
-        # Marque qu'une animation est en cours
+        # Marque qu'une animation est en cours ; l'animation affichée
+        # continue jusqu'au début de la suivante
         self.is_error_animation_playing = True
-
-        # Programme l'animation avec délai
-        self.label.after(int(delay_before_start * 1000),
-                         lambda: self._start_error_animation(error_level))
+        self.pending_start = (time.monotonic() + delay_before_start, error_level)
+        self._schedule()
 
     def _start_error_animation(self, error_level):
         """Démarre une animation d'erreur spécifique."""
         print(f"Début animation niveau {error_level}")
 
-        if error_level in self.all_animations:
+        # Pas encore reçu du thread : chargement direct
+        self.load_level(error_level)
+        if self.all_animations.get(error_level):
             self.current_animation_level = error_level
-            self.images = self.all_animations[error_level]
-
-            if self.images:
-                # Arrête l'animation en cours
-                self.stop_animation()
-
-                # Démarre l'animation frame par frame
-                self._animate_error_frames(0)
-
-    def _animate_error_frames(self, frame_index):
-        """Anime les frames d'erreur une par une."""
-        if frame_index >= len(self.images):
-            # Animation terminée
-            print(f"Animation niveau {self.current_animation_level} terminée")
-            self.is_error_animation_playing = False
-
-            # Traite la prochaine animation dans la file
-            self.label.after(100, self._process_next_animation)
-            return
-
-        # Affiche la frame actuelle
-        img = self.images[frame_index]
-        self.label.config(image=img)
-        self.label.image = img
-
-        # Programme la prochaine frame
-        self.label.after(
-            400, lambda: self._animate_error_frames(frame_index + 1))
-
-    def _play_single_error_animation(self, error_level, delay_before_start):
-        """Joue UNE SEULE animation d'erreur de manière complète."""
-        try:
-            # Arrête l'animation initiale
-            self.stop_animation()
-
-            # Attend le délai
-            print(f"Attente {delay_before_start} secondes...")
-            time.sleep(delay_before_start)
-
-            # Change le niveau et les images
-            self.current_animation_level = error_level
-            self.images = self.all_animations[error_level]
-
-            if self.images:
-                print(
-                    f"Début animation {error_level} ({len(self.images)} frames)")
-
-                # Joue chaque frame
-                for i, img in enumerate(self.images):
-                    if not self.is_error_animation_playing:
-                        break
-
-                    # Met à jour l'image de manière thread-safe
-                    self.label.after(
-                        0, lambda image=img: self._update_image_safe(image))
-                    time.sleep(0.6)  # Délai entre frames
-
-                # Reste sur la dernière image
-                if self.images and self.is_error_animation_playing:
-                    final_img = self.images[-1]
-                    self.label.after(
-                        0, lambda: self._update_image_safe(final_img))
-
-                print(f"Animation {error_level} terminée")
-
-        except Exception as e:
-            print(f"Erreur animation {error_level}: {e}")
-
-        finally:
-            # Libère le verrou
-            self.is_error_animation_playing = False
-
-    def _update_image_safe(self, image):
-        """Met à jour l'image de manière thread-safe."""
-        try:
-            if self.label.winfo_exists():
-                self.label.config(image=image)
-                self.label.image = image
-        except Exception as e:
-            print(f"Erreur mise à jour image: {e}")
-
-    def _delayed_error_animation(self, error_level, delay_before_start):
-        """DEPRECATED - Attend le délai puis lance l'animation d'erreur."""
-        time.sleep(delay_before_start)
-
-        if error_level in self.all_animations:
-            self.current_animation_level = error_level
-            self.images = self.all_animations[error_level]
-
-            if self.images:
-                self.is_playing = True
-                # Joue l'animation une fois puis reste sur la dernière image
-                self._animate_once_and_stop(0.6)  # Animation plus lente
-
-    def _animate_loop_continuous(self):
-        """Boucle d'animation continue (pour l'animation initiale)."""
-        while self.is_playing and self.images:
-            for img in self.images:
-                if not self.is_playing:
-                    break
-                self.label.after(0, self._update_image, img)
-                time.sleep(0.3)  # Vitesse normale pour l'animation continue
-
-    def _animate_once_and_stop(self, delay):
-        """Joue l'animation une fois et reste sur la dernière image."""
-        if not self.images:
-            return
-
-        for i, img in enumerate(self.images):
-            if not self.is_playing:
-                break
-            self.label.after(0, self._update_image, img)
-            time.sleep(delay)
-
-        # Reste sur la dernière image
-        if self.images:
-            self.label.after(0, self._update_image, self.images[-1])
-
-        self.is_playing = False
-
-    def _animate_once_and_stop_sync(self, delay):
-        """Joue l'animation une fois et reste sur la dernière image (version synchrone)."""
-        if not self.images:
-            return
-
-        for i, img in enumerate(self.images):
-            if not self.is_playing:
-                break
-            # Utilise after_idle pour s'assurer que l'image est mise à jour
-            self.label.after_idle(lambda img=img: self._update_image(img))
-            # Force la mise à jour de l'affichage
-            self.label.update_idletasks()
-            time.sleep(delay)
-
-        # Reste sur la dernière image
-        if self.images:
-            self.label.after_idle(lambda: self._update_image(self.images[-1]))
-            self.label.update_idletasks()
+            self._play(self.all_animations[error_level], self.ERROR_FRAME_DELAY,
+                       loop=False, on_finished=self._error_animation_finished)
+        else:
+            self._error_animation_finished()
 
-        self.is_playing = False
+    def _error_animation_finished(self):
+        """Fin d'une animation d'erreur : reste sur la dernière image et passe à la suivante."""
+        print(f"Animation niveau {self.current_animation_level} terminée")
+        self.is_error_animation_playing = False
+        self._process_next_animation()
 
     def play_animation(self, loop=False, delay=0.5):
         """Lance la lecture de l'animation (version simplifiée, une seule fois par défaut)."""
         if not self.images or self.is_playing:
             return
-
-        self.is_playing = True
-        self.animation_thread = threading.Thread(
-            target=self._animate_loop,
-            args=(loop, delay),
-            daemon=True
-        )
-        self.animation_thread.start()
-
-    def _animate_once(self, delay):
-        """Joue l'animation une seule fois."""
-        if not self.images:
-            return
-
-        for i, img in enumerate(self.images):
-            if not self.is_playing:
-                break
-
-            # Met à jour l'image dans le thread principal
-            self.label.after(0, self._update_image, img)
-            time.sleep(delay)
-
-        self.is_playing = False
+        self._play(self.images, int(delay * 1000), loop)
 
     def stop_animation(self):
         """Arrête la lecture de l'animation."""
         self.is_playing = False
+        self._schedule()
 
-    def _animate_loop(self, loop, delay):
-        """Boucle d'animation (exécutée dans un thread séparé)."""
-        if not loop:
-            # Si pas de boucle, joue une seule fois
-            self._animate_once(delay)
-            return
-
-        while self.is_playing and self.images:
-            for i, img in enumerate(self.images):
-                if not self.is_playing:
-                    break
-
-                # Met à jour l'image dans le thread principal
-                self.label.after(0, self._update_image, img)
-                time.sleep(delay)
-
-            if not loop:
-                break
+    def _play(self, images, delay, loop, on_finished=None):
+        """
+        Remplace la ligne de temps par une nouvelle animation et affiche sa première image.
 
-        self.is_playing = False
+        Args:
+            images (list): Images (PhotoImage) de l'animation
+            delay (int): Délai entre deux images (ms)
+            loop (bool): True pour jouer en boucle
+            on_finished (callable): Appelée à la fin si l'animation ne boucle pas
+        """
+        self.images = images
+        self.frame_delay = delay
+        self.loop = loop
+        self.on_finished = on_finished
+        self.current_frame = 0
+        self.is_playing = bool(images)
+        if images:
+            self._update_image(images[0])
+            self.next_frame_time = time.monotonic() + delay / 1000
+        self._schedule()
+
+    def _schedule(self):
+        """Programme l'unique after() pour la prochaine échéance (image ou début d'animation)."""
+        if self.timer_id is not None:
+            self.label.after_cancel(self.timer_id)
+            self.timer_id = None
+
+        deadlines = []
+        if self.is_playing:
+            deadlines.append(self.next_frame_time)
+        if self.pending_start is not None:
+            deadlines.append(self.pending_start[0])
+        if deadlines:
+            delay = max(0, int((min(deadlines) - time.monotonic()) * 1000))
+            self.timer_id = self.label.after(delay, self._tick)
+
+    def _tick(self):
+        """Avance la ligne de temps (appelée par after() dans le thread de Tk)."""
+        self.timer_id = None
+        now = time.monotonic()
+
+        if self.pending_start is not None and now >= self.pending_start[0]:
+            _, error_level = self.pending_start
+            self.pending_start = None
+            self._start_error_animation(error_level)
+        elif self.is_playing and now >= self.next_frame_time:
+            self._advance_frame(now)
+        self._schedule()
+
+    def _advance_frame(self, now):
+        """Affiche l'image suivante, ou termine l'animation."""
+        self.current_frame += 1
+        if self.current_frame >= len(self.images):
+            if not self.loop:
+                # Reste sur la dernière image
+                self.current_frame = len(self.images) - 1
+                self.is_playing = False
+                on_finished, self.on_finished = self.on_finished, None
+                if on_finished:
+                    on_finished()
+                return
+            self.current_frame = 0
+
+        self._update_image(self.images[self.current_frame])
+        # Pas de rattrapage si Tk a pris du retard : on repart de maintenant
+        self.next_frame_time = max(self.next_frame_time + self.frame_delay / 1000, now)
 
     def _update_image(self, image):
         """Met à jour l'image (appelé dans le thread principal)."""
-        if self.label.winfo_exists():
-            self.label.config(image=image)
-            self.label.image = image
+        try:
+            if self.label.winfo_exists():
+                self.label.config(image=image)
+                self.label.image = image
+        except tk.TclError as e:
+            print(f"Erreur mise à jour image: {e}")
 
 
 class PenduHybrideUI(tk.Tk):
@@ -503,9 +467,10 @@ class PenduHybrideUI(tk.Tk):
     def __init__(self):
         super().__init__()
 
-        # Initialisation des gestionnaires
+        # Initialisation des gestionnaires (un seul DataManager partagé :
+        # les statistiques affichées sont celles que le jeu enregistre)
         self.data_manager = DataManager()
-        self.game_manager = GameManager()
+        self.game_manager = GameManager(self.data_manager)
         self.saisie_active = True
 
         # Variables pour l'animation
@@ -689,15 +654,16 @@ class PenduHybrideUI(tk.Tk):
         stats_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5), pady=0)
         stats_frame.grid_rowconfigure(1, weight=1)
         stats_frame.grid_columnconfigure(0, weight=1)
+        stats_frame.grid_columnconfigure(1, weight=1)
 
-        stats_title = tk.Label(
+        self.stats_title = tk.Label(
             stats_frame,
             text=">>> STATISTIQUES <<<",
             font=CouleursHybride.POLICE_MATRIX,
             bg=CouleursHybride.VERT_SOMBRE,
             fg=CouleursHybride.VERT_CLAIR
         )
-        stats_title.grid(row=0, column=0, pady=5)
+        self.stats_title.grid(row=0, column=0, columnspan=2, pady=5)
 
         self.label_stats = tk.Label(
             stats_frame,
@@ -709,6 +675,18 @@ class PenduHybrideUI(tk.Tk):
         )
         self.label_stats.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
 
+        # Classement des joueurs, à côté des statistiques du joueur
+        self.label_classement = tk.Label(
+            stats_frame,
+            text="",
+            font=CouleursHybride.POLICE_STATS_MATRIX,
+            bg=CouleursHybride.VERT_SOMBRE,
+            fg=CouleursHybride.VERT_MATRIX,
+            justify=tk.LEFT,
+            anchor="n"
+        )
+        self.label_classement.grid(row=1, column=1, sticky="nsew", padx=10, pady=10)
+
         # ANIMATION (Style Matrix) - 1/3 de l'espace
         animation_frame = tk.Frame(
             stats_main_frame,
@@ -780,6 +758,20 @@ class PenduHybrideUI(tk.Tk):
         )
         btn_nouvelle.grid(row=0, column=2, padx=5, pady=10)
 
+        btn_joueur = tk.Button(
+            saisie_frame,
+            text="Joueur",
+            font=CouleursHybride.POLICE_WIN95_BOUTON,
+            bg=CouleursHybride.GRIS_WIN95,
+            fg=CouleursHybride.NOIR_WIN95,
+            activebackground=CouleursHybride.GRIS_CLAIR_WIN95,
+            command=self.changer_joueur,
+            relief=tk.RAISED,
+            borderwidth=2,
+            width=12
+        )
+        btn_joueur.grid(row=0, column=3, padx=5, pady=10)
+
         btn_quitter = tk.Button(
             saisie_frame,
             text="Quitter",
@@ -792,12 +784,11 @@ class PenduHybrideUI(tk.Tk):
             borderwidth=2,
             width=12
         )
-        btn_quitter.grid(row=0, column=3, padx=5, pady=10)
+        btn_quitter.grid(row=0, column=4, padx=5, pady=10)
 
     def charger_donnees(self):
-        """Charge les données et statistiques."""
+        """Affiche les statistiques (déjà chargées par le GameManager)."""
         try:
-            self.data_manager.charger_stats()
             self.mettre_a_jour_statistiques()
         except Exception as e:
             print(f"Erreur lors du chargement des données : {e}")
@@ -820,6 +811,30 @@ class PenduHybrideUI(tk.Tk):
                 self.animation_player.victory_animation_played = False
                 self.animation_player.start_initial_animation()
 
+    def changer_joueur(self):
+        """Demande le nom du joueur et commence une partie pour lui."""
+        nom = simpledialog.askstring(
+            "JOUEUR", "NOM DU JOUEUR :",
+            initialvalue=self.data_manager.joueur, parent=self)
+        if nom is None:
+            self.entry_lettre.focus_set()
+            return
+        nom = self.data_manager.changer_joueur(nom)
+        # La partie en cours n'est pas comptée au nouveau joueur
+        self.nouvelle_partie()
+        self.mettre_a_jour_statistiques()
+        self.afficher_message(f"JOUEUR : {nom}", "info")
+
+    def message_fin_partie(self, debut):
+        """Complète le message de fin avec les résultats de tous les joueurs sur le mot."""
+        info = self.game_manager.obtenir_info_jeu()
+        message = f"{debut} LE MOT ÉTAIT : {info['mot_original']}"
+        resultats = self.data_manager.obtenir_statistiques_mot(info['mot_original'])
+        if resultats and resultats["parties"] > 1:
+            message += (f"\nCE MOT : {resultats['victoires']}/{resultats['parties']} "
+                        f"VICTOIRE(S), {resultats['erreurs_moyennes']} ERREUR(S) EN MOYENNE")
+        return message
+
     def on_key_press(self, event):
         """Gestionnaire d'événement pour les touches pressées."""
         if not self.saisie_active:
@@ -919,6 +934,10 @@ class PenduHybrideUI(tk.Tk):
             stats_text = stats_text.replace("📊", ">>").replace(
                 "🎯", ">>").replace("⚡", ">>")
             self.label_stats.config(text=stats_text)
+            self.stats_title.config(
+                text=f">>> STATISTIQUES : {self.data_manager.joueur.upper()[:20]} <<<")
+            self.label_classement.config(
+                text=self.data_manager.obtenir_classement_formate().replace("🏆", ">>"))
         except Exception as e:
             self.label_stats.config(text=f"ERREUR STATS: {e}")
 
@@ -945,9 +964,7 @@ class PenduHybrideUI(tk.Tk):
         self.saisie_active = False
         self.game_manager.terminer_partie()
 
-        info = self.game_manager.obtenir_info_jeu()
-        message = f"VICTOIRE ! LE MOT ÉTAIT : {info['mot_original']}"
-        self.afficher_message(message, "succes")
+        self.afficher_message(self.message_fin_partie("VICTOIRE !"), "succes")
 
         # Lance l'animation de victoire
         if self.animation_player:
@@ -961,9 +978,7 @@ class PenduHybrideUI(tk.Tk):
         self.saisie_active = False
         self.game_manager.terminer_partie()
 
-        info = self.game_manager.obtenir_info_jeu()
-        message = f"DÉFAITE ! LE MOT ÉTAIT : {info['mot_original']}"
-        self.afficher_message(message, "erreur")
+        self.afficher_message(self.message_fin_partie("DÉFAITE !"), "erreur")
 
         # Met à jour les statistiques
         self.mettre_a_jour_statistiques()
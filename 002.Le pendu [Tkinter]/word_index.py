@@ -0,0 +1,234 @@
+"""
+Module de l'index de difficulté des mots du pendu.
+
+Pour chaque mot normalisé, l'index garde :
+- un masque de 26 bits des lettres présentes (bit 0 = A, bit 25 = Z)
+- un score de difficulté selon la rareté de ses lettres
+- sa place dans une table des mots triés par longueur puis par score
+
+Pour chaque longueur, l'index garde aussi les mots sans tiret ni
+apostrophe (les seuls possibles quand le motif n'a que des lettres) :
+- le nombre de ces mots et le nombre de ceux qui contiennent chaque lettre,
+  pour calculer le premier indice d'une partie sans relire un seul mot
+- leurs positions et leurs formes normalisées, dans l'ordre de la table
+  triée, à la suite dans un bloc de texte (une ligne par mot) : le moteur
+  d'indices y cherche les mots compatibles avec une seule expression
+  régulière au lieu de relire et comparer chaque mot
+
+Les mots d'une même longueur sont donc contigus et rangés du plus facile
+au plus difficile : choisir un mot de 8 lettres "difficile" revient à tirer
+une position au hasard dans une tranche de la table, sans parcourir la liste.
+"""
+
+import math
+from array import array
+
+# Niveaux de difficulté : chaque niveau correspond à une tranche des mots
+# d'une longueur donnée, triés par score
+DIFFICULTES = ("facile", "moyen", "difficile")
+
+# Tirages aléatoires tentés avant de filtrer toute la tranche (lettres exclues)
+NB_ESSAIS_TIRAGE = 64
+
+
+def compter_lettres(mot_normalise):
+    """
+    Compte les lettres d'un mot normalisé (les tirets et apostrophes ne comptent pas).
+
+    Args:
+        mot_normalise (str): Mot en majuscules sans accents
+
+    Returns:
+        int: Nombre de lettres
+    """
+    return sum(1 for lettre in mot_normalise if 'A' <= lettre <= 'Z')
+
+
+def masque_lettres(texte):
+    """
+    Calcule le masque de bits des lettres présentes dans un texte normalisé.
+
+    Exemple : "ABA" donne 0b11 (A et B présents)
+
+    Args:
+        texte (str): Texte en majuscules sans accents
+
+    Returns:
+        int: Masque de 26 bits
+    """
+    masque = 0
+    for lettre in texte:
+        if 'A' <= lettre <= 'Z':
+            masque |= 1 << (ord(lettre) - 65)
+    return masque
+
+
+def calculer_index(mots_normalises):
+    """
+    Calcule les tableaux de l'index à partir des mots normalisés.
+
+    Args:
+        mots_normalises (list): Mots en majuscules sans accents
+
+    Returns:
+        tuple: (masques, scores, ordre, longueurs, ouvertures) où longueurs
+            associe chaque longueur à la tranche (debut, fin) de ordre, et
+            ouvertures chaque longueur à (nombre de mots sans tiret ni
+            apostrophe, nombre de ces mots contenant chaque lettre, leurs
+            positions, bloc de leurs formes normalisées)
+    """
+    masques = array('I', (masque_lettres(mot) for mot in mots_normalises))
+    nb_lettres = [compter_lettres(mot) for mot in mots_normalises]
+
+    # Rareté d'une lettre : -log2 de la part des mots qui la contiennent
+    raretes = []
+    for bit in range(26):
+        nb_mots = sum(1 for masque in masques if masque >> bit & 1)
+        part = nb_mots / len(masques) if nb_mots else 1 / (len(masques) + 1)
+        raretes.append(-math.log2(part))
+
+    # Score : rareté moyenne des lettres différentes du mot
+    scores = array('f')
+    for masque in masques:
+        lettres = [raretes[bit] for bit in range(26) if masque >> bit & 1]
+        scores.append(sum(lettres) / len(lettres) if lettres else 0.0)
+
+    ordre = array('I', sorted(range(len(masques)),
+                              key=lambda index: (nb_lettres[index], scores[index])))
+    longueurs = {}
+    for position, index in enumerate(ordre):
+        debut, _ = longueurs.get(nb_lettres[index], (position, position))
+        longueurs[nb_lettres[index]] = (debut, position + 1)
+
+    # Ouvertures : seulement les mots faits uniquement de lettres (un tiret
+    # ou une apostrophe est visible dès le début), dans l'ordre de la table
+    ouvertures = {}
+    for longueur, (debut, fin) in longueurs.items():
+        presences = array('I', bytes(4 * 26))
+        indices = array('I')
+        for position in range(debut, fin):
+            index = ordre[position]
+            if len(mots_normalises[index]) != longueur:
+                continue
+            indices.append(index)
+            for bit in range(26):
+                if masques[index] >> bit & 1:
+                    presences[bit] += 1
+        bloc = "".join(mots_normalises[index] + "\n" for index in indices).encode('ascii')
+        ouvertures[longueur] = (len(indices), presences, indices, bloc)
+    return masques, scores, ordre, longueurs, ouvertures
+
+
+class WordIndex:
+    """
+    Index des mots par longueur, lettres et difficulté.
+    Les positions retournées sont celles des mots dans DataManager.mots.
+    """
+
+    def __init__(self, masques, scores, ordre, longueurs, ouvertures):
+        """
+        Initialise l'index à partir de tableaux déjà calculés
+        (par calculer_index ou lus dans mots.idx).
+
+        Args:
+            masques (array): Masque des lettres de chaque mot
+            scores (array): Score de difficulté de chaque mot
+            ordre (array): Positions des mots triées par longueur puis score
+            longueurs (dict): Longueur -> tranche (debut, fin) de ordre
+            ouvertures (dict): Longueur -> (nombre de mots sans tiret ni
+                apostrophe, array des 26 nombres de mots contenant chaque
+                lettre, array de leurs positions, bloc de leurs formes
+                normalisées en ASCII, une par ligne)
+        """
+        self.masques = masques
+        self.scores = scores
+        self.ordre = ordre
+        self.longueurs = longueurs
+        self.ouvertures = ouvertures
+
+    @classmethod
+    def construire(cls, mots_normalises):
+        """
+        Construit l'index en mémoire (utilisé quand mots.idx n'est pas disponible).
+
+        Args:
+            mots_normalises (list): Mots en majuscules sans accents
+
+        Returns:
+            WordIndex: L'index construit
+        """
+        return cls(*calculer_index(mots_normalises))
+
+    def tranches(self, longueur_min=None, longueur_max=None, difficulte=None):
+        """
+        Retourne les tranches de la table triée qui respectent les critères.
+
+        Args:
+            longueur_min (int): Nombre de lettres minimum (None = pas de limite)
+            longueur_max (int): Nombre de lettres maximum (None = pas de limite)
+            difficulte (str): Un des DIFFICULTES, ou None pour tous les mots
+
+        Returns:
+            list: Liste de tranches (debut, fin)
+        """
+        if difficulte is not None and difficulte not in DIFFICULTES:
+            raise ValueError(f"Difficulté inconnue : {difficulte}")
+
+        tranches = []
+        for longueur, (debut, fin) in self.longueurs.items():
+            if longueur_min is not None and longueur < longueur_min:
+                continue
+            if longueur_max is not None and longueur > longueur_max:
+                continue
+            if difficulte is not None:
+                # Les mots de la tranche sont triés du plus facile au plus difficile
+                niveau = DIFFICULTES.index(difficulte)
+                taille = fin - debut
+                debut, fin = (debut + taille * niveau // len(DIFFICULTES),
+                              debut + taille * (niveau + 1) // len(DIFFICULTES))
+            if fin > debut:
+                tranches.append((debut, fin))
+        return tranches
+
+    def choisir(self, generateur, longueur_min=None, longueur_max=None,
+                difficulte=None, lettres_exclues=""):
+        """
+        Tire au hasard un mot respectant les critères.
+
+        Args:
+            generateur (random.Random): Générateur de nombres aléatoires
+            longueur_min (int): Nombre de lettres minimum
+            longueur_max (int): Nombre de lettres maximum
+            difficulte (str): Un des DIFFICULTES, ou None
+            lettres_exclues (str): Lettres (normalisées) qui ne doivent pas apparaître
+
+        Returns:
+            int: Position du mot dans la liste des mots, ou None si aucun mot ne convient
+        """
+        tranches = self.tranches(longueur_min, longueur_max, difficulte)
+        total = sum(fin - debut for debut, fin in tranches)
+        if total == 0:
+            return None
+        masque_exclu = masque_lettres(lettres_exclues)
+
+        # Tirage uniforme sur l'ensemble des tranches, puis rejet si une
+        # lettre exclue est présente (rarement plus de quelques essais)
+        for _ in range(NB_ESSAIS_TIRAGE):
+            index = self._position(tranches, generateur.randrange(total))
+            if not self.masques[index] & masque_exclu:
+                return index
+
+        # Critères très restrictifs : filtrage complet des tranches
+        candidats = [self.ordre[position]
+                     for debut, fin in tranches
+                     for position in range(debut, fin)
+                     if not self.masques[self.ordre[position]] & masque_exclu]
+        return generateur.choice(candidats) if candidats else None
+
+    def _position(self, tranches, rang):
+        """Retourne le mot de rang donné dans la suite des tranches"""
+        for debut, fin in tranches:
+            if rang < fin - debut:
+                return self.ordre[debut + rang]
+            rang -= fin - debut
+        raise IndexError("rang hors des tranches")
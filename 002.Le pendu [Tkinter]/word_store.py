@@ -0,0 +1,343 @@
+"""
+Module de l'index binaire des mots du jeu du pendu.
+
+Au lieu de relire mots.json (1,7 Mo) à chaque lancement, les mots sont
+compilés une fois dans un fichier binaire compact (mots.idx) :
+- un en-tête (signature, version, nombre de mots, taille et date de mots.json)
+- une table des positions (un entier de 4 octets par mot)
+- pour chaque mot : le mot original puis sa forme normalisée
+  (normaliser_texte), chacun précédé de sa longueur en octets (UTF-8)
+- l'index de difficulté (voir word_index.py) : tranches par longueur et
+  leurs statistiques d'ouverture, masques des lettres, scores et table
+  des mots triés, puis pour chaque longueur les positions et le bloc de
+  texte des mots sans tiret ni apostrophe
+
+Le fichier est projeté en mémoire (mmap) : un mot n'est décodé que quand
+on le demande, sans créer 109 000 chaînes Python au démarrage.
+
+Usage :
+    python word_store.py              # Construit mots.idx
+    python word_store.py --benchmark  # Compare avec le chargement JSON
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import tracemalloc
+from array import array
+from word_index import WordIndex, calculer_index
+
+# Signature, version, nombre de mots, taille et date (ns) de mots.json,
+# position de l'index de difficulté
+EN_TETE = struct.Struct("<4sHIQQQ")
+SIGNATURE = b"PNDU"
+VERSION = 3
+POSITION = struct.Struct("<I")
+LONGUEUR = struct.Struct("<H")
+# Index de difficulté : nombre de longueurs, puis (longueur, début, fin)
+# suivi des statistiques d'ouverture (nombre de mots, mots par lettre)
+NB_TRANCHES = struct.Struct("<H")
+TRANCHE = struct.Struct("<HII")
+OUVERTURE = struct.Struct("<I26I")
+
+
+def tableau_en_octets(tableau):
+    """Octets d'un tableau array en petit-boutiste (format du fichier)"""
+    if sys.byteorder == "big":
+        tableau = array(tableau.typecode, tableau)
+        tableau.byteswap()
+    return tableau.tobytes()
+
+
+def tableau_depuis_octets(typecode, octets):
+    """Relit un tableau array écrit par tableau_en_octets"""
+    tableau = array(typecode)
+    tableau.frombytes(octets)
+    if sys.byteorder == "big":
+        tableau.byteswap()
+    return tableau
+
+
+def construire_index(fichier_mots, fichier_index):
+    """
+    Compile la liste des mots JSON en index binaire.
+
+    Args:
+        fichier_mots (str): Chemin du fichier JSON des mots
+        fichier_index (str): Chemin du fichier binaire à écrire
+
+    Returns:
+        int: Nombre de mots écrits
+    """
+    # Import local : data_manager importe lui-même ce module
+    from data_manager import normaliser_texte
+
+    with open(fichier_mots, 'r', encoding='utf-8') as fichier:
+        data = json.load(fichier)
+
+    # Même formats acceptés que DataManager.charger_mots
+    mots = data['mots'] if isinstance(data, dict) else data
+
+    positions = []
+    blocs = []
+    normalises = []
+    position = 0
+    for mot in mots:
+        normalises.append(normaliser_texte(mot))
+        original = mot.encode('utf-8')
+        normalise = normalises[-1].encode('utf-8')
+        bloc = (LONGUEUR.pack(len(original)) + original +
+                LONGUEUR.pack(len(normalise)) + normalise)
+        positions.append(position)
+        blocs.append(bloc)
+        position += len(bloc)
+    positions.append(position)  # Fin du dernier mot
+
+    masques, scores, ordre, longueurs, ouvertures = calculer_index(normalises)
+    sections = [NB_TRANCHES.pack(len(longueurs))]
+    for longueur, (debut, fin) in sorted(longueurs.items()):
+        nombre, presences, _, _ = ouvertures[longueur]
+        sections.append(TRANCHE.pack(longueur, debut, fin) +
+                        OUVERTURE.pack(nombre, *presences))
+    sections.extend(tableau_en_octets(tableau)
+                    for tableau in (masques, scores, ordre))
+    for longueur in sorted(longueurs):
+        _, _, indices, bloc = ouvertures[longueur]
+        sections.append(tableau_en_octets(indices) + bloc)
+
+    stat = os.stat(fichier_mots)
+    debut_index = (EN_TETE.size + len(positions) * POSITION.size +
+                   position)
+    # Écriture dans un fichier temporaire pour ne jamais laisser un index tronqué
+    fichier_temporaire = fichier_index + ".tmp"
+    with open(fichier_temporaire, 'wb') as fichier:
+        fichier.write(EN_TETE.pack(SIGNATURE, VERSION, len(mots),
+                                   stat.st_size, stat.st_mtime_ns, debut_index))
+        fichier.write(struct.pack(f"<{len(positions)}I", *positions))
+        fichier.write(b"".join(blocs))
+        fichier.write(b"".join(sections))
+    os.replace(fichier_temporaire, fichier_index)
+    return len(mots)
+
+
+class WordStore:
+    """
+    Liste de mots en lecture seule lue directement dans l'index binaire.
+
+    S'utilise comme une liste : len(store), store[i] (mot original),
+    random.choice(store). mot_normalise(i) donne la forme normalisée
+    précalculée.
+    """
+
+    def __init__(self, fichier_index, fichier_mots=None):
+        """
+        Ouvre l'index binaire.
+
+        Args:
+            fichier_index (str): Chemin du fichier mots.idx
+            fichier_mots (str): Fichier JSON source ; s'il est fourni, l'index
+                doit correspondre à sa taille et à sa date de modification
+
+        Raises:
+            ValueError: Si l'index est invalide ou périmé
+        """
+        with open(fichier_index, 'rb') as fichier:
+            self._donnees = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._donnees) < EN_TETE.size:
+            self.fermer()
+            raise ValueError("Index des mots tronqué")
+        signature, version, self._nombre, taille, date, self._debut_index = \
+            EN_TETE.unpack_from(self._donnees, 0)
+        if signature != SIGNATURE or version != VERSION:
+            self.fermer()
+            raise ValueError("Index des mots invalide")
+
+        if fichier_mots is not None:
+            stat = os.stat(fichier_mots)
+            if (taille, date) != (stat.st_size, stat.st_mtime_ns):
+                self.fermer()
+                raise ValueError("Index des mots périmé")
+
+        self._debut_positions = EN_TETE.size
+        self._debut_mots = self._debut_positions + (self._nombre + 1) * POSITION.size
+
+    def __len__(self):
+        return self._nombre
+
+    def _position_mot(self, index):
+        """Retourne la position dans le fichier du mot numéro index"""
+        if index < 0:
+            index += self._nombre
+        if not 0 <= index < self._nombre:
+            raise IndexError("index de mot hors limites")
+        return self._debut_mots + POSITION.unpack_from(
+            self._donnees, self._debut_positions + index * POSITION.size)[0]
+
+    def _lire_texte(self, position):
+        """Retourne (texte, position suivante) du texte écrit à position"""
+        longueur = LONGUEUR.unpack_from(self._donnees, position)[0]
+        position += LONGUEUR.size
+        return self._donnees[position:position + longueur].decode('utf-8'), position + longueur
+
+    def _lire_mots(self, index):
+        """Retourne (mot original, mot normalisé) du mot numéro index"""
+        original, position = self._lire_texte(self._position_mot(index))
+        return original, self._lire_texte(position)[0]
+
+    def __getitem__(self, index):
+        return self._lire_mots(index)[0]
+
+    def mot_normalise(self, index):
+        """
+        Retourne la forme normalisée (majuscules, sans accents) d'un mot.
+
+        Args:
+            index (int): Numéro du mot
+
+        Returns:
+            str: Le mot normalisé
+        """
+        # Le mot original est sauté sans être décodé (appelée pour chaque
+        # candidat par le moteur d'indices)
+        position = self._position_mot(index)
+        position += LONGUEUR.size + LONGUEUR.unpack_from(self._donnees, position)[0]
+        return self._lire_texte(position)[0]
+
+    def lire_index(self):
+        """
+        Lit l'index de difficulté précalculé (voir word_index.py).
+
+        Returns:
+            WordIndex: L'index des mots par longueur, lettres et difficulté
+        """
+        position = self._debut_index
+        nb_tranches = NB_TRANCHES.unpack_from(self._donnees, position)[0]
+        position += NB_TRANCHES.size
+        longueurs = {}
+        ouvertures = {}
+        for _ in range(nb_tranches):
+            longueur, debut, fin = TRANCHE.unpack_from(self._donnees, position)
+            longueurs[longueur] = (debut, fin)
+            position += TRANCHE.size
+            nombre, *presences = OUVERTURE.unpack_from(self._donnees, position)
+            ouvertures[longueur] = (nombre, array('I', presences))
+            position += OUVERTURE.size
+
+        tableaux = []
+        for typecode in ('I', 'f', 'I'):
+            taille = self._nombre * array(typecode).itemsize
+            tableaux.append(tableau_depuis_octets(
+                typecode, self._donnees[position:position + taille]))
+            position += taille
+
+        # Positions et bloc de texte des mots sans tiret ni apostrophe
+        for longueur in sorted(ouvertures):
+            nombre, presences = ouvertures[longueur]
+            taille = nombre * array('I').itemsize
+            indices = tableau_depuis_octets(
+                'I', self._donnees[position:position + taille])
+            position += taille
+            taille = nombre * (longueur + 1)
+            ouvertures[longueur] = (nombre, presences, indices,
+                                    self._donnees[position:position + taille])
+            position += taille
+        return WordIndex(*tableaux, longueurs, ouvertures)
+
+    def fermer(self):
+        """Ferme la projection mémoire"""
+        self._donnees.close()
+
+
+def memoire_residente():
+    """
+    Retourne la mémoire résidente (RSS) du processus.
+    Contrairement à tracemalloc, elle compte les pages du fichier projeté
+    (mmap) qui ont été lues.
+
+    Returns:
+        int: Mémoire résidente en octets, ou None hors Linux (/proc absent)
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def mesurer_chargement(methode, fichier_mots, fichier_index, nb_tirages):
+    """
+    Charge les mots avec une méthode puis lit nb_tirages mots au hasard.
+    Appelée dans un processus neuf : la mémoire libérée par une mesure
+    précédente ne fausse pas la suivante.
+
+    Args:
+        methode (str): "json" ou "index"
+        fichier_mots (str): Chemin du fichier JSON des mots
+        fichier_index (str): Chemin du fichier binaire
+        nb_tirages (int): Nombre de mots lus après l'ouverture
+
+    Returns:
+        tuple: (durée en secondes, allocations du tas Python en octets,
+            mémoire résidente ajoutée en octets ou None)
+    """
+    import random
+    from data_manager import normaliser_texte
+
+    residente_avant = memoire_residente()
+    tracemalloc.start()
+    debut = time.perf_counter()
+    if methode == "json":
+        with open(fichier_mots, 'r', encoding='utf-8') as fichier:
+            mots = json.load(fichier)
+        for _ in range(nb_tirages):
+            normaliser_texte(random.choice(mots))
+    else:
+        store = WordStore(fichier_index, fichier_mots)
+        for _ in range(nb_tirages):
+            store.mot_normalise(random.randrange(len(store)))
+    duree = time.perf_counter() - debut
+    tas_python = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    residente_apres = memoire_residente()
+
+    residente = None
+    if residente_avant is not None and residente_apres is not None:
+        residente = residente_apres - residente_avant
+    return duree, tas_python, residente
+
+
+def comparer_chargements(fichier_mots, fichier_index, nb_tirages=1000):
+    """
+    Compare le temps de démarrage et la mémoire du chargement JSON
+    et de l'index binaire. Deux mesures de mémoire : les allocations du
+    tas Python (tracemalloc, sans les pages du mmap) et la mémoire
+    résidente ajoutée (pages du mmap comprises, Linux uniquement).
+
+    Args:
+        fichier_mots (str): Chemin du fichier JSON des mots
+        fichier_index (str): Chemin du fichier binaire
+        nb_tirages (int): Nombre de mots lus après l'ouverture
+    """
+    import multiprocessing
+
+    for nom, methode in (("JSON ", "json"), ("Index", "index")):
+        with multiprocessing.Pool(1) as pool:
+            duree, tas_python, residente = pool.apply(
+                mesurer_chargement, (methode, fichier_mots, fichier_index, nb_tirages))
+        texte_residente = "n/d" if residente is None else f"{residente / 1024:.0f} Ko"
+        print(f"{nom} : {duree * 1000:.1f} ms, tas Python {tas_python / 1024:.0f} Ko, "
+              f"mémoire résidente {texte_residente}")
+
+
+if __name__ == "__main__":
+    # Les fichiers sont à côté du script
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    nombre = construire_index("mots.json", "mots.idx")
+    print(f"✓ Index construit : {nombre} mots dans mots.idx "
+          f"({os.path.getsize('mots.idx') / 1024:.0f} Ko)")
+    if "--benchmark" in sys.argv:
+        comparer_chargements("mots.json", "mots.idx")